@@ -1,3 +1,14 @@
-from .channel_deviation_view import run_app
+__all__ = ["ReactorSimulator", "run_app"]
 
-__all__ = ["run_app"]
+
+def __getattr__(name):
+    # Loaded on first use so the CLI utilities start without tkinter or NumPy
+    if name == "run_app":
+        from .channel_deviation_view import run_app
+
+        return run_app
+    if name == "ReactorSimulator":
+        from .simulator import ReactorSimulator
+
+        return ReactorSimulator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
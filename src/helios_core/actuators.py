@@ -0,0 +1,73 @@
+"""Tick-driven actuator ramps.
+
+Pumps, pressurizer, coolant temperature and rod drives move towards their
+targets at a fixed rate per simulated second. ``ActuatorScheduler`` holds at
+most one ``Ramp`` per actuator key and advances them all from
+``ReactorSimulator.step``; starting a ramp on a busy actuator replaces the
+one in flight, so repeated commands never fight over the same target.
+"""
+
+
+class Ramp:
+    """One actuator moving towards ``target`` at ``rate`` units per second"""
+
+    __slots__ = ("key", "get", "set", "target", "rate", "on_done", "done")
+
+    def __init__(self, key, get, set, target, rate, on_done=None):
+        self.key = key
+        self.get = get          # () -> current value
+        self.set = set          # (value) -> None
+        self.target = target
+        self.rate = abs(rate)
+        self.on_done = on_done  # called once the target is reached
+        self.done = False       # reached, replaced or cancelled
+
+    def advance(self, dt):
+        """Move one step; returns True once the target is reached"""
+        value = self.get()
+        delta = self.target - value
+        max_step = self.rate * dt
+        if abs(delta) <= max_step:
+            self.set(self.target)
+            return True
+        self.set(value + (max_step if delta > 0 else -max_step))
+        return False
+
+
+class ActuatorScheduler:
+    """Active ramps keyed by actuator, advanced once per physics tick"""
+
+    def __init__(self):
+        self.ramps = {}  # actuator key -> Ramp
+
+    def ramp(self, key, get, set, target, rate, on_done=None):
+        """Start moving ``key`` towards ``target``, replacing any ramp in flight"""
+        self.cancel(key)
+        ramp = Ramp(key, get, set, target, rate, on_done)
+        self.ramps[key] = ramp
+        return ramp
+
+    def busy(self, key):
+        return key in self.ramps
+
+    def cancel(self, key):
+        ramp = self.ramps.pop(key, None)
+        if ramp is not None:
+            ramp.done = True
+
+    def cancel_all(self):
+        for key in list(self.ramps):
+            self.cancel(key)
+
+    def advance(self, dt):
+        """Advance every ramp by ``dt`` seconds; returns True if anything moved"""
+        if not self.ramps:
+            return False
+        finished = [ramp for ramp in self.ramps.values() if ramp.advance(dt)]
+        for ramp in finished:
+            del self.ramps[ramp.key]
+            ramp.done = True
+        for ramp in finished:
+            if ramp.on_done is not None:
+                ramp.on_done()
+        return True
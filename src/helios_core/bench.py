@@ -0,0 +1,167 @@
+"""Benchmarks for the simulation and render hot paths.
+
+Run with ``helios-core bench``. Each benchmark is timed on the shipped
+13x13 ``GRID_LETTERS`` core and on synthetic circular cores up to full
+RBMK scale (~1,700 channels), and the results are emitted as JSON so they
+can be compared between releases.
+"""
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from .gauges import FLUX_RAMP, TEMP_RAMP, lookup
+from .reactor_data import GRID_LETTERS
+from .simulator import ReactorSimulator
+from .state import ReactorCoreState
+
+DEFAULT_SIZES = (13, 25, 35, 47)  # grid diameters; 47 gives ~1,700 channels
+
+
+def synthetic_grid(size):
+    """Circular ``size`` x ``size`` core in the style of ``GRID_LETTERS``.
+
+    A reflector ring and graphite band surround a fuel lattice with manual
+    control rods every fourth channel, auto rods and temperature sensors
+    sprinkled between them.
+    """
+    if size == len(GRID_LETTERS):
+        return [list(row) for row in GRID_LETTERS]
+
+    centre = (size - 1) / 2
+    radius = size / 2
+    grid = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            dist = ((r - centre) ** 2 + (c - centre) ** 2) ** 0.5
+            if dist > radius:
+                row.append("P")
+            elif dist > radius - 1:
+                row.append("R")
+            elif dist > radius - 3:
+                row.append("G")
+            elif r % 10 == 5 and c % 10 == 5:
+                row.append("T")
+            elif r % 8 == 2 and c % 8 == 2:
+                row.append("A")
+            elif r % 4 == 0 and c % 4 == 0:
+                row.append("C")
+            else:
+                row.append("F")
+        grid.append(row)
+    return grid
+
+
+def make_simulator(grid, backend="auto"):
+    """A simulator on ``grid`` brought to a running, mid-power state"""
+    sim = ReactorSimulator(ReactorCoreState.from_grid(grid), backend=backend, seed=0)
+    for rod_num, letter in sim.rod_to_letter.items():
+        if letter == "T":
+            sim.temperatures[rod_num] = 550.0
+    for rod_num in sim.control_rod_levels:
+        sim.control_rod_levels[rod_num] = 50
+    sim.pump_flow.update({1: 120.0, 2: 120.0})
+    sim.pump_status.update({1: True, 2: True})
+    sim.pressure = 155.0
+    sim.running = True
+    for _ in range(5):
+        sim.step(1.0)
+    return sim
+
+
+def time_call(fn, min_time=0.2, repeat=5):
+    """Per-call seconds of ``fn`` over ``repeat`` batches of at least ``min_time``"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat or number >= 1 << 20:
+            break
+        number *= 2
+
+    runs = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        runs.append((time.perf_counter() - start) / number)
+    return {
+        "calls": number,
+        "min_us": min(runs) * 1e6,
+        "median_us": statistics.median(runs) * 1e6,
+    }
+
+
+def benchmarks(sim):
+    """name -> zero-argument callable exercising one hot path of ``sim``"""
+    rods = list(sim.rod_to_letter)
+    control_rod = next(num for num, letter in sim.rod_to_letter.items() if letter == "C")
+
+    def rod_temperatures():
+        for rod_num in rods:
+            sim.calculate_rod_temperature(rod_num)
+
+    def gauge_colours():
+        # The per-rod colour work of one grid redraw
+        for rod_num in rods:
+            lookup(TEMP_RAMP, (sim.calculate_rod_temperature(rod_num) - 250) / 450)
+            lookup(FLUX_RAMP, sim.neutron_flux.get(rod_num, 0.0) / 3.0)
+
+    def apply_command():
+        sim.core.apply_command(f"set {control_rod} 50")
+        sim.core.apply_command("set * 50")
+
+    return {
+        "flux": sim.calculate_neutron_flux,
+        "rod_temperature": rod_temperatures,
+        "alerts": sim.update_alerts,
+        "arccs": sim.arccs_control,
+        "rod_problems": sim.check_rod_problems,
+        "apply_command": apply_command,
+        "gauge_colours": gauge_colours,
+        "tick": lambda: sim.step(1.0),
+    }
+
+
+def run(sizes=DEFAULT_SIZES, backend="auto", min_time=0.2, repeat=5, only=None):
+    """Run the suite and return a JSON-serializable report"""
+    layouts = []
+    for size in sizes:
+        sim = make_simulator(synthetic_grid(size), backend)
+        results = {}
+        for name, fn in benchmarks(sim).items():
+            if only and name not in only:
+                continue
+            results[name] = time_call(fn, min_time, repeat)
+        layouts.append({
+            "size": size,
+            "channels": len(sim.rod_to_letter),
+            "fuel_rods": len(sim.fuel_levels),
+            "control_rods": len(sim.control_rod_levels),
+            "results": results,
+        })
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": sim.kernel.name,
+        "layouts": layouts,
+    }
+
+
+def main(sizes=DEFAULT_SIZES, backend="auto", output=None, min_time=0.2, repeat=5, only=None):
+    report = run(sizes, backend, min_time, repeat, only)
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Wrote {output}", file=sys.stderr)
+    else:
+        print(text)
+    return report
@@ -1,10 +1,79 @@
 import argparse
-from importlib.resources import files
 
-from .channel_deviation_view import run_app
 from .reactor_utils import estimate_output, reactor_stats, render_ascii_map, rod_type_table
 
 
+def speed_arg(value):
+    """argparse type for ``--speed``: a positive multiplier or ``max``"""
+    if value.lower() in ("max", "fast"):
+        return "max"
+    try:
+        speed = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid speed: {value!r} (use a number or 'max')")
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive")
+    return speed
+
+
+def add_layout_argument(parser):
+    parser.add_argument(
+        "--layout",
+        metavar="FILE",
+        help="Core layout file (text grid or JSON) instead of the built-in 13x13 core",
+    )
+
+
+def add_record_arguments(parser):
+    parser.add_argument("--record", metavar="FILE", help="Record telemetry frames to this ring file")
+    parser.add_argument("--record-capacity", type=positive_int, default=36000,
+                        help="Frames kept in the ring file before the oldest are overwritten")
+
+
+def add_feed_arguments(parser):
+    parser.add_argument("--feed", nargs="?", const="", metavar="SOCKET",
+                        help="Publish the telemetry feed on a Unix socket (default path if SOCKET is omitted)")
+    parser.add_argument("--feed-tcp", type=int, metavar="PORT", help="Also publish the feed on localhost:PORT")
+
+
+def feed_path(args):
+    """The --feed socket, with the default path for a bare --feed"""
+    path = getattr(args, "feed", None)
+    if path == "":
+        from .feed import default_feed_path
+
+        return default_feed_path()
+    return path
+
+
+def add_physics_process_argument(parser):
+    parser.add_argument("--physics-process", action="store_true",
+                        help="Run the physics in a separate process so display load cannot delay it")
+
+
+def add_units_argument(parser):
+    parser.add_argument("--units", type=positive_int, default=1, metavar="N",
+                        help="Simulate a fleet of N independent units in one process and switch between them")
+
+
+def check_units(parser, args):
+    """A fleet runs only fresh, local units"""
+    if args.units == 1:
+        return
+    for option in ("load", "record", "serve", "serve_tcp", "feed", "feed_tcp"):
+        if getattr(args, option, None) is not None:
+            parser.error(f"--units cannot be combined with --{option.replace('_', '-')}")
+    if args.physics_process:
+        parser.error("--units cannot be combined with --physics-process")
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
 def build_parser():
     parser = argparse.ArgumentParser(
         prog="helios-core",
@@ -12,7 +81,48 @@ def build_parser():
     )
     subparsers = parser.add_subparsers(dest="command")
 
-    subparsers.add_parser("gui", help="Launch the reactor control station GUI")
+    gui_parser = subparsers.add_parser("gui", help="Launch the reactor control station GUI")
+    gui_parser.add_argument(
+        "--renderer",
+        choices=("widgets", "canvas"),
+        default="widgets",
+        help="Core map renderer: one widget per channel or a single shared canvas",
+    )
+    gui_parser.add_argument(
+        "--speed",
+        type=speed_arg,
+        default=1.0,
+        help="Simulation speed: 1 for real time, e.g. 100 for 100x, or 'max'",
+    )
+    gui_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each tick phase and Tk callback lag (also HELIOS_PROFILE=1)",
+    )
+    add_layout_argument(gui_parser)
+    gui_parser.add_argument("--seed", type=int, help="Seed the simulator noise for a reproducible session")
+    add_record_arguments(gui_parser)
+    gui_parser.add_argument("--load", metavar="FILE", help="Resume from a snapshot saved with 'save <file>'")
+    gui_parser.add_argument("--serve", nargs="?", const="", metavar="SOCKET",
+                            help="Accept commands on a Unix socket (default path if SOCKET is omitted)")
+    gui_parser.add_argument("--serve-tcp", type=int, metavar="PORT", help="Also accept commands on localhost:PORT")
+    add_feed_arguments(gui_parser)
+    add_physics_process_argument(gui_parser)
+    add_units_argument(gui_parser)
+
+    tui_parser = subparsers.add_parser("tui", help="Launch the terminal control station (works over SSH)")
+    tui_parser.add_argument("--speed", type=speed_arg, default=1.0,
+                            help="Simulation speed: 1 for real time, e.g. 100 for 100x, or 'max'")
+    tui_parser.add_argument("--seed", type=int, help="Seed the simulator noise for a reproducible session")
+    tui_parser.add_argument("--load", metavar="FILE", help="Resume from a snapshot saved with 'save <file>'")
+    tui_parser.add_argument("--serve", nargs="?", const="", metavar="SOCKET",
+                            help="Accept commands on a Unix socket (default path if SOCKET is omitted)")
+    tui_parser.add_argument("--serve-tcp", type=int, metavar="PORT", help="Also accept commands on localhost:PORT")
+    add_feed_arguments(tui_parser)
+    add_record_arguments(tui_parser)
+    add_layout_argument(tui_parser)
+    add_physics_process_argument(tui_parser)
+    add_units_argument(tui_parser)
 
     map_parser = subparsers.add_parser("map", help="Print reactor core layout map")
     map_parser.add_argument(
@@ -20,13 +130,97 @@ def build_parser():
         action="store_true",
         help="Show placeholder cells as P instead of .",
     )
+    add_layout_argument(map_parser)
 
-    subparsers.add_parser("stats", help="Show reactor grid statistics")
+    stats_parser = subparsers.add_parser("stats", help="Show reactor grid statistics")
+    add_layout_argument(stats_parser)
     subparsers.add_parser("rod-types", help="List rod type codes and meanings")
 
     estimate_parser = subparsers.add_parser("estimate", help="Estimate output from power percent")
     estimate_parser.add_argument("power", type=float, help="Core power percent")
 
+    bench_parser = subparsers.add_parser("bench", help="Benchmark the simulation hot paths (JSON output)")
+    bench_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[13, 25, 35, 47],
+        help="Core diameters to benchmark; 13 is the shipped layout, 47 is ~1,700 channels",
+    )
+    bench_parser.add_argument("--backend", choices=("auto", "python", "numpy"), default="auto")
+    bench_parser.add_argument("--only", nargs="+", help="Run only these benchmarks (e.g. flux tick)")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="Timed batches per benchmark")
+    bench_parser.add_argument("--min-time", type=float, default=0.2, help="Seconds spent per benchmark")
+    bench_parser.add_argument("-o", "--output", help="Write the JSON report to this file")
+
+    ensemble_parser = subparsers.add_parser("ensemble", help="Run many seeded headless simulations in parallel")
+    ensemble_parser.add_argument("--runs", type=positive_int, default=20, help="Number of runs")
+    ensemble_parser.add_argument("--duration", type=float,
+                                 help="Simulated seconds to hold after startup completes (default: 600)")
+    ensemble_parser.add_argument("--seed", type=int, default=0, help="Seed of the first run (runs use seed, seed+1, ...)")
+    ensemble_parser.add_argument("--workers", type=positive_int, help="Worker processes (default: all cores)")
+    ensemble_parser.add_argument("-c", "--command", action="append", default=[], dest="commands",
+                                 help="Operator command applied once the reactor is online (repeatable)")
+    ensemble_parser.add_argument("--backend", choices=("auto", "python", "numpy"), default="auto")
+    ensemble_parser.add_argument("--json", action="store_true", help="Print the runs and aggregate as JSON")
+    ensemble_parser.add_argument("--scenario", metavar="FILE",
+                                 help="Run this scenario file per seed instead of start/--command/--duration")
+    add_layout_argument(ensemble_parser)
+
+    scenario_parser = subparsers.add_parser("run-scenario", help="Run scenario files of timed commands headlessly")
+    scenario_parser.add_argument("scenarios", nargs="+", metavar="FILE", help="Scenario files (t=<time> <command> per line)")
+    scenario_parser.add_argument("--seed", type=int, default=0, help="Simulator seed")
+    scenario_parser.add_argument("--step", type=float, default=1.0, help="Simulated seconds per physics step")
+    scenario_parser.add_argument("--backend", choices=("auto", "python", "numpy"), default="auto")
+    scenario_parser.add_argument("-v", "--verbose", action="store_true", help="Print the console log with sim times")
+    scenario_parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    add_record_arguments(scenario_parser)
+    scenario_parser.add_argument("--load", metavar="FILE",
+                                 help="Start from this snapshot instead of a cold core; times count from it")
+    scenario_parser.add_argument("--save", metavar="FILE", help="Save a snapshot of the final state")
+    add_layout_argument(scenario_parser)
+
+    serve_parser = subparsers.add_parser("serve", help="Run the simulator headless and accept commands on a socket")
+    serve_parser.add_argument("--socket", metavar="PATH", help="Unix socket path (default: $XDG_RUNTIME_DIR/helios-core.sock)")
+    serve_parser.add_argument("--tcp", type=int, metavar="PORT", help="Also listen on localhost:PORT")
+    serve_parser.add_argument("--speed", type=speed_arg, default=1.0,
+                              help="Simulation speed: 1 for real time, e.g. 100 for 100x, or 'max'")
+    serve_parser.add_argument("--seed", type=int, help="Simulator seed")
+    serve_parser.add_argument("--load", metavar="FILE", help="Start from a snapshot")
+    add_record_arguments(serve_parser)
+    add_feed_arguments(serve_parser)
+    add_layout_argument(serve_parser)
+
+    send_parser = subparsers.add_parser("send", help="Send commands to a running 'serve' or 'gui --serve'")
+    send_parser.add_argument("commands", nargs="*", metavar="COMMAND",
+                             help="Commands to send, pipelined; read from stdin, one per line, if omitted")
+    send_parser.add_argument("--socket", metavar="PATH", help="Unix socket path of the server")
+    send_parser.add_argument("--tcp", type=int, metavar="PORT", help="Connect to localhost:PORT instead")
+    send_parser.add_argument("--batch", action="store_true", help="Run the commands as one batch, with no tick between")
+    send_parser.add_argument("--json", action="store_true", help="Print the raw JSON acknowledgements")
+
+    watch_parser = subparsers.add_parser("watch", help="Print the live telemetry feed of 'serve --feed' or 'gui --feed'")
+    watch_parser.add_argument("channels", nargs="*", default=["scalars", "alarms", "arccs"], metavar="CHANNEL",
+                              help="Channels to subscribe to: scalars, flux, alarms, arccs or * (default: all but flux)")
+    watch_parser.add_argument("--socket", metavar="PATH", help="Feed socket path")
+    watch_parser.add_argument("--tcp", type=int, metavar="PORT", help="Connect to localhost:PORT instead")
+
+    telemetry_parser = subparsers.add_parser("telemetry", help="Show frames from a telemetry recording")
+    telemetry_parser.add_argument("file", help="Telemetry file written with --record")
+    telemetry_parser.add_argument("-n", "--lines", type=int, default=10, help="Show the last N frames")
+    telemetry_parser.add_argument("-f", "--follow", action="store_true",
+                                  help="Keep printing new frames while the recording is written")
+
+    export_parser = subparsers.add_parser("export", help="Convert a telemetry recording to a columnar file")
+    export_parser.add_argument("file", help="Telemetry file written with --record")
+    export_parser.add_argument("-o", "--output", help="Columnar output file (default: FILE with .hcol)")
+    export_parser.add_argument("--chunk-rows", type=positive_int, default=4096, help="Frames per column chunk")
+
+    query_parser = subparsers.add_parser("query", help="Find when a column crossed a threshold in an exported run")
+    query_parser.add_argument("file", help="Columnar file written by export")
+    query_parser.add_argument("condition", help="e.g. 'flux > 2.5' or 'core_power >= 90'")
+    query_parser.add_argument("--json", action="store_true", help="Print the matching intervals as JSON")
+
     guide_parser = subparsers.add_parser("guide", help="Show operator guide path or content")
     guide_parser.add_argument("--print", action="store_true", dest="print_guide", help="Print guide text")
 
@@ -37,16 +231,106 @@ def main(argv=None):
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    layout = None
+    if getattr(args, "layout", None):
+        from .layout import LayoutError, load_layout
+
+        try:
+            layout = load_layout(args.layout)
+        except (OSError, LayoutError) as e:
+            parser.error(f"cannot load layout {args.layout}: {e}")
+
     if args.command in (None, "gui"):
-        run_app()
+        # Imported here so the utility subcommands never load tkinter
+        from .channel_deviation_view import run_app
+        from .clock import SimClock
+        from .profiler import TickProfiler, profiling_requested
+
+        if args.command == "gui":
+            check_units(parser, args)
+        clock = SimClock.from_speed(getattr(args, "speed", 1.0))
+        profiler = TickProfiler() if profiling_requested(getattr(args, "profile", False)) else None
+        if profiler is not None and getattr(args, "physics_process", False):
+            # The physics would run in the child, out of the profiler's reach
+            parser.error("--profile (or HELIOS_PROFILE) cannot be combined with --physics-process")
+        from .physics_process import PhysicsProcessError
+        from .snapshot import SnapshotError
+
+        serve = getattr(args, "serve", None)
+        if serve == "":
+            from .server import default_socket_path
+
+            serve = default_socket_path()
+        try:
+            run_app(renderer=getattr(args, "renderer", "widgets"), clock=clock, profiler=profiler,
+                    layout=layout, seed=getattr(args, "seed", None), record=getattr(args, "record", None),
+                    record_capacity=getattr(args, "record_capacity", 36000), load=getattr(args, "load", None),
+                    serve=serve, serve_tcp=getattr(args, "serve_tcp", None),
+                    feed=feed_path(args), feed_tcp=getattr(args, "feed_tcp", None),
+                    physics_process=getattr(args, "physics_process", False), units=getattr(args, "units", 1))
+        except SnapshotError as e:  # only raised reading --load
+            parser.error(f"cannot load snapshot: {e}")
+        except PhysicsProcessError as e:
+            parser.error(str(e))
+        return
+
+    if args.command == "tui":
+        from . import snapshot
+        from .clock import SimClock
+        from .server import default_socket_path
+        from .simulator import ReactorSimulator
+        from .state import ReactorCoreState
+        from .telemetry import TelemetryRecorder
+        from .tui import run_tui
+
+        check_units(parser, args)
+        clock = SimClock.from_speed(args.speed)
+        if args.units > 1:
+            from .fleet import Fleet
+
+            run_tui(clock=clock, fleet=Fleet(args.units, layout, args.seed))
+            return
+        endpoints = {"serve": default_socket_path() if args.serve == "" else args.serve, "serve_tcp": args.serve_tcp,
+                     "feed": feed_path(args), "feed_tcp": args.feed_tcp}
+        if args.physics_process:
+            from .physics_process import FrameClock, PhysicsProcess, PhysicsProcessError, RemoteSimulator
+
+            try:
+                physics = PhysicsProcess(layout, args.seed, clock, args.load, args.record, args.record_capacity,
+                                         **endpoints).start()
+            except PhysicsProcessError as e:
+                parser.error(str(e))
+            except OSError as e:
+                parser.error(f"cannot start the physics process: {e}")
+            try:
+                run_tui(RemoteSimulator(physics), FrameClock(clock))
+            finally:
+                physics.stop()
+            return
+
+        sim = ReactorSimulator(ReactorCoreState(layout), seed=args.seed)
+        if args.load:
+            try:
+                sim = snapshot.load(args.load, sim if layout is not None else None)
+            except (OSError, snapshot.SnapshotError) as e:
+                parser.error(f"cannot load snapshot: {e}")
+        recorder = TelemetryRecorder(args.record, sim, args.record_capacity) if args.record else None
+        try:
+            run_tui(sim, clock, **endpoints)
+        finally:
+            if recorder is not None:
+                recorder.close()
         return
 
     if args.command == "map":
-        print(render_ascii_map(show_placeholder=args.show_placeholders))
+        if layout is not None:
+            print(render_ascii_map(show_placeholder=args.show_placeholders, grid=layout.grid))
+        else:
+            print(render_ascii_map(show_placeholder=args.show_placeholders))
         return
 
     if args.command == "stats":
-        stats = reactor_stats()
+        stats = reactor_stats(layout.grid) if layout is not None else reactor_stats()
         print(f"Active positions: {stats['active_positions']}/{stats['total_positions']} ({stats['utilization_percent']:.1f}%)")
         for rod_code, count in sorted(stats["counts"].items()):
             print(f"{rod_code}: {count}")
@@ -62,7 +346,235 @@ def main(argv=None):
         print(f"Electrical output: {electric_mw:.1f} MW")
         return
 
+    if args.command == "bench":
+        from . import bench
+
+        bench.main(args.sizes, args.backend, args.output, args.min_time, args.repeat, args.only)
+        return
+
+    if args.command == "ensemble":
+        import json
+        import time
+
+        from . import ensemble
+        from .scenario import ScenarioError, load_scenario
+
+        scenario = None
+        if args.scenario:
+            # The scenario file has its own timeline and commands
+            if args.duration is not None or args.commands:
+                parser.error("--scenario cannot be combined with --duration or --command")
+            try:
+                scenario = load_scenario(args.scenario)
+            except (OSError, ScenarioError) as e:
+                parser.error(f"cannot load scenario {args.scenario}: {e}")
+
+        def stream(summary):
+            if not args.json:
+                print(ensemble.format_summary(summary), flush=True)
+
+        started = time.perf_counter()
+        duration = 600.0 if args.duration is None else args.duration
+        summaries = ensemble.run_ensemble(args.runs, duration, args.seed, args.workers,
+                                          args.layout, args.commands, args.backend, on_result=stream,
+                                          scenario=scenario)
+        elapsed = time.perf_counter() - started
+        report = ensemble.aggregate(summaries)
+        if args.json:
+            print(json.dumps({"aggregate": report, "runs": summaries}, indent=2))
+        else:
+            print()
+            print(ensemble.format_report(report, elapsed))
+        return
+
+    if args.command == "run-scenario":
+        import json
+        import os
+
+        from .scenario import ScenarioError, format_result, load_scenario, run_scenario
+        from .snapshot import SnapshotError
+
+        scenarios = []
+        for path in args.scenarios:
+            try:
+                scenarios.append(load_scenario(path))
+            except (OSError, ScenarioError) as e:
+                parser.error(f"cannot load scenario {path}: {e}")
+
+        def echo(sim_time, message):
+            print(f"[{sim_time:8.1f}s] {message}")
+
+        results = []
+        for scenario in scenarios:
+            record, save = args.record, args.save
+            if len(scenarios) > 1:
+                record = record and "{0}-{2}{1}".format(*os.path.splitext(record), scenario.name)
+                save = save and "{0}-{2}{1}".format(*os.path.splitext(save), scenario.name)
+            try:
+                result = run_scenario(scenario, args.seed, args.backend, layout, args.step,
+                                      on_console=echo if args.verbose and not args.json else None,
+                                      record=record, record_capacity=args.record_capacity,
+                                      resume=args.load, save=save)
+            except (OSError, SnapshotError) as e:
+                parser.error(str(e))
+            results.append(result)
+            if not args.json:
+                print(format_result(result))
+                print()
+        if args.json:
+            print(json.dumps(results, indent=2))
+        elif len(results) > 1:
+            passed = sum(1 for r in results if r["passed"])
+            print(f"{passed}/{len(results)} scenarios passed")
+        if not all(r["passed"] for r in results):
+            raise SystemExit(1)
+        return
+
+    if args.command == "serve":
+        import asyncio
+
+        from . import snapshot
+        from .clock import SimClock
+        from .server import default_socket_path, serve
+        from .simulator import ReactorSimulator
+        from .state import ReactorCoreState
+        from .telemetry import TelemetryRecorder
+
+        sim = ReactorSimulator(ReactorCoreState(layout), seed=args.seed)
+        if args.load:
+            try:
+                sim = snapshot.load(args.load, sim if layout is not None else None)
+            except (OSError, snapshot.SnapshotError) as e:
+                parser.error(f"cannot load snapshot: {e}")
+        recorder = TelemetryRecorder(args.record, sim, args.record_capacity) if args.record else None
+        clock = SimClock.from_speed(args.speed)
+
+        def ready(server, feed=None):
+            print(f"Serving on {', '.join(server.addresses)} at {clock.describe()} (seed {sim.rng.seed})", flush=True)
+            if feed is not None:
+                print(f"Telemetry feed on {', '.join(feed.addresses)}", flush=True)
+
+        try:
+            asyncio.run(serve(sim, clock, args.socket or default_socket_path(), args.tcp, on_ready=ready,
+                              feed_path=feed_path(args), feed_tcp=args.feed_tcp))
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            parser.error(str(e))
+        finally:
+            if recorder is not None:
+                recorder.close()
+        return
+
+    if args.command == "send":
+        import json
+        import sys
+
+        from .server import send_commands
+
+        commands = args.commands or [line.strip() for line in sys.stdin if line.strip()]
+        try:
+            replies = send_commands(commands, args.socket, args.tcp, args.batch)
+        except OSError as e:
+            parser.error(f"cannot reach the server: {e}")
+        failed = False
+        for reply in replies:
+            if args.json:
+                print(json.dumps(reply, ensure_ascii=False))
+            for result in reply.get("results", [reply]):
+                failed |= not result.get("ok", False)
+                if not args.json:
+                    for line in result.get("output") or [result.get("error", "")]:
+                        if line:
+                            print(line)
+        if failed:
+            raise SystemExit(1)
+        return
+
+    if args.command == "watch":
+        import json
+
+        from .feed import watch
+
+        try:
+            for frame in watch(args.channels, args.socket, args.tcp):
+                print(json.dumps(frame), flush=True)
+        except OSError as e:
+            parser.error(f"cannot reach the feed: {e}")
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if args.command == "telemetry":
+        import time
+
+        from .telemetry import TelemetryError, TelemetryReader, format_frame
+
+        try:
+            reader = TelemetryReader(args.file)
+        except (OSError, TelemetryError) as e:
+            parser.error(f"cannot read telemetry {args.file}: {e}")
+        with reader:
+            print(f"{args.file}: {reader.count} frames written, ring of {reader.capacity}, "
+                  f"{reader.n_fuel} fuel / {reader.n_control} control channels"
+                  + ("" if reader.closed else " (recording)"))
+            seq = max(reader.first, reader.count - args.lines)
+            while True:
+                for frame in reader.frames(seq):
+                    print(format_frame(frame))
+                    seq = frame["seq"] + 1
+                if not args.follow or reader.closed:
+                    break
+                seq = max(seq, reader.first)
+                try:
+                    time.sleep(0.2)
+                except KeyboardInterrupt:
+                    break
+        return
+
+    if args.command == "export":
+        import os
+        import time
+
+        from .columnar import export
+        from .telemetry import TelemetryError
+
+        output = args.output or os.path.splitext(args.file)[0] + ".hcol"
+        started = time.perf_counter()
+        try:
+            rows = export(args.file, output, args.chunk_rows)
+        except (OSError, TelemetryError) as e:
+            parser.error(f"cannot export {args.file}: {e}")
+        print(f"Wrote {rows} rows to {output} ({os.path.getsize(output) / 1e6:.1f} MB, "
+              f"{time.perf_counter() - started:.1f}s)")
+        return
+
+    if args.command == "query":
+        import json
+
+        from .columnar import ColumnarError, ColumnarReader, intervals, parse_query
+
+        try:
+            column, op, threshold = parse_query(args.condition)
+            with ColumnarReader(args.file) as reader:
+                runs = intervals(reader.find(column, op, threshold), reader.times())
+                # The sim_time chunks read to report the intervals are not counted
+                read, skipped = reader.chunks_read[column], reader.chunks_skipped[column]
+        except (OSError, ColumnarError) as e:
+            parser.error(str(e))
+        if args.json:
+            print(json.dumps(runs, indent=2))
+            return
+        for run in runs:
+            rods = f"  rods {', '.join(map(str, run['rods']))}" if run["rods"] else ""
+            print(f"t={run['start']:.1f}s-{run['end']:.1f}s  {run['rows']} frames  "
+                  f"min {run['min']:.3f} max {run['max']:.3f}{rods}")
+        print(f"{len(runs)} intervals; {skipped} chunks skipped, {read} read")
+        return
+
     if args.command == "guide":
+        from importlib.resources import files
+
         guide_path = files("helios_core").joinpath("resources/OPERATOR_GUIDE.txt")
         if args.print_guide:
             print(guide_path.read_text(encoding="utf-8"))
@@ -0,0 +1,95 @@
+"""Simulation clock: maps wall-clock time onto fixed simulation steps.
+
+The simulator always advances in fixed ``step`` increments of simulated
+time. A ``SimClock`` decides how many of those steps are due:
+
+- ``"realtime"``: one simulated second per wall second
+- ``"scaled"``: ``scale`` simulated seconds per wall second (e.g. 100x)
+- ``"fast"``: as fast as possible, ``batch`` steps per call
+
+Frontends poll ``advance(sim)`` from their event loop; headless callers
+use ``run(sim, seconds)``.
+"""
+import time
+
+MODES = ("realtime", "scaled", "fast")
+
+
+class SimClock:
+    """Paces fixed simulation steps against the wall clock"""
+
+    def __init__(self, mode="realtime", scale=1.0, step=1.0, batch=50, max_catchup=10):
+        if mode not in MODES:
+            raise ValueError(f"Unknown clock mode: {mode}")
+        if scale <= 0 or step <= 0:
+            raise ValueError("Clock scale and step must be positive")
+        self.mode = mode
+        self.scale = 1.0 if mode == "realtime" else scale
+        self.step = step              # simulated seconds per physics step
+        self.batch = batch            # steps per advance() in fast mode
+        self.max_catchup = max_catchup  # wall-clock periods of backlog to keep
+        self._origin = None           # wall time of the first advance()
+        self._steps_done = 0
+
+    @classmethod
+    def from_speed(cls, speed, **kwargs):
+        """Clock for a speed given as ``1``, ``100`` or ``"max"``"""
+        if str(speed).lower() in ("max", "fast"):
+            return cls("fast", **kwargs)
+        speed = float(speed)
+        return cls("realtime" if speed == 1 else "scaled", scale=speed, **kwargs)
+
+    def describe(self):
+        if self.mode == "fast":
+            return "max speed"
+        return f"{self.scale:g}x"
+
+    def reset(self):
+        """Forget the wall-clock origin, e.g. after a pause"""
+        self._origin = None
+        self._steps_done = 0
+
+    def due_steps(self, now=None):
+        """Number of physics steps owed to the wall clock at ``now``"""
+        if self.mode == "fast":
+            return self.batch
+
+        now = time.monotonic() if now is None else now
+        if self._origin is None:
+            self._origin = now
+        target = int((now - self._origin) * self.scale / self.step)
+        due = target - self._steps_done
+
+        # Drop backlog the machine cannot catch up on instead of spiralling
+        limit = max(1, int(self.max_catchup * self.scale / self.step))
+        if due > limit:
+            self._steps_done = target - limit
+            due = limit
+        return max(0, due)
+
+    def advance(self, sim, now=None):
+        """Run every due step on ``sim``; returns the number of steps run"""
+        steps = self.due_steps(now)
+        for _ in range(steps):
+            sim.step(self.step)
+        self._steps_done += steps
+        return steps
+
+    def poll_interval(self):
+        """Wall seconds until the next step is due (0 in fast mode)"""
+        if self.mode == "fast":
+            return 0.0
+        return self.step / self.scale
+
+    def run(self, sim, seconds):
+        """Advance ``sim`` by ``seconds`` of simulated time, pacing as configured"""
+        end = sim.sim_time + seconds
+        while sim.sim_time + self.step <= end + 1e-9:
+            if self.mode == "fast":
+                sim.step(self.step)
+                continue
+            if not self.due_steps():
+                time.sleep(self.poll_interval())
+                continue
+            sim.step(self.step)
+            self._steps_done += 1
@@ -0,0 +1,310 @@
+"""Columnar, chunked export of telemetry recordings.
+
+``export`` converts a ``TelemetryRecorder`` file into a column store: one
+column per plant scalar and one per-channel matrix each for flux, fuel and
+rod insertion. Rows are grouped into chunks of ``chunk_rows`` frames and
+every column chunk is compressed on its own:
+
+- float columns are byte-shuffled (the n-th byte of every value stored
+  together) and zlib-compressed, which is lossless and packs slowly
+  varying series tightly
+- integer columns are delta-encoded before compression
+- matrices are stored rod by rod within a chunk, so each rod's series
+  compresses like a scalar column
+
+Each chunk records its min and max in the footer, so ``ColumnarReader.find``
+only decompresses chunks that can contain a match.
+
+File layout::
+
+    MAGIC, column chunks ..., footer JSON, footer length (uint64), MAGIC
+"""
+import json
+import struct
+import zlib
+from array import array
+from collections import Counter
+
+from .scenario import OPERATORS
+from .telemetry import SCALAR_FIELDS, TelemetryReader
+
+MAGIC = b"HELIOSCL"
+VERSION = 1
+DEFAULT_CHUNK_ROWS = 4096
+FOOTER = struct.Struct("<Q")
+
+# column -> (frame key, array typecode); matrices are per fuel / control rod
+SCALAR_COLUMNS = {name: (name, "d") for name in SCALAR_FIELDS}
+SCALAR_COLUMNS.update({"seq": ("seq", "q"), "alerts": ("alerts", "q")})
+MATRIX_COLUMNS = {"flux": "fuel_rods", "fuel": "fuel_rods", "insertion": "control_rods"}
+
+
+class ColumnarError(ValueError):
+    """A columnar file could not be read or queried"""
+
+
+def _shuffle(data, width):
+    return b"".join(data[i::width] for i in range(width))
+
+
+def _unshuffle(data, width):
+    n = len(data) // width
+    out = bytearray(len(data))
+    for i in range(width):
+        out[i::width] = data[i * n:(i + 1) * n]
+    return out
+
+
+def encode(values):
+    """Compress an ``array`` column chunk -> (encoding, bytes)"""
+    if values.typecode == "d":
+        return "shuffle-zlib", zlib.compress(_shuffle(values.tobytes(), 8))
+    deltas = array("q", values)
+    for i in range(len(deltas) - 1, 0, -1):
+        deltas[i] -= deltas[i - 1]
+    return "delta-zlib", zlib.compress(deltas.tobytes())
+
+
+def decode(encoding, data, typecode):
+    raw = zlib.decompress(data)
+    if encoding == "shuffle-zlib":
+        return array(typecode, _unshuffle(raw, 8))
+    if encoding == "delta-zlib":
+        values = array("q", raw)
+        for i in range(1, len(values)):
+            values[i] += values[i - 1]
+        return values
+    raise ColumnarError(f"unknown encoding {encoding!r}")
+
+
+class ColumnarWriter:
+    """Write rows of telemetry frames into a columnar file"""
+
+    def __init__(self, path, fuel_rods, control_rods, chunk_rows=DEFAULT_CHUNK_ROWS, source=None):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.rods = {"fuel_rods": list(fuel_rods), "control_rods": list(control_rods)}
+        self.footer = {
+            "version": VERSION,
+            "source": source,
+            "rows": 0,
+            "chunk_rows": chunk_rows,
+            "fuel_rods": self.rods["fuel_rods"],
+            "control_rods": self.rods["control_rods"],
+            "columns": {},
+        }
+        for name, (_, typecode) in SCALAR_COLUMNS.items():
+            self.footer["columns"][name] = {"kind": "scalar", "type": typecode, "chunks": []}
+        for name, rods in MATRIX_COLUMNS.items():
+            self.footer["columns"][name] = {"kind": "matrix", "type": "d", "rods": rods, "chunks": []}
+        self._pending = []
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+
+    def append(self, frame):
+        self._pending.append(frame)
+        if len(self._pending) >= self.chunk_rows:
+            self._flush()
+
+    def _write_chunk(self, name, values, width=1):
+        encoding, data = encode(values)
+        chunk = {"offset": self._file.tell(), "size": len(data), "rows": len(values) // width,
+                 "encoding": encoding, "min": min(values), "max": max(values)}
+        self._file.write(data)
+        self.footer["columns"][name]["chunks"].append(chunk)
+
+    def _flush(self):
+        frames = self._pending
+        if not frames:
+            return
+        for name, (key, typecode) in SCALAR_COLUMNS.items():
+            self._write_chunk(name, array(typecode, [frame[key] for frame in frames]))
+        for name, rods in MATRIX_COLUMNS.items():
+            width = len(self.rods[rods])
+            if not width:
+                continue
+            rows = array("d")
+            for frame in frames:
+                rows.extend(frame[name])
+            # Rod-major within the chunk: each rod's series is contiguous
+            by_rod = array("d")
+            for j in range(width):
+                by_rod.extend(rows[j::width])
+            self._write_chunk(name, by_rod, width)
+        self.footer["rows"] += len(frames)
+        self._pending = []
+
+    def close(self):
+        self._flush()
+        footer = json.dumps(self.footer, separators=(",", ":")).encode("utf-8")
+        self._file.write(footer)
+        self._file.write(FOOTER.pack(len(footer)))
+        self._file.write(MAGIC)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def export(source, output, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Convert the telemetry file ``source`` into a columnar file. Returns
+    the number of rows written."""
+    with TelemetryReader(source) as reader:
+        writer = ColumnarWriter(output, reader.fuel_rods, reader.control_rods, chunk_rows, source=str(source))
+        with writer:
+            for frame in reader.frames():
+                writer.append(frame)
+    return writer.footer["rows"]
+
+
+def _may_match(op, threshold, low, high):
+    """Whether a chunk with values in [low, high] can satisfy ``op``"""
+    if op == ">":
+        return high > threshold
+    if op == ">=":
+        return high >= threshold
+    if op == "<":
+        return low < threshold
+    if op == "<=":
+        return low <= threshold
+    if op == "==":
+        return low <= threshold <= high
+    return not low == high == threshold  # "!="
+
+
+def parse_query(text):
+    """``"flux > 2.5"`` -> ("flux", ">", 2.5)"""
+    for op in sorted(OPERATORS, key=len, reverse=True):
+        column, found, value = text.partition(op)
+        if found:
+            try:
+                return column.strip(), op, float(value)
+            except ValueError:
+                break
+    raise ColumnarError(f"invalid query {text!r} (expected '<column> <op> <value>')")
+
+
+class ColumnarReader:
+    """Read columns and run range queries on a columnar file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self.close()
+            raise ColumnarError(f"{path} is not a columnar telemetry file")
+        tail = len(MAGIC) + FOOTER.size
+        self._file.seek(-tail, 2)
+        (length,) = FOOTER.unpack(self._file.read(FOOTER.size))
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self.close()
+            raise ColumnarError(f"{path} is truncated")
+        self._file.seek(-(tail + length), 2)
+        self.footer = json.loads(self._file.read(length))
+        if self.footer["version"] != VERSION:
+            self.close()
+            raise ColumnarError(f"{path} has version {self.footer['version']}, expected {VERSION}")
+        self.rows = self.footer["rows"]
+        self.columns = self.footer["columns"]
+        self.fuel_rods = self.footer["fuel_rods"]
+        self.control_rods = self.footer["control_rods"]
+        # column name -> chunks decoded / ruled out by their min/max
+        self.chunks_read = Counter()
+        self.chunks_skipped = Counter()
+
+    def _column(self, name):
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise ColumnarError(f"unknown column {name!r} (use {', '.join(self.columns)})") from None
+
+    def _chunk(self, name, column, chunk):
+        self._file.seek(chunk["offset"])
+        self.chunks_read[name] += 1
+        return decode(chunk["encoding"], self._file.read(chunk["size"]), column["type"])
+
+    def read(self, name):
+        """The whole scalar column ``name``, or for a matrix one array per rod"""
+        column = self._column(name)
+        if column["kind"] == "scalar":
+            values = array(column["type"])
+            for chunk in column["chunks"]:
+                values.extend(self._chunk(name, column, chunk))
+            return values
+        rods = self.footer[column["rods"]]
+        series = {rod: array("d") for rod in rods}
+        for chunk in column["chunks"]:
+            data, rows = self._chunk(name, column, chunk), chunk["rows"]
+            for j, rod in enumerate(rods):
+                series[rod].extend(data[j * rows:(j + 1) * rows])
+        return series
+
+    def find(self, name, op, threshold):
+        """Yield ``(row, rod, value)`` for every value of column ``name``
+        satisfying ``value <op> threshold``, in row order; ``rod`` is None
+        for scalar columns. Chunks whose min/max rule out a match are
+        skipped without being read."""
+        column = self._column(name)
+        if op not in OPERATORS:
+            raise ColumnarError(f"unknown comparison {op!r}")
+        compare = OPERATORS[op]
+        rods = self.footer[column["rods"]] if column["kind"] == "matrix" else [None]
+        start = 0
+        for chunk in column["chunks"]:
+            rows = chunk["rows"]
+            if not _may_match(op, threshold, chunk["min"], chunk["max"]):
+                self.chunks_skipped[name] += 1
+                start += rows
+                continue
+            data = self._chunk(name, column, chunk)
+            matches = []
+            for j, rod in enumerate(rods):
+                series = data[j * rows:(j + 1) * rows]
+                if rod is not None and not _may_match(op, threshold, min(series), max(series)):
+                    continue
+                for i, value in enumerate(series):
+                    if compare(value, threshold):
+                        matches.append((start + i, rod, value))
+            matches.sort(key=lambda m: m[0])
+            yield from matches
+            start += rows
+
+    def times(self):
+        return self.read("sim_time")
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def intervals(matches, times):
+    """Group ``find`` matches into runs of consecutive rows:
+    ``[{"start": t0, "end": t1, "rows": n, "min": v0, "max": v1, "rods": [...]}, ...]``"""
+    runs = []
+    current = None
+    for row, rod, value in matches:
+        if current is None or row > current["_last"] + 1:
+            current = {"start": times[row], "end": times[row], "rows": 0, "min": value, "max": value,
+                       "rods": set(), "_last": row - 1}
+            runs.append(current)
+        if row != current["_last"]:
+            current["rows"] += 1
+        current["_last"] = row
+        current["end"] = times[row]
+        current["min"] = min(current["min"], value)
+        current["max"] = max(current["max"], value)
+        if rod is not None:
+            current["rods"].add(rod)
+    for run in runs:
+        del run["_last"]
+        run["rods"] = sorted(run["rods"])
+    return runs
+
@@ -0,0 +1,168 @@
+"""Core map renderers for the control station GUI.
+
+Both renderers expose the same interface to ``GridUI``:
+
+- ``num_to_cell``: rod number -> (canvas, letter, temp_box, pressure_box,
+  fuel_box, flux_box, temp_text, pressure_text, fuel_text, flux_text)
+- ``set_background(number, colour)``: recolour a channel (alarm flashing)
+
+``WidgetCoreMap`` is the original layout with one ``tk.Canvas`` per
+channel. ``CanvasCoreMap`` draws the whole core on a single canvas, tags
+every item with its cell and hit-tests clicks arithmetically, so it scales
+to large layouts without creating a widget per channel. Cores larger than
+``MAX_VIEW`` get scrollbars.
+"""
+import tkinter as tk
+
+CELL_SIZE = 52  # Increased for better visibility
+OFF = "#2b2b2b"
+MAX_VIEW = (1200, 900)  # canvas viewport in px; larger cores scroll
+
+
+def draw_cell(canvas, x, y, letter, number, tags=()):
+    """Draw the labels and 2x2 indicator boxes of one channel at (x, y).
+
+    Returns the item ids (temp_box, pressure_box, fuel_box, flux_box,
+    temp_text, pressure_text, fuel_text, flux_text).
+    """
+    canvas.create_text(x + 5, y + 5, text=letter, anchor="nw",
+                       fill="white", font=("Helvetica", 9, "bold"), tags=tags)
+
+    canvas.create_text(x + CELL_SIZE - 5, y + 5, text=str(number), anchor="ne",
+                       fill="#aaaaaa", font=("Helvetica", 8), tags=tags)
+
+    # Create 2x2 grid of boxes at bottom 2/5 of cell
+    # Bottom 1/5: temp (left), pressure (right)
+    # Second 1/5: fuel (left), flux (right)
+    box_height = CELL_SIZE // 5  # Each row is 1/5 of cell
+    box_width = (CELL_SIZE - 4) // 2  # 2 boxes across
+
+    # Bottom row (temp and pressure)
+    bottom_y = y + CELL_SIZE - box_height - 2
+
+    # Temperature box (bottom left)
+    temp_box = canvas.create_rectangle(x + 2, bottom_y, x + 2 + box_width, y + CELL_SIZE - 2,
+                                       fill="#1a1a1a", outline="#444", width=1, tags=tags)
+    temp_text = canvas.create_text(x + 2 + box_width // 2, bottom_y + box_height // 2,
+                                   text="", fill="white", font=("Courier", 6, "bold"), tags=tags)
+
+    # Pressure box (bottom right)
+    pressure_box = canvas.create_rectangle(x + 2 + box_width + 2, bottom_y, x + CELL_SIZE - 2, y + CELL_SIZE - 2,
+                                           fill="#1a1a1a", outline="#444", width=1, tags=tags)
+    pressure_text = canvas.create_text(x + 2 + box_width + 2 + box_width // 2, bottom_y + box_height // 2,
+                                       text="", fill="white", font=("Courier", 6, "bold"), tags=tags)
+
+    # Top row (fuel and flux) - second 1/5 from bottom
+    top_y = bottom_y - box_height - 1
+
+    # Fuel box (top left)
+    fuel_box = canvas.create_rectangle(x + 2, top_y, x + 2 + box_width, bottom_y - 1,
+                                       fill="#1a1a1a", outline="#444", width=1, tags=tags)
+    fuel_text = canvas.create_text(x + 2 + box_width // 2, top_y + box_height // 2,
+                                   text="", fill="white", font=("Courier", 6, "bold"), tags=tags)
+
+    # Neutron flux box (top right)
+    flux_box = canvas.create_rectangle(x + 2 + box_width + 2, top_y, x + CELL_SIZE - 2, bottom_y - 1,
+                                       fill="#1a1a1a", outline="#444", width=1, tags=tags)
+    flux_text = canvas.create_text(x + 2 + box_width + 2 + box_width // 2, top_y + box_height // 2,
+                                   text="", fill="white", font=("Courier", 6, "bold"), tags=tags)
+
+    return temp_box, pressure_box, fuel_box, flux_box, temp_text, pressure_text, fuel_text, flux_text
+
+
+class WidgetCoreMap:
+    """One canvas widget per channel, placeholders included"""
+
+    def __init__(self, parent, rows, cols, rod_to_pos, rod_to_letter, on_click):
+        self.frame = tk.Frame(parent, bg="black")
+        self.num_to_cell = {}
+
+        pos_to_num = {pos: number for number, pos in rod_to_pos.items()}
+        for r in range(rows):
+            for c in range(cols):
+                number = pos_to_num.get((r, c))
+
+                if number is None:
+                    canvas = tk.Canvas(self.frame, width=CELL_SIZE, height=CELL_SIZE,
+                                       bg="black", highlightthickness=0, bd=0)
+                    canvas.grid(row=r, column=c)
+                    continue
+
+                canvas = tk.Canvas(self.frame, width=CELL_SIZE, height=CELL_SIZE,
+                                   bg=OFF, highlightthickness=1,
+                                   highlightbackground="#444")
+                canvas.grid(row=r, column=c)
+
+                letter = rod_to_letter[number]
+                items = draw_cell(canvas, 0, 0, letter, number)
+                self.num_to_cell[number] = (canvas, letter) + items
+
+                canvas.bind("<Button-1>", lambda e, n=number: on_click(n))
+
+    def set_background(self, number, colour):
+        self.num_to_cell[number][0].configure(bg=colour)
+
+
+class CanvasCoreMap:
+    """The whole core drawn on one canvas, cells addressed by tags"""
+
+    PITCH = CELL_SIZE + 2  # cell plus the 1px border the widget layout draws
+
+    def __init__(self, parent, rows, cols, rod_to_pos, rod_to_letter, on_click):
+        self.frame = tk.Frame(parent, bg="black")
+        width, height = cols * self.PITCH, rows * self.PITCH
+        self.canvas = tk.Canvas(self.frame, width=min(width, MAX_VIEW[0]), height=min(height, MAX_VIEW[1]),
+                                scrollregion=(0, 0, width, height), bg="black", highlightthickness=0, bd=0)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        if width > MAX_VIEW[0]:
+            xscroll = tk.Scrollbar(self.frame, orient="horizontal", command=self.canvas.xview)
+            xscroll.grid(row=1, column=0, sticky="ew")
+            self.canvas.configure(xscrollcommand=xscroll.set)
+        if height > MAX_VIEW[1]:
+            yscroll = tk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview)
+            yscroll.grid(row=0, column=1, sticky="ns")
+            self.canvas.configure(yscrollcommand=yscroll.set)
+        self.num_to_cell = {}
+        self.backgrounds = {}  # rod number -> background rectangle id
+        self.pos_to_num = {pos: number for number, pos in rod_to_pos.items()}
+        self.rows = rows
+        self.cols = cols
+        self.on_click = on_click
+
+        for number, (r, c) in rod_to_pos.items():
+            x = c * self.PITCH + 1
+            y = r * self.PITCH + 1
+            tags = ("cell", f"cell{number}")
+            self.backgrounds[number] = self.canvas.create_rectangle(
+                x - 1, y - 1, x + CELL_SIZE, y + CELL_SIZE,
+                fill=OFF, outline="#444", width=1, tags=tags)
+            letter = rod_to_letter[number]
+            items = draw_cell(self.canvas, x, y, letter, number, tags)
+            self.num_to_cell[number] = (self.canvas, letter) + items
+
+        self.canvas.tag_bind("cell", "<Button-1>", self._on_click)
+
+    def cell_at(self, x, y):
+        """Rod number under canvas coordinates, or None"""
+        c = int(self.canvas.canvasx(x) // self.PITCH)
+        r = int(self.canvas.canvasy(y) // self.PITCH)
+        if 0 <= r < self.rows and 0 <= c < self.cols:
+            return self.pos_to_num.get((r, c))
+        return None
+
+    def _on_click(self, event):
+        number = self.cell_at(event.x, event.y)
+        if number is not None:
+            self.on_click(number)
+
+    def set_background(self, number, colour):
+        self.canvas.itemconfig(self.backgrounds[number], fill=colour)
+
+
+def make_core_map(renderer, parent, rows, cols, rod_to_pos, rod_to_letter, on_click):
+    """Build the core map for ``renderer`` (``"widgets"`` or ``"canvas"``)"""
+    if renderer == "widgets":
+        return WidgetCoreMap(parent, rows, cols, rod_to_pos, rod_to_letter, on_click)
+    if renderer == "canvas":
+        return CanvasCoreMap(parent, rows, cols, rod_to_pos, rod_to_letter, on_click)
+    raise ValueError(f"Unknown renderer: {renderer}")
@@ -0,0 +1,160 @@
+"""Monte Carlo ensembles of seeded headless runs.
+
+``run_ensemble`` runs the same scenario with consecutive seeds on a
+``ProcessPoolExecutor``, streams each run's summary back as it finishes
+and ``aggregate`` reduces them to alert frequencies and peak temperature
+and power distributions. Each run is independent and only a small
+summary dict crosses the process boundary, so throughput scales with the
+number of cores.
+"""
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+from .scenario import RunStats, run_scenario
+from .simulator import ALERT_NAMES, ReactorSimulator
+from .state import ReactorCoreState
+
+STARTUP_TIMEOUT = 600.0  # simulated seconds allowed for the startup sequence
+
+
+@lru_cache(maxsize=None)
+def _layout(path):
+    # Loaded once per worker process
+    from .layout import load_layout
+
+    return load_layout(path)
+
+
+def run_once(seed, duration=600.0, layout_path=None, commands=(), backend="auto", scenario=None):
+    """Start the reactor, apply ``commands`` once it is online and hold for
+    ``duration`` simulated seconds, or run ``scenario`` (see
+    ``helios_core.scenario``) if given. Returns a summary dict of the run."""
+    layout = _layout(layout_path) if layout_path else None
+    if scenario is not None:
+        return run_scenario(scenario, seed, backend, layout)
+
+    sim = ReactorSimulator(ReactorCoreState(layout) if layout else None, backend=backend, seed=seed)
+    stats = RunStats(sim)
+    started = time.perf_counter()
+    sim.start()
+    while sim.startup_in_progress and sim.sim_time < STARTUP_TIMEOUT:
+        sim.step(1.0)
+    online_at = sim.sim_time if sim.running else None
+
+    for command in commands:
+        sim.execute(command)
+    end = sim.sim_time + duration
+    while sim.sim_time < end:
+        sim.step(1.0)
+
+    summary = {"seed": seed}
+    summary.update(stats.summary())
+    summary["online_at"] = online_at
+    summary["wall_time"] = time.perf_counter() - started
+    return summary
+
+
+def run_ensemble(runs, duration=600.0, seed=0, workers=None, layout_path=None,
+                 commands=(), backend="auto", on_result=None, scenario=None):
+    """Run ``runs`` seeded simulations; ``on_result(summary)`` is called as
+    each finishes. Returns the summaries in seed order."""
+    if layout_path:
+        layout_path = os.path.abspath(layout_path)
+    commands = tuple(commands)
+    seeds = range(seed, seed + runs)
+    summaries = []
+
+    if workers == 1:
+        for run_seed in seeds:
+            summary = run_once(run_seed, duration, layout_path, commands, backend, scenario)
+            summaries.append(summary)
+            if on_result is not None:
+                on_result(summary)
+        return summaries
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_once, run_seed, duration, layout_path, commands, backend, scenario)
+                   for run_seed in seeds]
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries.append(summary)
+            if on_result is not None:
+                on_result(summary)
+    summaries.sort(key=lambda s: s["seed"])
+    return summaries
+
+
+def distribution(values):
+    """min / p5 / median / p95 / max / mean of ``values``"""
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+
+    def pct(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    return {
+        "min": ordered[0],
+        "p5": pct(0.05),
+        "median": statistics.median(ordered),
+        "p95": pct(0.95),
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+    }
+
+
+def aggregate(summaries):
+    """Ensemble statistics over per-run summaries"""
+    runs = len(summaries)
+    alert_names = [name for row in ALERT_NAMES for name in row]
+    return {
+        "runs": runs,
+        "reached_online": sum(1 for s in summaries if s["online_at"] is not None),
+        "still_running": sum(1 for s in summaries if s["running"]),
+        # scenario runs only: no command errors or failed expectations
+        "passed": sum(1 for s in summaries if s.get("passed")) if any("passed" in s for s in summaries) else None,
+        # fraction of runs in which each alert fired at least once
+        "alert_frequency": {name: sum(1 for s in summaries if name in s["alerts"]) / runs
+                            for name in alert_names if any(name in s["alerts"] for s in summaries)},
+        # mean fraction of ticks each alert was active
+        "alert_duty": {name: sum(s["alerts"].get(name, 0.0) for s in summaries) / runs
+                       for name in alert_names if any(name in s["alerts"] for s in summaries)},
+        "peak_temp": distribution([s["peak_temp"] for s in summaries]),
+        "peak_power": distribution([s["peak_power"] for s in summaries]),
+        "final_power": distribution([s["final_power"] for s in summaries]),
+        "arccs_recommendations": distribution([s["arccs_recommendations"] for s in summaries]),
+        "auto_rod_moves": distribution([s["auto_rod_moves"] for s in summaries]),
+    }
+
+
+def format_summary(summary):
+    online = f"{summary['online_at']:.0f}s" if summary["online_at"] is not None else "never"
+    return (f"seed {summary['seed']:>5}  online {online:>6}  "
+            f"peak {summary['peak_temp']:6.1f}K {summary['peak_power']:6.1f}%  "
+            f"final {summary['final_power']:6.1f}%  alerts {len(summary['alerts'])}  "
+            + ("" if "passed" not in summary else "pass  " if summary["passed"] else "FAIL  ")
+            + f"({summary['wall_time']:.2f}s)")
+
+
+def format_report(report, elapsed=None):
+    lines = [f"Runs: {report['runs']}  reached online: {report['reached_online']}  "
+             f"still running at end: {report['still_running']}"]
+    if report.get("passed") is not None:
+        lines.append(f"Scenario passed: {report['passed']}/{report['runs']}")
+    if elapsed:
+        lines.append(f"Wall time: {elapsed:.1f}s ({report['runs'] / elapsed:.1f} runs/s)")
+    for key, unit in (("peak_temp", "K"), ("peak_power", "%"), ("final_power", "%")):
+        d = report[key]
+        lines.append(f"{key:<14} min {d['min']:7.1f}{unit}  p5 {d['p5']:7.1f}{unit}  "
+                     f"median {d['median']:7.1f}{unit}  p95 {d['p95']:7.1f}{unit}  max {d['max']:7.1f}{unit}")
+    lines.append(f"ARCCS recommendation ticks: mean {report['arccs_recommendations']['mean']:.1f}  "
+                 f"auto rod moves: mean {report['auto_rod_moves']['mean']:.1f}")
+    lines.append("Alert frequency (runs fired / mean active time):")
+    if not report["alert_frequency"]:
+        lines.append("  none")
+    for name, frequency in sorted(report["alert_frequency"].items(), key=lambda x: -x[1]):
+        lines.append(f"  {name:<20} {frequency * 100:5.1f}%  {report['alert_duty'][name] * 100:5.1f}%")
+    return "\n".join(lines)
@@ -0,0 +1,347 @@
+"""Publish/subscribe telemetry feed for local dashboards.
+
+``TelemetryFeed`` serves a live stream of the simulator state on a Unix
+socket (and optionally a localhost TCP port) as JSON lines. A client
+subscribes to any of the ``CHANNELS``::
+
+    subscribe scalars alarms
+    {"subscribe": ["flux"]}
+    unsubscribe flux
+
+and first receives a key frame with every value of the new channels, then
+delta frames carrying only the values that changed::
+
+    {"seq": 1, "sim_time": 0.0, "full": true, "scalars": {"core_power": 0.0, ...}}
+    {"seq": 9, "sim_time": 8.0, "scalars": {"pressure": 101.2}, "alarms": {"57": "red flashing"}}
+
+Channels:
+
+- ``scalars``: the plant scalars of ``telemetry.SCALAR_FIELDS`` plus
+  ``running`` and ``startup_in_progress``
+- ``flux``: neutron flux per fuel rod
+- ``alarms``: alarm state per rod (``off``, ``red``, ``yellow``, with
+  `` flashing`` until acknowledged) and the plant alerts
+- ``arccs``: the current ARCCS recommendation and new ``log`` messages
+
+Floats are rounded to ``DIGITS`` decimals, so values that only jitter
+below that are not resent.
+
+A frame is published per physics tick and whenever state changes outside
+one (commands, ramps). The simulator thread only copies the state arrays
+and hands them to the feed's event loop; the diffing and writes happen
+there. Updates that arrive while the loop is busy are coalesced, and a
+client whose socket buffer holds more than ``max_buffer`` bytes is
+skipped until it catches up. Its next frame then carries every value
+changed meanwhile and ``"skipped": n``, the number of frames it missed.
+ARCCS messages are kept for the last ``LOG_HISTORY`` entries;
+``"log_dropped"`` counts older ones a slow client never saw.
+"""
+import asyncio
+import json
+import socket
+import threading
+from array import array
+from collections import deque
+
+from .server import SocketService, _no_delay, default_socket_path
+from .state import ALARM_MODES, FLASH, MODE_MASK
+from .telemetry import ALERT_ORDER, SCALAR_FIELDS
+
+CHANNELS = ("scalars", "flux", "alarms", "arccs")
+DIGITS = 3
+SCALE = 10.0 ** DIGITS
+MAX_BUFFER = 256 * 1024  # bytes queued for a client before frames are skipped
+LOG_HISTORY = 200
+
+SCALAR_KEYS = SCALAR_FIELDS[1:] + ("running", "startup_in_progress")
+ALARM_LABELS = {mode | flash: name + (" flashing" if flash else "")
+                for mode, name in enumerate(ALARM_MODES) for flash in (0, FLASH)}
+
+
+def default_feed_path():
+    return default_socket_path("helios-core-feed")
+
+
+class FeedClient:
+    __slots__ = ("writer", "channels", "seq", "log_seen", "draining")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.channels = frozenset()
+        self.seq = None       # last frame this client is up to date with
+        self.log_seen = 0     # ARCCS messages delivered so far
+        self.draining = False  # a catch-up frame is queued for when the socket drains
+
+
+def parse_subscription(line):
+    """A client line -> (action, channels); raises ValueError"""
+    if line.startswith("{"):
+        request = json.loads(line)
+        if not isinstance(request, dict) or len(request) != 1:
+            raise ValueError("expected {\"subscribe\": [...]} or {\"unsubscribe\": [...]}")
+        (action, channels), = request.items()
+        if isinstance(channels, str):
+            channels = [channels]
+    else:
+        action, *channels = line.split()
+    if action not in ("subscribe", "unsubscribe"):
+        raise ValueError(f"unknown request {action!r}")
+    if not isinstance(channels, list) or not channels:
+        raise ValueError(f"{action} needs channel names")
+    if channels == ["*"]:
+        channels = list(CHANNELS)
+    unknown = [c for c in channels if c not in CHANNELS]
+    if unknown:
+        raise ValueError(f"unknown channel {unknown[0]!r} (use {', '.join(CHANNELS)})")
+    return action, frozenset(channels)
+
+
+class TelemetryFeed(SocketService):
+    """Stream ``sim`` to subscribed clients; see the module docstring.
+
+    ``every`` publishes one frame per that many physics ticks. ``start``
+    must be awaited on the event loop that serves the clients; the
+    simulator may tick on another thread.
+    """
+
+    def __init__(self, sim, every=1, max_buffer=MAX_BUFFER):
+        super().__init__()
+        self.sim = sim
+        self.every = max(1, int(every))
+        self.max_buffer = max_buffer
+        self.loop = None
+        self.clients = set()
+        self._handlers = set()
+        self.seq = 0
+        self.sim_time = 0.0
+        self.frames_skipped = 0
+
+        layout = sim.layout
+        keys = {
+            "scalars": list(SCALAR_KEYS),
+            "flux": [str(rod) for rod in layout.fuel_rods],
+            "alarms": [str(rod) for rod in layout.rod_index] + ALERT_ORDER,
+            "arccs": ["recommendation"],
+        }
+        # channel -> (keys, values, seq each value last changed in)
+        self._state = {name: (names, [None] * len(names), array("q", [0]) * len(names))
+                       for name, names in keys.items()}
+        self._log = deque(maxlen=LOG_HISTORY)  # (number, message)
+        self._log_count = 0
+        self._frames = {}
+        self._flux_source = None
+        self._alarm_source = None
+
+        self._lock = threading.Lock()
+        self._pending = None
+        self._pending_log = []
+        self._scheduled = False
+        self._ticks = 0
+        self._apply(self._capture(), [])
+
+    # -------- simulator side --------
+
+    def on_event(self, event, payload):
+        if event == "arccs":
+            with self._lock:
+                self._pending_log.append(payload)
+        elif event == "tick":
+            self._ticks += 1
+            if self._ticks % self.every == 0:
+                self._submit(self._capture())
+        elif event in ("changed", "alarm_cleared", "alarm_acknowledged"):
+            self._submit(self._capture())  # commands and ramps, also while the reactor is offline
+
+    def _capture(self):
+        sim, core = self.sim, self.sim.core
+        scalars = [getattr(sim, name) for name in SCALAR_FIELDS[1:]]
+        scalars += [sim.running, sim.startup_in_progress]
+        alarms = bytes(core.alarm_bits)
+        alerts = [sim.alerts[name] for name in ALERT_ORDER]
+        return sim.sim_time, scalars, array("d", core.flux), alarms, alerts, sim.arccs_recommendation
+
+    def _submit(self, capture):
+        # Only the newest capture is kept: a busy loop coalesces ticks
+        with self._lock:
+            self._pending = capture
+            if self._scheduled or self.loop is None:
+                return
+            self._scheduled = True
+        self.loop.call_soon_threadsafe(self._publish)
+
+    # -------- event loop side --------
+
+    def _update(self, name, values):
+        _, current, changed = self._state[name]
+        if values == current:
+            return
+        seq = self.seq
+        for i, value in enumerate(values):
+            if current[i] != value:
+                current[i] = value
+                changed[i] = seq
+
+    def _apply(self, capture, messages):
+        sim_time, scalars, flux, alarms, alerts, recommendation = capture
+        self.sim_time = sim_time
+        self._update("scalars", [round(v, DIGITS) if type(v) is float else v for v in scalars])
+        if flux != self._flux_source:
+            self._flux_source = flux
+            # round() is slow on large cores; flux is never negative
+            self._update("flux", [int(v * SCALE + 0.5) / SCALE for v in flux])
+        if (alarms, alerts) != self._alarm_source:  # alarms rarely change; skip relabelling every rod
+            self._alarm_source = (alarms, alerts)
+            self._update("alarms", [ALARM_LABELS[code & (MODE_MASK | FLASH)] for code in alarms] + alerts)
+        self._update("arccs", [recommendation])
+        for message in messages:
+            self._log.append((self._log_count, message))
+            self._log_count += 1
+
+    def _publish(self):
+        with self._lock:
+            capture, self._pending = self._pending, None
+            messages, self._pending_log = self._pending_log, []
+            self._scheduled = False
+        if capture is None:
+            return
+        self.seq += 1
+        self._apply(capture, messages)
+        self._frames = {}
+        for client in list(self.clients):
+            self._send(client)
+
+    def _log_since(self, seen):
+        oldest = self._log[0][0] if self._log else self._log_count
+        return [message for number, message in self._log if number >= seen], max(0, oldest - seen)
+
+    def _frame(self, channels, since, log_seen, full=False):
+        frame = {"seq": self.seq, "sim_time": round(self.sim_time, DIGITS)}
+        if full:
+            frame["full"] = True
+        elif self.seq - since > 1:
+            frame["skipped"] = self.seq - since - 1
+        data = False
+        for name in CHANNELS:
+            if name not in channels:
+                continue
+            keys, values, changed = self._state[name]
+            if full:
+                values = dict(zip(keys, values))
+            else:
+                values = {keys[i]: values[i] for i, seq in enumerate(changed) if seq > since}
+            if name == "arccs":
+                log, dropped = self._log_since(log_seen)
+                if log:
+                    values["log"] = log
+                if dropped:
+                    values["log_dropped"] = dropped
+            if values:
+                frame[name] = values
+                data = True
+        return frame if data or full else None
+
+    def _send(self, client):
+        if not client.channels:
+            return
+        transport = client.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > self.max_buffer:
+            self.frames_skipped += 1
+            if not client.draining:
+                client.draining = True
+                self.loop.create_task(self._catch_up(client))
+            return
+        key = (client.channels, client.seq, client.log_seen if "arccs" in client.channels else None)
+        if key not in self._frames:
+            # Clients that are equally up to date share one encoded frame
+            frame = self._frame(client.channels, client.seq, client.log_seen)
+            self._frames[key] = frame and (json.dumps(frame, separators=(",", ":")) + "\n").encode("utf-8")
+        data = self._frames[key]
+        if data:
+            transport.write(data)
+        client.seq = self.seq
+        if "arccs" in client.channels:
+            client.log_seen = self._log_count
+
+    async def _catch_up(self, client):
+        # Without this a client skipped on the last frame before the
+        # simulator goes quiet would stay stale
+        try:
+            await client.writer.drain()
+        except ConnectionError:
+            return
+        finally:
+            client.draining = False
+        if client in self.clients:
+            self._send(client)
+
+    def _write(self, client, message):
+        client.writer.write((json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8"))
+
+    def _request(self, client, line):
+        try:
+            action, channels = parse_subscription(line)
+        except ValueError as e:
+            self._write(client, {"error": str(e)})
+            return
+        if action == "unsubscribe":
+            client.channels -= channels
+            return
+        added = channels - client.channels
+        if not added:
+            return
+        if "arccs" in added:
+            client.log_seen = self._log_count
+        if client.seq is None:
+            client.seq = self.seq
+        # Key frame for the new channels; with the recent ARCCS history
+        frame = self._frame(added, self.seq, max(0, self._log_count - LOG_HISTORY), full=True)
+        client.channels |= added
+        self._write(client, frame)
+
+    async def start(self, socket_path=None, tcp_port=None):
+        self.loop = asyncio.get_running_loop()
+        await super().start(socket_path, tcp_port)
+        self.sim.subscribe(self.on_event)
+
+    async def close(self):
+        self.sim.unsubscribe(self.on_event)
+        for client in list(self.clients):
+            client.writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await super().close()
+
+    async def _handle(self, reader, writer):
+        _no_delay(writer)
+        writer.transport.set_write_buffer_limits(high=self.max_buffer)
+        client = FeedClient(writer)
+        self.clients.add(client)
+        self._handlers.add(asyncio.current_task())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                line = line.decode("utf-8", "replace").strip()
+                if line:
+                    self._request(client, line)
+        except (ConnectionError, ValueError):  # ValueError: request line over the read limit
+            pass
+        finally:
+            self.clients.discard(client)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+
+def watch(channels, socket_path=None, tcp_port=None):
+    """Subscribe to ``channels`` and yield the decoded frames"""
+    if tcp_port is not None:
+        sock = socket.create_connection(("127.0.0.1", tcp_port))
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path or default_feed_path())
+    with sock:
+        sock.sendall(f"subscribe {' '.join(channels)}\n".encode("utf-8"))
+        for line in sock.makefile("rb"):
+            yield json.loads(line)
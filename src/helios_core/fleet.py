@@ -0,0 +1,243 @@
+"""Fleet mode: many independent reactor units stepped in one process.
+
+``Fleet`` holds N ``ReactorSimulator`` units on one core layout, seeded
+``seed``, ``seed + 1``, ... like the runs of an ensemble, and steps them
+together; a ``SimClock`` advances a fleet exactly as it does a single
+simulator. The units share the layout, the flux kernel's weight tables
+and the channel pressure offsets, so an extra unit costs little more
+than its state arrays.
+
+With the NumPy backend the per-channel parts of a tick run batched over
+every active unit:
+
+- the absorption product of the flux kernel
+- the drift of the rod temperature offsets
+- the channel problem check behind the core map alarms, which otherwise
+  dominates a tick
+
+The plant scalars, alerts and ARCCS still run per unit. Every unit draws
+its noise from its own seeded streams in the same order as a standalone
+simulator, so a unit evolves exactly like ``ReactorSimulator(seed=s)``.
+Without NumPy the units are stepped one after another.
+"""
+from .kernels import MAX_FLUX, absorption, build_sensor_weights
+from .layout import default_layout
+from .rng import new_seed
+from .simulator import ReactorSimulator
+from .state import FLASH, MODE_CODES, MODE_MASK, PHASE, ReactorCoreState
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional speed-up
+    np = None
+
+RED = MODE_CODES["red"]
+YELLOW = MODE_CODES["yellow"]
+
+
+class Fleet:
+    """``size`` independent units on ``layout``; see the module docstring"""
+
+    def __init__(self, size, layout=None, seed=None, backend="auto"):
+        if size < 1:
+            raise ValueError("a fleet needs at least one unit")
+        self.layout = layout if layout is not None else default_layout()
+        self.seed = new_seed() if seed is None else int(seed)
+        self.units = [ReactorSimulator(ReactorCoreState(self.layout), backend, self.seed + i) for i in range(size)]
+        # Pressure offsets depend on the layout only
+        pressure_offsets = self.units[0]._pressure_offsets
+        for unit in self.units[1:]:
+            unit._pressure_offsets = pressure_offsets
+        self.batch = None
+        if all(unit.kernel.name == "numpy" for unit in self.units):
+            self.batch = FleetBatch(self.layout, self.units[0].kernel, pressure_offsets)
+
+    def __len__(self):
+        return len(self.units)
+
+    def __getitem__(self, index):
+        return self.units[index]
+
+    def __iter__(self):
+        return iter(self.units)
+
+    def step(self, dt=1.0):
+        """Advance every unit by ``dt`` simulated seconds; returns the
+        number of units whose physics ran"""
+        if self.batch is None:
+            return sum(1 for unit in self.units if unit.step(dt))
+
+        active = [unit for unit in self.units if unit.advance_time(dt)]
+        if not active:
+            return 0
+        # The phases of ReactorSimulator.step, each over all active units
+        self.batch.neutron_flux(active)
+        for unit in active:
+            unit.update_plant(dt)
+        self.batch.drift_rod_offsets(active)
+        self.batch.check_rod_problems(active)
+        for unit in active:
+            unit._emit("tick", unit)
+        return len(active)
+
+    def status(self):
+        """One summary dict per unit"""
+        rows = []
+        for number, unit in enumerate(self.units, 1):
+            state = "running" if unit.running else "startup" if unit.startup_in_progress else "offline"
+            rows.append({
+                "unit": number,
+                "seed": unit.rng.seed,
+                "state": state,
+                "sim_time": unit.sim_time,
+                "power": unit.core_power,
+                "temp": unit.coolant_temp_avg,
+                "pressure": unit.pressure,
+                "integrity": unit.integrity,
+                "alerts": [name for name, on in unit.alerts.items() if on],
+                "alarms": sum(1 for code in unit.core.alarm_bits if code & MODE_MASK),
+            })
+        return rows
+
+
+def format_status(rows):
+    lines = [f"{'unit':>4}  {'state':<8} {'power':>6} {'temp':>7} {'pressure':>9} {'integrity':>9} "
+             f"{'alarms':>6}  alerts"]
+    for row in rows:
+        lines.append(f"{row['unit']:>4}  {row['state']:<8} {row['power']:5.1f}% {row['temp']:6.1f}K "
+                     f"{row['pressure']:5.1f} bar {row['integrity']:8.2f}% {row['alarms']:>6}  "
+                     f"{', '.join(row['alerts']) or '-'}")
+    return "\n".join(lines)
+
+
+class FleetBatch:
+    """NumPy versions of the per-channel tick phases, batched over units
+    of one layout; results are identical to the per-unit methods"""
+
+    def __init__(self, layout, kernel, pressure_offsets):
+        self.layout = layout
+        self.index = kernel.index
+        self.weights = kernel.weights
+        self.rods = list(layout.rod_to_letter)  # alarm and temperature offset order
+        self.fuel_positions = np.array([layout.rod_index[num] for num in layout.fuel_rods], dtype=np.intp)
+        self.is_fuel = np.array([layout.rod_to_letter[num] == "F" for num in self.rods])
+        self.pressure_offsets = np.array([pressure_offsets[num] for num in self.rods])
+        self._sensor_tables = {}  # sensors with a reading -> interpolation arrays
+
+    def neutron_flux(self, units):
+        """``NumpyKernel.neutron_flux`` of every unit"""
+        insertion = np.stack([np.frombuffer(unit.core.insertion) for unit in units])
+        rows = absorption(insertion, self.index, self.weights)
+        for unit, row in zip(units, rows):
+            kernel = unit.kernel
+            fuel = kernel.fuel
+            fuel[:] = np.frombuffer(unit.core.fuel)
+            flux = (fuel / 100.0) * row
+            # Noise from the unit's own stream, fuelled rods in rod order
+            fuelled = fuel >= 1
+            uniform = kernel.rng.uniform
+            flux[fuelled] *= [uniform(0.97, 1.03) for _ in range(int(fuelled.sum()))]
+            flux[~fuelled] = 0.0
+            np.clip(flux, 0.0, MAX_FLUX, out=kernel.flux)
+            np.frombuffer(unit.core.flux)[:] = kernel.flux
+
+    def drift_rod_offsets(self, units):
+        """``ReactorSimulator.drift_rod_offsets`` of every unit"""
+        count = len(self.rods)
+        for unit in units:
+            draw = unit.rng.rod_offsets.random
+            offsets = np.frombuffer(unit.core.temp_offsets)
+            # uniform(-0.5, 0.5) is -0.5 + 1.0 * random(), rounded the same way
+            noise = -0.5 + 1.0 * np.array([draw() for _ in range(count)])
+            np.clip(offsets + noise, -10, 10, out=offsets)
+
+    def _sensor_table(self, sensors):
+        table = self._sensor_tables.get(sensors)
+        if table is not None:
+            return table
+        order = sorted(sensors)
+        position = {num: j for j, num in enumerate(order)}
+        weights = build_sensor_weights(self.layout, sensors)
+        count = len(self.rods)
+        index = np.zeros((count, 3), dtype=np.intp)
+        factor = np.zeros((count, 3))
+        weighted = np.zeros(count, dtype=bool)
+        readings = []  # (rod position, sensor position) of T rods reporting their own reading
+        for i, num in enumerate(self.rods):
+            if self.layout.rod_to_letter[num] == "T" and num in sensors:
+                readings.append((i, position[num]))
+                continue
+            entries = weights.get(num)
+            if entries:
+                weighted[i] = True
+                for k, (sensor, weight) in enumerate(entries):
+                    index[i, k] = position[sensor]
+                    factor[i, k] = weight
+        table = self._sensor_tables[sensors] = (order, index, factor, weighted,
+                                                np.array([i for i, _ in readings], dtype=np.intp),
+                                                np.array([j for _, j in readings], dtype=np.intp))
+        return table
+
+    def rod_temperatures(self, units):
+        """``calculate_rod_temperature`` of every rod of every unit, shape (units, rods)"""
+        temperatures = np.empty((len(units), len(self.rods)))
+        groups = {}
+        for k, unit in enumerate(units):
+            groups.setdefault(frozenset(unit.temperatures), []).append(k)
+        for sensors, rows in groups.items():
+            order, index, factor, weighted, reading_rods, reading_sensors = self._sensor_table(sensors)
+            values = np.array([[units[k].temperatures[num] for num in order] for k in rows], dtype=float)
+            values = values.reshape(len(rows), len(order))
+            block = np.repeat(np.array([units[k].coolant_temp_avg for k in rows])[:, None], len(self.rods), axis=1)
+            if weighted.any():
+                picked = values[:, index[weighted]] * factor[weighted]
+                offsets = np.stack([np.frombuffer(units[k].core.temp_offsets) for k in rows])
+                # Summed left to right like the scalar version
+                block[:, weighted] = (picked[..., 0] + picked[..., 1] + picked[..., 2]) + offsets[:, weighted]
+            if len(reading_rods):
+                block[:, reading_rods] = values[:, reading_sensors]
+            temperatures[rows] = block
+        return temperatures
+
+    def check_rod_problems(self, units):
+        """``ReactorSimulator.check_rod_problems`` of every unit"""
+        running = []
+        for unit in units:
+            if unit.running:
+                running.append(unit)
+                continue
+            # Turn off all flashing when not running
+            bits = np.frombuffer(unit.core.alarm_bits, dtype=np.uint8)
+            for i in np.flatnonzero(bits & FLASH).tolist():
+                unit._clear_alarm(self.rods[i])
+        if not running:
+            return
+
+        count = len(self.rods)
+        temperature = self.rod_temperatures(running)
+        draws = [unit.rng.rod_pressure.random for unit in running]
+        noise = -0.5 + 1.0 * np.array([[draw() for _ in range(count)] for draw in draws])
+        pressure = (np.array([unit.pressure for unit in running])[:, None] + self.pressure_offsets) + noise
+        flux = np.zeros((len(running), count))
+        flux[:, self.fuel_positions] = np.stack([np.frombuffer(unit.core.flux) for unit in running])
+        fuel = np.full((len(running), count), 100.0)
+        fuel[:, self.fuel_positions] = np.stack([np.frombuffer(unit.core.fuel) for unit in running])
+
+        critical = (temperature > 600) | (pressure > 165) | (flux > 2.5) | (self.is_fuel & (fuel < 15))
+        problem = ~critical & ((temperature > 550) | (pressure > 160) | (flux > 2.0) | (self.is_fuel & (fuel < 30)))
+
+        bits = np.stack([np.frombuffer(unit.core.alarm_bits, dtype=np.uint8) for unit in running])
+        mode = bits & MODE_MASK
+        flashing = (bits & FLASH) != 0
+        to_red = critical & ((mode != RED) | ~flashing)
+        to_yellow = problem & ((mode != YELLOW) | ~flashing)
+        to_clear = ~critical & ~problem & flashing
+        changed = (to_red | to_yellow | to_clear).any(axis=1)
+        for k in np.flatnonzero(changed).tolist():
+            unit = running[k]
+            row = bits[k]
+            kept = row & PHASE
+            row = np.where(to_red[k], kept | RED | FLASH, np.where(to_yellow[k], kept | YELLOW | FLASH, row))
+            np.frombuffer(unit.core.alarm_bits, dtype=np.uint8)[:] = row
+            for i in np.flatnonzero(to_clear[k]).tolist():
+                unit._clear_alarm(self.rods[i])
@@ -0,0 +1,59 @@
+"""Precomputed colour ramps for the per-rod indicator boxes.
+
+Each ramp is a list of ``(fill, text_colour)`` pairs indexed by the gauge
+value normalized to 0-1 and quantized to ``COLOR_STEPS`` levels, so the
+render loop never parses or formats a hex colour.
+"""
+
+COLOR_STEPS = 64  # gauge colours are quantized to this many levels
+
+BLUE = "#0055cc"
+GREEN = "#00aa00"
+AMBER = "#ffcc00"
+RED = "#ff0000"
+EMPTY = ("#1a1a1a", "#666")  # fuel box of an empty or non-fuel channel
+
+
+def lerp_color(color1, color2, t):
+    """Linearly interpolate between two hex colors"""
+    r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
+    r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
+
+    r = int(r1 + (r2 - r1) * t)
+    g = int(g1 + (g2 - g1) * t)
+    b = int(b1 + (b2 - b1) * t)
+
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _three_stop(low, norm):
+    """low -> amber -> red with contrasting text, as used by temp, pressure and flux"""
+    if norm < 0.5:
+        return lerp_color(low, AMBER, norm * 2), "black" if norm > 0.3 else "white"
+    return lerp_color(AMBER, RED, (norm - 0.5) * 2), "black" if norm < 0.7 else "white"
+
+
+def _fuel(norm):
+    """red -> amber below half a load, amber -> green above"""
+    if norm > 0.5:
+        return lerp_color(AMBER, GREEN, (norm - 0.5) * 2), "black"
+    return lerp_color(RED, AMBER, norm * 2), "white" if norm < 0.25 else "black"
+
+
+def build_ramp(colour_fn, steps=COLOR_STEPS):
+    return [colour_fn(i / steps) for i in range(steps + 1)]
+
+
+TEMP_RAMP = build_ramp(lambda norm: _three_stop(BLUE, norm))  # 250K-700K
+PRESSURE_RAMP = build_ramp(lambda norm: _three_stop(GREEN, norm))  # 90-170 bar
+FLUX_RAMP = build_ramp(lambda norm: _three_stop(BLUE, norm))  # 0-3x
+FUEL_RAMP = build_ramp(_fuel)  # 0-100%
+
+
+def lookup(ramp, norm):
+    """``(fill, text_colour)`` for a normalized gauge value, clamped to 0-1"""
+    if norm <= 0.0:
+        return ramp[0]
+    if norm >= 1.0:
+        return ramp[-1]
+    return ramp[int(norm * COLOR_STEPS + 0.5)]
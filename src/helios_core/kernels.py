@@ -0,0 +1,227 @@
+"""Per-tick flux and fuel kernels used by ReactorSimulator.
+
+Two interchangeable backends are provided. ``PythonKernel`` walks the
+sparse influence table with plain floats and is always available.
+``NumpyKernel`` keeps fuel, insertion and flux in contiguous arrays and
+evaluates absorption as ``prod(1 - insertion * W)`` over the influence
+table padded to a fixed number of control rods per fuel rod, multiplied
+in the same order as the Python kernel; it is only available when NumPy
+is installed.
+
+Both kernels draw their noise from the ``rng`` they are given (the
+simulator's ``flux`` stream) in the same order, so a fixed seed produces
+the same results on either backend.
+"""
+import random
+import weakref
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional speed-up
+    np = None
+
+INFLUENCE_RADIUS = 4  # Extended range for more realistic physics
+ABSORPTION_STRENGTH = 0.45
+FUEL_BURN_RATE = 0.00008  # Slow realistic fuel depletion
+MAX_FLUX = 3.5
+
+# layout -> (influence table, padded arrays); shared by every kernel of a layout
+_TABLES = weakref.WeakKeyDictionary()
+
+
+def build_influence_table(layout, radius=INFLUENCE_RADIUS):
+    """Precompute which control rods absorb neutrons at each fuel rod.
+
+    Returns ``{fuel_rod: [(control_rod, weight), ...]}`` holding only the
+    pairs closer than ``radius``, in rod-number order. ``weight`` is the
+    absorption of that control rod when fully inserted. ``radius`` cannot
+    exceed the layout's ``NEIGHBOUR_RADIUS``.
+    """
+    table = {}
+    for fuel_num, neighbours in layout.control_neighbours.items():
+        # Absorption falls off with distance from the control rod
+        table[fuel_num] = [(check_num, 1.0 / (dist + 0.2) * ABSORPTION_STRENGTH)
+                           for check_num, dist in neighbours if dist < radius]
+    return table
+
+
+def build_sensor_weights(layout, sensors, nearest=3):
+    """Precompute inverse-distance interpolation weights for every rod.
+
+    Returns ``{rod: [(sensor_rod, weight), ...]}`` over the ``nearest``
+    temperature sensors in ``sensors``, with weights normalized to sum to
+    one. Returns an empty dict when no sensor has a reading.
+    """
+    if not any(num in sensors for num in layout.sensors):
+        return {}
+
+    table = {}
+    for rod_num in layout.rod_to_pos:
+        # Nearest few sensors holding a reading, sorted by distance
+        nearest_sensors = layout.nearest_sensors(rod_num, sensors, nearest)
+
+        # Weighted average by inverse distance
+        weights = [1.0 / (d + 0.1) for d, _ in nearest_sensors]
+        total_weight = sum(weights)
+        table[rod_num] = [(num, w / total_weight) for (_, num), w in zip(nearest_sensors, weights)]
+    return table
+
+
+def _shared_tables(layout, padded):
+    """The influence table of ``layout`` and, if ``padded``, its
+    ``(control index, weight)`` arrays of shape (fuel rods, max
+    neighbours), built once per layout"""
+    influence, arrays = _TABLES.get(layout, (None, None))
+    if influence is None:
+        influence = build_influence_table(layout)
+    if padded and arrays is None:
+        # Missing neighbours get weight 0, an exact factor of 1.0
+        control_index = {num: i for i, num in enumerate(layout.control_rods)}
+        width = max((len(pairs) for pairs in influence.values()), default=0)
+        index = np.zeros((len(layout.fuel_rods), width), dtype=np.intp)
+        weights = np.zeros((len(layout.fuel_rods), width))
+        for i, fuel_num in enumerate(layout.fuel_rods):
+            for k, (check_num, weight) in enumerate(influence[fuel_num]):
+                index[i, k] = control_index[check_num]
+                weights[i, k] = weight
+        index.flags.writeable = weights.flags.writeable = False  # shared between simulators
+        arrays = (index, weights)
+    _TABLES[layout] = (influence, arrays)
+    return influence, arrays
+
+
+class PythonKernel:
+    """Pure-Python kernel over the sparse influence table"""
+
+    name = "python"
+
+    def __init__(self, layout, rng=None):
+        self.influence = _shared_tables(layout, False)[0]
+        self.rng = rng if rng is not None else random.Random()
+
+    def neutron_flux(self, fuel_levels, control_rod_levels, out):
+        """Write the neutron flux of every fuel rod into ``out``"""
+        out.clear()
+        influence = self.influence
+        uniform = self.rng.uniform
+        for rod_num, fuel_level in fuel_levels.items():
+            # Fuel level affects maximum possible flux
+            if fuel_level < 1:
+                out[rod_num] = 0.0
+                continue
+
+            # Start with base flux proportional to remaining fuel
+            base_flux = 1.0 * (fuel_level / 100.0)
+
+            # Nearby control rods REDUCE flux when inserted
+            flux_multiplier = 1.0
+            for check_num, weight in influence.get(rod_num, ()):
+                # Get insertion level (0 = withdrawn, 100 = fully inserted)
+                insertion = control_rod_levels.get(check_num, 100)
+                # More insertion = more neutron absorption = less flux
+                flux_multiplier *= (1.0 - (insertion / 100.0) * weight)
+
+            # Add small randomness for realistic variation
+            flux = base_flux * flux_multiplier * uniform(0.97, 1.03)
+
+            # Clamp to reasonable range
+            out[rod_num] = max(0.0, min(MAX_FLUX, flux))
+
+    def total_flux(self, neutron_flux):
+        return sum(neutron_flux.values())
+
+    def deplete_fuel(self, fuel_levels, neutron_flux, dt=1.0):
+        """Burn fuel in each rod proportionally to its local neutron flux"""
+        for fuel_num in fuel_levels:
+            consumption = neutron_flux.get(fuel_num, 0.0) * FUEL_BURN_RATE * dt
+            fuel_levels[fuel_num] = max(0, fuel_levels[fuel_num] - consumption)
+
+
+class NumpyKernel(PythonKernel):
+    """Vectorized kernel keeping fuel, insertion and flux in NumPy arrays"""
+
+    name = "numpy"
+
+    def __init__(self, layout, rng=None):
+        if np is None:
+            raise RuntimeError("NumPy is not installed")
+        super().__init__(layout, rng)
+        self.fuel_rods = layout.fuel_rods  # same order as the influence table
+        self.control_rods = layout.control_rods
+        self.influence, (self.index, self.weights) = _shared_tables(layout, True)
+
+        self.fuel = np.full(len(self.fuel_rods), 100.0)
+        self.insertion = np.full(len(self.control_rods), 100.0)
+        self.flux = np.zeros(len(self.fuel_rods))
+
+    def neutron_flux(self, fuel_levels, control_rod_levels, out):
+        fuel = self.fuel
+        fuel[:] = _column(fuel_levels, self.fuel_rods, 100.0)
+        self.insertion[:] = _column(control_rod_levels, self.control_rods, 100)
+
+        flux = (fuel / 100.0) * absorption(self.insertion, self.index, self.weights)
+
+        # Noise is drawn only for fuelled rods, in rod order, like the Python kernel
+        fuelled = fuel >= 1
+        uniform = self.rng.uniform
+        flux[fuelled] *= [uniform(0.97, 1.03) for _ in range(int(fuelled.sum()))]
+        flux[~fuelled] = 0.0
+        np.clip(flux, 0.0, MAX_FLUX, out=self.flux)
+        _store(out, self.fuel_rods, self.flux)
+
+    def total_flux(self, neutron_flux):
+        # Sequential like PythonKernel; ndarray.sum() sums pairwise and
+        # rounds differently
+        return sum(self.flux.tolist()) if neutron_flux else 0.0
+
+    def deplete_fuel(self, fuel_levels, neutron_flux, dt=1.0):
+        self.fuel[:] = _column(fuel_levels, self.fuel_rods, 100.0)
+        np.maximum(0.0, self.fuel - self.flux * FUEL_BURN_RATE * dt, out=self.fuel)
+        _store(fuel_levels, self.fuel_rods, self.fuel)
+
+
+def absorption(insertion, index, weights):
+    """Product of ``1 - insertion / 100 * weight`` over the padded
+    influence arrays, per fuel rod. ``insertion`` may carry leading axes
+    (e.g. one row per reactor) and the result has the same ones."""
+    insertion = insertion / 100.0
+    result = np.ones(insertion.shape[:-1] + index.shape[:1])
+    # Column by column, like the Python kernel's loop over the neighbours
+    for k in range(index.shape[1]):
+        result *= 1.0 - insertion[..., index[:, k]] * weights[:, k]
+    return result
+
+
+def _column(mapping, rods, default):
+    """Values of ``mapping`` in ``rods`` order; zero-copy for state columns"""
+    if getattr(mapping, "rods", None) is rods:
+        return np.frombuffer(mapping.data)
+    return [mapping.get(num, default) for num in rods]
+
+
+def _store(mapping, rods, values):
+    """Write ``values`` (in ``rods`` order) back into ``mapping``"""
+    if getattr(mapping, "rods", None) is rods:
+        np.frombuffer(mapping.data)[:] = values
+        return
+    mapping.clear()
+    mapping.update(zip(rods, values.tolist()))
+
+
+def numpy_available():
+    return np is not None
+
+
+def make_kernel(layout, backend="auto", rng=None):
+    """Create a flux kernel for ``layout``: ``"python"``, ``"numpy"`` or ``"auto"``.
+
+    ``"auto"`` selects NumPy when it is installed and falls back to the
+    pure-Python kernel otherwise.
+    """
+    if backend == "auto":
+        backend = "numpy" if numpy_available() else "python"
+    if backend == "numpy":
+        return NumpyKernel(layout, rng)
+    if backend == "python":
+        return PythonKernel(layout, rng)
+    raise ValueError(f"Unknown backend: {backend}")
@@ -0,0 +1,228 @@
+"""Core layouts: loading, compiling and caching.
+
+A layout is a grid of rod type letters (see ``ROD_TYPES``) with ``P`` or
+``.`` marking empty positions. Two file formats are accepted:
+
+- text: one grid row per line, cells either run together (``PPRGGR``) or
+  separated by spaces; blank lines and ``#`` comments are ignored
+- JSON: ``{"name": "...", "grid": ["PPRGGR", ...]}`` where each row is a
+  string or a list of letters
+
+``compile_layout`` turns a grid into a ``CoreLayout`` holding the rod
+number, position and type indexes, the neighbour tables the physics needs,
+the centre of mass and sensor buckets for nearest-sensor searches.
+Compiling is linear in the number of channels, and ``load_layout``
+additionally caches the compiled layout on disk keyed by the file's
+SHA-256, so large cores load without recompiling.
+"""
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+from .reactor_data import CONTROL_RODS, GRID_LETTERS, ROD_TYPES
+
+LAYOUT_VERSION = 3  # bump when CoreLayout changes shape; invalidates the cache
+NEIGHBOUR_RADIUS = 4  # control rods farther than this never influence a fuel rod
+SENSOR_BUCKET = 8  # side of the grid squares sensors are bucketed in for nearest-sensor searches
+CACHE_ENV = "HELIOS_CACHE_DIR"
+
+
+class LayoutError(ValueError):
+    """A layout file could not be parsed"""
+
+
+class CoreLayout:
+    """Compiled core layout with rod indexes and neighbour tables"""
+
+    def __init__(self, grid, name="custom"):
+        rows = ["".join(row).replace(".", "P") for row in grid]
+        self.name = name
+        self.rows = len(rows)
+        self.cols = max((len(row) for row in rows), default=0)
+        self.grid = tuple(row.ljust(self.cols, "P") for row in rows)
+
+        # Rods are numbered row by row, skipping empty positions
+        self.rod_to_pos = {}
+        self.rod_to_letter = {}
+        number = 1
+        for r, row in enumerate(self.grid):
+            for c, letter in enumerate(row):
+                if letter == "P":
+                    continue
+                if letter not in ROD_TYPES:
+                    raise LayoutError(f"Unknown rod type {letter!r} at row {r + 1}, column {c + 1}")
+                self.rod_to_pos[number] = (r, c)
+                self.rod_to_letter[number] = letter
+                number += 1
+        self._index()
+
+    @classmethod
+    def from_positions(cls, rod_to_pos, rod_to_letter, name="custom"):
+        """Layout keeping an existing rod numbering"""
+        layout = cls.__new__(cls)
+        layout.name = name
+        layout.rows = max((r for r, _ in rod_to_pos.values()), default=-1) + 1
+        layout.cols = max((c for _, c in rod_to_pos.values()), default=-1) + 1
+        cells = [["P"] * layout.cols for _ in range(layout.rows)]
+        for number, (r, c) in rod_to_pos.items():
+            cells[r][c] = rod_to_letter[number]
+        layout.grid = tuple("".join(row) for row in cells)
+        layout.rod_to_pos = dict(rod_to_pos)
+        layout.rod_to_letter = dict(rod_to_letter)
+        layout._index()
+        return layout
+
+    def _index(self):
+        self.pos_to_rod = {pos: number for number, pos in self.rod_to_pos.items()}
+        self.rods_by_type = {letter: [] for letter in ROD_TYPES if letter != "P"}
+        for number, letter in self.rod_to_letter.items():
+            self.rods_by_type[letter].append(number)
+
+        self.control_rods = [num for num, letter in self.rod_to_letter.items() if letter in CONTROL_RODS]
+        self.fuel_rods = self.rods_by_type["F"]
+        self.sensors = self.rods_by_type["T"]
+
+        # Dense indices into the per-channel state columns
+        self.rod_index = {num: i for i, num in enumerate(self.rod_to_letter)}
+        self.control_index = {num: i for i, num in enumerate(self.control_rods)}
+        self.fuel_index = {num: i for i, num in enumerate(self.fuel_rods)}
+
+        # Centre of mass of all channels
+        count = max(len(self.rod_to_pos), 1)
+        self.centre = (sum(r for r, _ in self.rod_to_pos.values()) / count,
+                       sum(c for _, c in self.rod_to_pos.values()) / count)
+
+        self.control_neighbours = self._control_neighbours(NEIGHBOUR_RADIUS)
+        self.sensor_buckets = self._sensor_buckets()
+
+    def __len__(self):
+        return len(self.rod_to_pos)
+
+    def _control_neighbours(self, radius):
+        """``{fuel_rod: [(control_rod, distance), ...]}`` within ``radius``,
+        in rod-number order, found by scanning a window around each rod"""
+        span = int(radius)
+        pos_to_rod = self.pos_to_rod
+        rod_to_letter = self.rod_to_letter
+        table = {}
+        for fuel_num in self.fuel_rods:
+            r, c = self.rod_to_pos[fuel_num]
+            neighbours = []
+            for check_r in range(r - span, r + span + 1):
+                for check_c in range(c - span, c + span + 1):
+                    check_num = pos_to_rod.get((check_r, check_c))
+                    if check_num is None or rod_to_letter[check_num] not in CONTROL_RODS:
+                        continue
+                    dist = ((r - check_r) ** 2 + (c - check_c) ** 2) ** 0.5
+                    if dist < radius:
+                        neighbours.append((check_num, dist))
+            neighbours.sort()
+            table[fuel_num] = neighbours
+        return table
+
+    def _sensor_buckets(self):
+        """``{(row, col) // SENSOR_BUCKET: [(order, sensor_rod, r, c), ...]}``"""
+        buckets = {}
+        for order, num in enumerate(self.sensors):
+            r, c = self.rod_to_pos[num]
+            buckets.setdefault((r // SENSOR_BUCKET, c // SENSOR_BUCKET), []).append((order, num, r, c))
+        return buckets
+
+    def nearest_sensors(self, rod_num, sensors, count):
+        """``[(distance, sensor_rod), ...]`` for the ``count`` sensors in
+        ``sensors`` nearest to ``rod_num``, nearest first (ties in sensor
+        order). Searches rings of buckets outwards, so the cost depends on
+        the sensor spacing rather than the number of sensors."""
+        r, c = self.rod_to_pos[rod_num]
+        br, bc = r // SENSOR_BUCKET, c // SENSOR_BUCKET
+        last = max(self.rows, self.cols) // SENSOR_BUCKET + 1
+        found = []
+        for ring in range(last + 1):
+            for check_r in range(br - ring, br + ring + 1):
+                edge = check_r in (br - ring, br + ring)
+                for check_c in range(bc - ring, bc + ring + 1) if edge else (bc - ring, bc + ring):
+                    for order, num, sr, sc in self.sensor_buckets.get((check_r, check_c), ()):
+                        if num in sensors:
+                            found.append((((r - sr) ** 2 + (c - sc) ** 2) ** 0.5, order, num))
+            # Sensors beyond this ring are more than ring * SENSOR_BUCKET away
+            if sum(1 for d, _, _ in found if d <= ring * SENSOR_BUCKET) >= count:
+                break
+        found.sort()
+        return [(d, num) for d, _, num in found[:count]]
+
+
+def compile_layout(grid, name="custom"):
+    return CoreLayout(grid, name)
+
+
+_default_layout = None
+
+
+def default_layout():
+    """The shipped 13x13 ``GRID_LETTERS`` core, compiled once per process"""
+    global _default_layout
+    if _default_layout is None:
+        _default_layout = CoreLayout(GRID_LETTERS, name="default")
+    return _default_layout
+
+
+def parse_layout(text, name="custom"):
+    """Parse layout file contents (text grid or JSON) into grid rows"""
+    stripped = text.lstrip()
+    if stripped.startswith(("{", "[")):
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise LayoutError(f"Invalid JSON layout: {e}") from e
+        if not isinstance(data, dict) or not isinstance(data.get("grid"), list):
+            raise LayoutError("JSON layout needs to be an object with a 'grid' list of rows")
+        try:
+            return str(data.get("name", name)), ["".join(row) for row in data["grid"]]
+        except TypeError:
+            raise LayoutError("JSON layout rows must be strings or lists of letters") from None
+
+    rows = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            rows.append(line.replace(" ", "").upper())
+    return name, rows
+
+
+def cache_dir():
+    if os.environ.get(CACHE_ENV):
+        return Path(os.environ[CACHE_ENV])
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "helios-core" / "layouts"
+
+
+def load_layout(path, use_cache=True):
+    """Load and compile the layout file at ``path``, using the disk cache"""
+    path = Path(path)
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    cache_file = cache_dir() / f"{digest}-v{LAYOUT_VERSION}.pickle"
+
+    if use_cache:
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass  # missing or stale cache entry - recompile
+
+    name, grid = parse_layout(data.decode("utf-8"), name=path.stem)
+    if not grid:
+        raise LayoutError(f"{path} contains no grid rows")
+    layout = CoreLayout(grid, name)
+
+    if use_cache:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(layout, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass  # the cache is only an optimization
+    return layout
@@ -0,0 +1,499 @@
+"""Run the physics in a separate process and share its state with the frontend.
+
+``PhysicsProcess`` starts a child process that owns the ``ReactorSimulator``
+and paces it with its own ``SimClock``, so redraws, dialogs and slow
+terminals in the frontend never delay a physics step. After each group of
+steps the child publishes the state into a ``multiprocessing.shared_memory``
+block; the frontend reads the newest frame at its own refresh rate.
+
+Shared memory layout (little endian)::
+
+    header   HEADER struct, then the number of the latest frame (uint64)
+    slots    2 x slot_size bytes, frame n in slot n % 2
+
+A slot holds a seqlock counter (uint64), a ``telemetry`` frame, the rod
+temperature offsets and a JSON block with the small non-array state
+(sensor temperatures, pumps, ARCCS recommendation, custom texts). The
+writer makes the counter odd while it writes a slot and even again when
+done, then advances the latest frame number. Frames alternate between the
+two slots, so a reader copying the latest frame only has to retry if the
+writer completed two further frames meanwhile; it never blocks the writer.
+
+Operator commands go to the child over a pipe and run between physics
+steps; console, ARCCS and alarm events come back on a queue. The child
+also hosts the command server, telemetry feed and recorder when asked, so
+they see the physics at full rate.
+
+``RemoteSimulator`` is a mirror of the child's simulator for the frontend:
+reading works as usual, commands are forwarded, and ``FrameClock`` takes
+the place of the frontend's ``SimClock`` to pull frames instead of
+stepping physics.
+"""
+import asyncio
+import json
+import multiprocessing
+import queue
+import struct
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from .clock import SimClock
+from .layout import compile_layout
+from .simulator import ReactorSimulator
+from .state import FLASH, PHASE, ReactorCoreState
+from .telemetry import (ALERT_ORDER, SCALAR_FIELDS, TelemetryRecorder, _align, frame_layout, read_frame,
+                        write_frame)
+
+MAGIC = b"HELIOSSM"
+VERSION = 1
+
+# magic, version, slots, slot size, fuel rods, control rods, channels
+HEADER = struct.Struct("<8sHHIIII")
+LATEST = struct.Struct("<Q")  # number of the newest complete frame, 0 before the first
+LATEST_OFFSET = _align(HEADER.size)
+SEQ = struct.Struct("<Q")     # seqlock counter at the start of each slot
+EXTRAS_LEN = struct.Struct("<I")
+EXTRAS_SIZE = 256 * 1024      # bytes reserved for the JSON block
+SLOTS = 2
+HEADER_SIZE = _align(LATEST_OFFSET + LATEST.size)
+
+REFRESH_HZ = 30          # frames a frontend pulls per second
+READ_RETRIES = 8
+STARTUP_TIMEOUT = 30.0   # seconds to wait for the child to build its simulator
+FORWARDED_EVENTS = ("console", "arccs", "alarm_cleared", "alarm_acknowledged", "restored")
+
+
+def slot_layout(n_fuel, n_control, n_rods):
+    """Byte offsets of the parts of a slot and the slot size"""
+    sections = frame_layout(n_fuel, n_control, n_rods)
+    offsets = SEQ.size + sections["size"]
+    extras = offsets + 8 * n_rods
+    return {"frame": SEQ.size, "sections": sections, "offsets": offsets, "extras": extras,
+            "fixed": extras + EXTRAS_LEN.size, "size": _align(extras + EXTRAS_LEN.size + EXTRAS_SIZE)}
+
+
+class SharedFrame:
+    """The double-buffered frame block of one core layout; see the module
+    docstring. Create it with ``create`` (writer) or ``attach`` (reader)."""
+
+    def __init__(self, shm, n_fuel, n_control, n_rods):
+        self.shm = shm
+        self.buf = shm.buf
+        self.name = shm.name
+        self.n_fuel = n_fuel
+        self.n_control = n_control
+        self.n_rods = n_rods
+        self.slot = slot_layout(n_fuel, n_control, n_rods)
+        self.sections = self.slot["sections"]
+        self.count = 0
+
+    @classmethod
+    def create(cls, layout):
+        n_fuel, n_control, n_rods = len(layout.fuel_rods), len(layout.control_rods), len(layout)
+        slot_size = slot_layout(n_fuel, n_control, n_rods)["size"]
+        shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + SLOTS * slot_size)
+        HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, SLOTS, slot_size, n_fuel, n_control, n_rods)
+        LATEST.pack_into(shm.buf, LATEST_OFFSET, 0)
+        return cls(shm, n_fuel, n_control, n_rods)
+
+    @classmethod
+    def attach(cls, name):
+        shm = _attach(name)
+        magic, version, slots, slot_size, n_fuel, n_control, n_rods = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != VERSION or slots != SLOTS:
+            shm.close()
+            raise ValueError(f"shared memory {name!r} is not a version {VERSION} physics frame block")
+        frame = cls(shm, n_fuel, n_control, n_rods)
+        frame.count = LATEST.unpack_from(shm.buf, LATEST_OFFSET)[0]
+        return frame
+
+    def _slot(self, count):
+        return HEADER_SIZE + (count % SLOTS) * self.slot["size"]
+
+    def publish(self, sim):
+        """Write the state of ``sim`` as the next frame"""
+        buf = self.buf
+        count = self.count + 1
+        base = self._slot(count)
+        seq = SEQ.unpack_from(buf, base)[0] + 1
+        SEQ.pack_into(buf, base, seq)  # odd: slot being written
+        slot = self.slot
+        write_frame(buf, base + slot["frame"], self.sections, sim, count)
+        offset = base + slot["offsets"]
+        buf[offset:offset + 8 * self.n_rods] = memoryview(sim.core.temp_offsets).cast("B")
+        extras = _encode_extras(sim)
+        EXTRAS_LEN.pack_into(buf, base + slot["extras"], len(extras))
+        offset = base + slot["fixed"]
+        buf[offset:offset + len(extras)] = extras
+        SEQ.pack_into(buf, base, seq + 1)
+        LATEST.pack_into(buf, LATEST_OFFSET, count)
+        self.count = count
+
+    def read(self, since=0):
+        """The newest frame as a dict, or None if there is none newer than
+        ``since`` (or the writer kept overwriting it)"""
+        buf, slot = self.buf, self.slot
+        fixed = slot["fixed"]
+        for _ in range(READ_RETRIES):
+            count = LATEST.unpack_from(buf, LATEST_OFFSET)[0]
+            if count == since:
+                return None
+            base = self._slot(count)
+            seq = SEQ.unpack_from(buf, base)[0]
+            if seq & 1:
+                continue
+            # Copy first, parse once the copy is known to be consistent
+            data = bytes(buf[base:base + fixed])
+            length = min(EXTRAS_LEN.unpack_from(data, slot["extras"])[0], EXTRAS_SIZE)
+            extras = bytes(buf[base + fixed:base + fixed + length])
+            if SEQ.unpack_from(buf, base)[0] != seq:
+                continue
+            frame = read_frame(data, slot["frame"], self.sections, self.n_fuel, self.n_control, self.n_rods)
+            frame["count"] = count
+            frame["temp_offsets"] = array("d", data[slot["offsets"]:slot["extras"]])
+            frame.update(json.loads(extras))
+            return frame
+        return None
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _attach(name):
+    # The creating process owns the block and unlinks it
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13: the spawned child shares our resource tracker, which keeps one entry per name
+        return shared_memory.SharedMemory(name=name)
+
+
+def _encode_extras(sim):
+    extras = {
+        "temperatures": list(sim.temperatures.items()),
+        "pump_flow": list(sim.pump_flow.items()),
+        "pump_status": list(sim.pump_status.items()),
+        "arccs_recommendation": sim.arccs_recommendation,
+        "arccs_commands": sim.arccs_commands,
+        "custom_text": list(sim.core.custom_text.items()),
+    }
+    data = json.dumps(extras, separators=(",", ":")).encode("utf-8")
+    if len(data) > EXTRAS_SIZE:
+        # Only operator texts are unbounded; drop them rather than the frame
+        extras["custom_text"] = []
+        data = json.dumps(extras, separators=(",", ":")).encode("utf-8")
+    return data
+
+
+class FramePublisher:
+    """Child side: publishes a frame after anything changed and forwards
+    the frontend's events"""
+
+    def __init__(self, sim, shared, events):
+        self.sim = sim
+        self.shared = shared
+        self.events = events
+        self.dirty = True
+        sim.subscribe(self.on_event)
+
+    def on_event(self, event, payload):
+        self.dirty = True
+        if event in FORWARDED_EVENTS:
+            self.events.put((event, payload))
+
+    def flush(self):
+        if self.dirty:
+            self.dirty = False
+            self.shared.publish(self.sim)
+
+
+def _physics_main(config, commands, events):
+    """Entry point of the physics process"""
+    from . import snapshot
+
+    recorder = None
+    try:
+        layout = config["layout"]
+        sim = ReactorSimulator(ReactorCoreState(layout), seed=config["seed"])
+        if config["load"]:
+            # The snapshot's own layout unless one was given explicitly
+            sim = snapshot.load(config["load"], sim if layout is not None else None)
+        shared = SharedFrame.create(sim.layout)
+    except Exception as e:
+        events.put(("error", e))
+        return
+    try:
+        if config["record"]:
+            recorder = TelemetryRecorder(config["record"], sim, config["record_capacity"])
+        asyncio.run(_physics_loop(sim, config, shared, commands, events))
+    except Exception as e:
+        events.put(("error", e))
+    finally:
+        if recorder is not None:
+            recorder.close()
+        shared.close()
+        shared.unlink()
+
+
+async def _physics_loop(sim, config, shared, commands, events):
+    from .feed import TelemetryFeed
+    from .server import CommandServer, run_commands
+
+    loop = asyncio.get_running_loop()
+    stopped = loop.create_future()
+    clock = config["clock"]
+    publisher = FramePublisher(sim, shared, events)
+
+    services = []
+    endpoints = []
+    if config["serve"] or config["serve_tcp"] is not None:
+        server = CommandServer(lambda batch: (run_commands(sim, batch), sim.sim_time))
+        endpoints.append((server, config["serve"], config["serve_tcp"]))
+    if config["feed"] or config["feed_tcp"] is not None:
+        endpoints.append((TelemetryFeed(sim), config["feed"], config["feed_tcp"]))
+
+    def stop():
+        loop.remove_reader(commands.fileno())
+        if not stopped.done():
+            stopped.set_result(None)
+
+    def on_command():
+        # Frontend commands run as soon as they arrive, between steps
+        try:
+            while commands.poll():
+                command = commands.recv()
+                if command is None:
+                    stop()
+                    return
+                sim.execute(command)
+        except (EOFError, OSError):  # the frontend is gone
+            stop()
+            return
+        publisher.flush()
+
+    try:
+        for service, path, port in endpoints:
+            await service.start(path, port)
+            services.append(service)
+        loop.add_reader(commands.fileno(), on_command)
+        publisher.flush()
+        events.put(("ready", {
+            "shm": shared.name,
+            "layout": (sim.layout.name, list(sim.layout.grid)),
+            "seed": sim.rng.seed,
+        }))
+        while not stopped.done():
+            clock.advance(sim)
+            publisher.flush()
+            await asyncio.wait([stopped], timeout=clock.poll_interval())
+    finally:
+        for service in services:
+            await service.close()
+
+
+class PhysicsProcessError(RuntimeError):
+    """The physics process failed to start or died"""
+
+
+class PhysicsProcess:
+    """Run a simulator in a child process; see the module docstring.
+
+    ``layout``, ``seed`` and ``load`` choose the simulator as for the GUI;
+    ``clock`` paces it. ``record`` and the ``serve``/``feed`` endpoints
+    are hosted by the child. ``start`` waits until the first frame is
+    published and raises ``PhysicsProcessError`` (caused by the child's
+    error) if it could not start.
+    """
+
+    def __init__(self, layout=None, seed=None, clock=None, load=None, record=None, record_capacity=36000,
+                 serve=None, serve_tcp=None, feed=None, feed_tcp=None):
+        self.config = {
+            "layout": layout, "seed": seed, "clock": clock if clock is not None else SimClock(),
+            "load": load, "record": record, "record_capacity": record_capacity,
+            "serve": serve, "serve_tcp": serve_tcp, "feed": feed, "feed_tcp": feed_tcp,
+        }
+        self.layout = layout
+        self.seed = seed
+        self.shared = None
+        # spawn: the child must not inherit the frontend's Tk or Textual state
+        context = multiprocessing.get_context("spawn")
+        self._child_commands, self._commands = context.Pipe(duplex=False)
+        self.events = context.Queue()
+        self.process = context.Process(target=_physics_main, name="helios-physics",
+                                       args=(self.config, self._child_commands, self.events), daemon=True)
+
+    def start(self):
+        self.process.start()
+        self._child_commands.close()
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                kind, payload = self.events.get(timeout=0.1)
+                break
+            except queue.Empty:
+                if not self.process.is_alive() or time.monotonic() > deadline:
+                    self.stop()
+                    raise PhysicsProcessError("cannot start the physics process: it did not respond") from None
+        if kind == "error":
+            self.stop()
+            # A missing --load file or unwritable --record path, say
+            raise PhysicsProcessError(f"cannot start the physics process: {payload}") from payload
+        name, grid = payload["layout"]
+        if self.layout is None or list(self.layout.grid) != grid:
+            self.layout = compile_layout(grid, name)
+        self.seed = payload["seed"]
+        self.shared = SharedFrame.attach(payload["shm"])
+        return self
+
+    @property
+    def alive(self):
+        return self.process.is_alive()
+
+    def send(self, command):
+        """Queue an operator command for the physics process"""
+        try:
+            self._commands.send(command)
+        except (BrokenPipeError, OSError):
+            raise PhysicsProcessError("the physics process has stopped") from None
+
+    def poll_events(self):
+        """Events forwarded by the child since the last call"""
+        pending = []
+        while True:
+            try:
+                pending.append(self.events.get_nowait())
+            except (queue.Empty, OSError, ValueError):
+                return pending
+
+    def stop(self, timeout=5.0):
+        if self.process.is_alive():
+            try:
+                self._commands.send(None)
+            except OSError:
+                pass
+            self.process.join(timeout)
+        killed = self.process.is_alive()
+        if killed:
+            self.process.terminate()
+            self.process.join(timeout)
+        self._commands.close()
+        if self.shared is not None:
+            self.shared.close()
+            if killed:  # the child had no chance to remove the block itself
+                self.shared.unlink()
+            self.shared = None
+        self.events.close()
+        self.events.join_thread()
+
+
+class RemoteSimulator(ReactorSimulator):
+    """Frontend mirror of the simulator in ``physics``.
+
+    Holds the state of the latest frame pulled with ``sync`` and forwards
+    every command to the physics process. The flash phase of the alarms is
+    the frontend's own and kept across frames.
+    """
+
+    def __init__(self, physics):
+        super().__init__(ReactorCoreState(physics.layout), seed=physics.seed)
+        self.physics = physics
+        self._count = 0
+        self._alarm_source = None
+
+    def execute(self, command):
+        self.physics.send(command)
+
+    def start(self):
+        self.execute("start")
+
+    def scram(self):
+        self.execute("scram")
+
+    def reset(self):
+        self.execute("reset")
+
+    def acknowledge_alarms(self):
+        self.execute("ack")
+        return []  # the child reports the acknowledged alarms as an event
+
+    def step(self, dt=1.0):
+        raise RuntimeError("the physics of a RemoteSimulator run in its physics process")
+
+    def sync(self):
+        """Apply the newest frame and the events that led up to it;
+        returns True if there was a new frame"""
+        # Events first: the frame read afterwards is at least as new
+        events = self.physics.poll_events()
+        frame = self.physics.shared.read(self._count)
+        if frame is not None:
+            self._apply(frame)
+        for event, payload in events:
+            if event == "error":
+                self.log_console(f"ERROR: physics process failed: {payload}")
+            else:
+                self._emit(event, payload)
+        if frame is not None:
+            self._emit("changed")
+        return frame is not None
+
+    def _apply(self, frame):
+        core = self.core
+        self._count = frame["count"]
+        core.flux[:] = frame["flux"]
+        core.fuel[:] = frame["fuel"]
+        core.insertion[:] = frame["insertion"]
+        core.temp_offsets[:] = frame["temp_offsets"]
+        alarms = frame["alarms"]
+        if alarms != self._alarm_source:
+            self._alarm_source = alarms
+            bits = core.alarm_bits
+            for i, code in enumerate(alarms):
+                code &= ~PHASE
+                bits[i] = code | (bits[i] & PHASE) if code & FLASH else code
+
+        for name in SCALAR_FIELDS:
+            setattr(self, name, frame[name])
+        self.running = frame["running"]
+        self.startup_in_progress = frame["startup_in_progress"]
+        mask = frame["alerts"]
+        for bit, name in enumerate(ALERT_ORDER):
+            self.alerts[name] = bool(mask & (1 << bit))
+
+        # JSON turned the rod and pump numbers into lists of pairs
+        for target, pairs in ((self.temperatures, frame["temperatures"]), (self.pump_flow, frame["pump_flow"]),
+                              (self.pump_status, frame["pump_status"]), (core.custom_text, frame["custom_text"])):
+            target.clear()
+            target.update(pairs)
+        self.arccs_recommendation = frame["arccs_recommendation"]
+        self.arccs_commands = frame["arccs_commands"]
+
+
+class FrameClock:
+    """Takes the place of a frontend's ``SimClock`` when the physics run in
+    a ``PhysicsProcess``: ``advance`` pulls the latest frame into the
+    ``RemoteSimulator``, ``refresh_hz`` times a second"""
+
+    mode = "process"
+
+    def __init__(self, clock, refresh_hz=REFRESH_HZ):
+        self.clock = clock
+        self.refresh_hz = refresh_hz
+
+    def describe(self):
+        return f"{self.clock.describe()} in a separate physics process"
+
+    def reset(self):
+        pass
+
+    def advance(self, sim, now=None):
+        return 1 if sim.sync() else 0
+
+    def poll_interval(self):
+        return 1.0 / self.refresh_hz
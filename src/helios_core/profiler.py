@@ -0,0 +1,123 @@
+"""Opt-in tick profiler.
+
+``TickProfiler.instrument`` wraps named methods of an object (the simulator
+phases, the GUI render passes) with timing wrappers on that instance only,
+so nothing is measured, and nothing costs anything, unless profiling is
+switched on. ``instrument_tk`` additionally records how late every Tk
+``after`` callback fires compared to when it was scheduled.
+
+Enable with ``helios-core gui --profile`` or ``HELIOS_PROFILE=1``; view the
+report with the ``profile`` console command or on exit.
+"""
+import functools
+import os
+import time
+from collections import deque
+
+PROFILE_ENV = "HELIOS_PROFILE"
+MAX_SAMPLES = 10000  # most recent samples kept per phase
+
+# phase name -> method, in tick order
+SIM_PHASES = {
+    "tick": "step",
+    "flux": "calculate_neutron_flux",
+    "power": "calculate_reactor_power",
+    "temperature": "calculate_core_temperature",
+    "alerts": "update_alerts",
+    "arccs": "arccs_control",
+    "rod_problems": "check_rod_problems",
+}
+UI_PHASES = {
+    "status_displays": "update_status_displays",
+    "grid_bars": "update_grid_bars",
+}
+
+
+def profiling_requested(flag=False):
+    """True if ``flag`` is set or the environment asks for profiling"""
+    return flag or os.environ.get(PROFILE_ENV, "") not in ("", "0")
+
+
+def percentile(sorted_samples, fraction):
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[index]
+
+
+class TickProfiler:
+    """Per-phase wall time and Tk callback lag samples"""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self.samples = {}  # phase -> deque of seconds
+
+    def record(self, phase, seconds):
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = self.samples[phase] = deque(maxlen=self.max_samples)
+        samples.append(seconds)
+
+    def reset(self):
+        self.samples.clear()
+
+    def timed(self, phase, fn):
+        """Wrap ``fn`` so every call is recorded under ``phase``"""
+        perf_counter = time.perf_counter
+        record = self.record
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(phase, perf_counter() - start)
+        return wrapper
+
+    def instrument(self, obj, phases):
+        """Replace ``obj``'s methods named in ``phases`` with timed wrappers"""
+        for phase, method in phases.items():
+            setattr(obj, method, self.timed(phase, getattr(obj, method)))
+
+    def instrument_tk(self, root):
+        """Record the lag of every ``root.after`` callback as ``after:<name>``"""
+        after = root.after
+        perf_counter = time.perf_counter
+        record = self.record
+
+        def profiled_after(ms, func=None, *args):
+            if func is None:
+                return after(ms)
+            due = perf_counter() + ms / 1000.0
+            phase = "after:" + getattr(func, "__name__", "callback")
+
+            def fire(*call_args):
+                record(phase, max(0.0, perf_counter() - due))
+                return func(*call_args)
+            return after(ms, fire, *args)
+
+        root.after = profiled_after
+
+    def summary(self):
+        """``{phase: {"count", "p50_ms", "p95_ms", "max_ms"}}``"""
+        result = {}
+        for phase, samples in self.samples.items():
+            ordered = sorted(samples)
+            result[phase] = {
+                "count": len(ordered),
+                "p50_ms": percentile(ordered, 0.50) * 1000,
+                "p95_ms": percentile(ordered, 0.95) * 1000,
+                "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+            }
+        return result
+
+    def report(self):
+        """Report table as a list of lines"""
+        lines = [f"{'phase':<24}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for phase, stats in self.summary().items():
+            lines.append(f"{phase:<24}{stats['count']:>8}{stats['p50_ms']:>10.3f}"
+                         f"{stats['p95_ms']:>10.3f}{stats['max_ms']:>10.3f}")
+        if len(lines) == 1:
+            lines.append("(no samples yet)")
+        return lines
@@ -3,17 +3,17 @@ from collections import Counter
 from .reactor_data import GRID_LETTERS, ROD_TYPES
 
 
-def flatten_grid():
-    return [cell for row in GRID_LETTERS for cell in row]
+def flatten_grid(grid=GRID_LETTERS):
+    return [cell for row in grid for cell in row]
 
 
-def rod_counts():
-    return Counter(flatten_grid())
+def rod_counts(grid=GRID_LETTERS):
+    return Counter(flatten_grid(grid))
 
 
-def render_ascii_map(show_placeholder=False):
+def render_ascii_map(show_placeholder=False, grid=GRID_LETTERS):
     rows = []
-    for row in GRID_LETTERS:
+    for row in grid:
         if show_placeholder:
             rows.append(" ".join(row))
         else:
@@ -21,8 +21,8 @@ def render_ascii_map(show_placeholder=False):
     return "\n".join(rows)
 
 
-def reactor_stats():
-    counts = rod_counts()
+def reactor_stats(grid=GRID_LETTERS):
+    counts = rod_counts(grid)
     active_positions = sum(v for k, v in counts.items() if k != "P")
     total_positions = sum(counts.values())
     return {
@@ -0,0 +1,326 @@
+"""Scripted scenarios: timed operator commands run headlessly.
+
+A scenario file holds one timed command per line::
+
+    # Load reduction drill
+    t=0s start
+    t=60s set * 60
+    t=+30s pump 1 0          # relative to the previous line
+    t=5m expect power > 40
+    t=5m expect not alert Temp High
+    t=10m end
+
+Times are simulated seconds with an optional ``s``, ``m`` or ``h`` suffix;
+``t=+...`` is relative to the previous line. Commands are the operator
+commands understood by ``ReactorSimulator.execute``, plus:
+
+- ``expect <metric> <op> <value>`` where metric is one of ``METRICS`` and
+  op one of ``< <= > >= == !=``
+- ``expect [not] running`` and ``expect [not] alert <alert name>``
+- ``end`` stops the run (default: the last timed line); lines timed after
+  it are rejected
+
+``run_scenario`` executes a scenario as fast as the physics allows and
+returns a summary dict with the run statistics, command errors and
+failed expectations.
+"""
+import operator
+import time
+from pathlib import Path
+
+from . import snapshot
+from .simulator import ALERT_NAMES, ERROR_PREFIXES, ReactorSimulator
+from .state import ReactorCoreState
+from .telemetry import TelemetryRecorder
+
+COMMANDS = {"set", "temp", "pressure", "pump", "start", "reset", "scram", "status", "arccs", "save", "load",
+            "red", "yellow", "off", "alloff", "ack", "text", "cleartext", "expect", "end"}
+
+# expect metric -> simulator attribute
+METRICS = {
+    "power": "core_power",
+    "temp": "coolant_temp_avg",
+    "pressure": "pressure",
+    "turbine": "turbine_rpm",
+    "radiation": "radiation_level",
+    "integrity": "integrity",
+    "output": "power_output_mw",
+}
+
+OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+TIME_UNITS = {"s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class ScenarioError(ValueError):
+    """A scenario file could not be parsed"""
+
+
+class Event:
+    """One timed scenario line"""
+
+    __slots__ = ("time", "command", "line")
+
+    def __init__(self, time, command, line):
+        self.time = time
+        self.command = command
+        self.line = line
+
+    def __repr__(self):
+        return f"Event({self.time!r}, {self.command!r}, line={self.line})"
+
+
+class Scenario:
+    """Parsed scenario: events in time order and the end time"""
+
+    def __init__(self, events, end=None, name="scenario"):
+        self.name = name
+        self.events = sorted(events, key=lambda e: e.time)  # stable: file order within a time
+        self.end = end if end is not None else max((e.time for e in self.events), default=0.0)
+
+
+def parse_time(text):
+    """Seconds in ``30``, ``30s``, ``2.5m`` or ``1h``"""
+    unit = TIME_UNITS.get(text[-1:].lower())
+    number = text[:-1] if unit else text
+    try:
+        value = float(number) * (unit or 1.0)
+    except ValueError:
+        raise ScenarioError(f"invalid time {text!r}") from None
+    if value < 0:
+        raise ScenarioError(f"negative time {text!r}")
+    return value
+
+
+def parse_expectation(args):
+    """``expect`` arguments -> (description, check(sim) -> bool)"""
+    negate = bool(args) and args[0] == "not"
+    if negate:
+        args = args[1:]
+    if not args:
+        raise ScenarioError("expect needs a condition")
+
+    if args[0] == "running" and len(args) == 1:
+        return " ".join(["not"] * negate + args), lambda sim: sim.running != negate
+
+    if args[0] == "alert":
+        name = " ".join(args[1:])
+        if name not in {n for row in ALERT_NAMES for n in row}:
+            raise ScenarioError(f"unknown alert {name!r}")
+        return " ".join(["not"] * negate + args), lambda sim: sim.alerts[name] != negate
+
+    if negate or len(args) != 3:
+        raise ScenarioError("expect takes '<metric> <op> <value>', '[not] running' or '[not] alert <name>'")
+    metric, op, value = args
+    if metric not in METRICS:
+        raise ScenarioError(f"unknown metric {metric!r} (use {', '.join(METRICS)})")
+    if op not in OPERATORS:
+        raise ScenarioError(f"unknown comparison {op!r}")
+    try:
+        value = float(value)
+    except ValueError:
+        raise ScenarioError(f"invalid value {value!r}") from None
+    attr, compare = METRICS[metric], OPERATORS[op]
+    return " ".join(args), lambda sim: compare(getattr(sim, attr), value)
+
+
+def parse_scenario(text, name="scenario"):
+    events = []
+    end = None
+    previous = 0.0
+    for number, raw in enumerate(text.splitlines(), 1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+        stamp, _, command = line.partition(" ")
+        if not stamp.startswith("t="):
+            raise ScenarioError(f"line {number}: expected 't=<time> <command>'")
+        try:
+            stamp = stamp[2:]
+            at = previous + parse_time(stamp[1:]) if stamp.startswith("+") else parse_time(stamp)
+            command = command.strip()
+            verb = command.split(" ", 1)[0]
+            if verb not in COMMANDS:
+                raise ScenarioError(f"unknown command {verb!r}" if verb else "missing command")
+            if verb == "expect":
+                parse_expectation(command.split()[1:])  # validate now, not mid-run
+        except ScenarioError as e:
+            raise ScenarioError(f"line {number}: {e}") from None
+        previous = at
+        if verb == "end":
+            end = at if end is None else min(end, at)
+        else:
+            events.append(Event(at, command, number))
+    if end is not None:
+        for event in events:
+            if event.time > end + 1e-9:
+                raise ScenarioError(f"line {event.line}: t={event.time:g}s is after the end at t={end:g}s")
+    return Scenario(events, end, name)
+
+
+def load_scenario(path):
+    path = Path(path)
+    return parse_scenario(path.read_text(encoding="utf-8"), name=path.stem)
+
+
+class RunStats:
+    """Peak and alert statistics of a run, collected from ``tick`` events"""
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.ticks = 0
+        self.online_at = None
+        self.peak_temp = sim.coolant_temp_avg
+        self.peak_power = 0.0
+        self.arccs_recommendations = 0
+        self.auto_rod_moves = 0
+        self.alert_ticks = dict.fromkeys(sim.alerts, 0)
+        self._auto_rods = sim.layout.rods_by_type["A"]
+        self._last_auto = None
+        sim.subscribe(self.on_event)
+
+    def on_event(self, event, payload):
+        if event != "tick":
+            return
+        sim = self.sim
+        self.ticks += 1
+        if self.online_at is None and sim.running:
+            self.online_at = sim.sim_time
+        self.peak_temp = max(self.peak_temp, sim.coolant_temp_avg)
+        self.peak_power = max(self.peak_power, sim.core_power)
+        for name, active in sim.alerts.items():
+            if active:
+                self.alert_ticks[name] += 1
+        if sim.arccs_commands:
+            self.arccs_recommendations += 1
+        auto = [sim.control_rod_levels[num] for num in self._auto_rods]
+        if self._last_auto is not None and auto != self._last_auto:
+            self.auto_rod_moves += 1
+        self._last_auto = auto
+
+    def summary(self):
+        sim = self.sim
+        ticks = max(self.ticks, 1)
+        return {
+            "online_at": self.online_at,
+            "sim_time": sim.sim_time,
+            "running": sim.running,
+            "peak_temp": self.peak_temp,
+            "peak_power": self.peak_power,
+            "final_power": sim.core_power,
+            "final_temp": sim.coolant_temp_avg,
+            "integrity": sim.integrity,
+            "arccs_recommendations": self.arccs_recommendations,
+            "auto_rod_moves": self.auto_rod_moves,
+            # fraction of ticks each alert was active
+            "alerts": {name: count / ticks for name, count in self.alert_ticks.items() if count},
+        }
+
+
+def run_scenario(scenario, seed=0, backend="auto", layout=None, dt=1.0, on_console=None,
+                 record=None, record_capacity=36000, resume=None, save=None):
+    """Run ``scenario`` headlessly, stepping ``dt`` simulated seconds at a
+    time; events fire at the first step boundary at or after their time.
+    ``on_console(sim_time, message)`` receives the console log and
+    ``record`` names a telemetry file to record the run into.
+
+    ``resume`` starts from a snapshot file instead of a cold core (scenario
+    times then count from the snapshot's clock; a ``load`` line mid-run
+    keeps scenario time running from where it was) and ``save`` writes a
+    snapshot of the final state (see ``helios_core.snapshot``).
+    """
+    core = ReactorCoreState(layout) if layout is not None else None
+    if resume:
+        sim = snapshot.load(resume, ReactorSimulator(core, backend=backend) if core else None, backend)
+    else:
+        sim = ReactorSimulator(core, backend=backend, seed=seed)
+    origin = sim.sim_time
+    stats = RunStats(sim)
+    recorder = TelemetryRecorder(record, sim, record_capacity) if record else None
+    errors = []
+    failures = []
+    current = [None]
+
+    def on_event(event, payload):
+        if event != "console":
+            return
+        if on_console is not None:
+            on_console(sim.sim_time, payload)
+        if current[0] is not None and payload.lstrip().startswith(ERROR_PREFIXES):
+            errors.append({"time": sim.sim_time - origin, "line": current[0].line,
+                           "command": current[0].command, "message": payload.strip()})
+
+    sim.subscribe(on_event)
+    started = time.perf_counter()
+    events = scenario.events
+    index = 0
+    expectations = 0
+    try:
+        while True:
+            while index < len(events) and events[index].time <= sim.sim_time - origin + 1e-9:
+                event = events[index]
+                index += 1
+                if event.command.startswith("expect"):
+                    expectations += 1
+                    description, check = parse_expectation(event.command.split()[1:])
+                    if not check(sim):
+                        failures.append({"time": sim.sim_time - origin, "line": event.line, "expect": description})
+                    continue
+                current[0] = event
+                elapsed = sim.sim_time - origin
+                sim.execute(event.command)
+                current[0] = None
+                # 'load' swaps in the snapshot's clock; scenario time carries on
+                origin = sim.sim_time - elapsed
+            if sim.sim_time - origin >= scenario.end - 1e-9:
+                break
+            sim.step(dt)
+    finally:
+        # Flush and unmap the recording even if the run fails midway
+        if recorder is not None:
+            recorder.close()
+    if save:
+        snapshot.save(sim, save)
+
+    summary = {"scenario": scenario.name, "seed": sim.rng.seed, "started_at": origin}
+    summary.update(stats.summary())
+    summary.update({
+        "wall_time": time.perf_counter() - started,
+        "commands": len(events) - expectations,
+        "expectations": expectations,
+        "errors": errors,
+        "failures": failures,
+        "passed": not errors and not failures,
+    })
+    return summary
+
+
+def format_result(summary):
+    lines = [
+        f"Scenario: {summary['scenario']} (seed {summary['seed']})  "
+        f"{summary['sim_time'] - summary['started_at']:.0f}s simulated in {summary['wall_time']:.2f}s",
+        f"Commands: {summary['commands']}  expectations: {summary['expectations']}  "
+        f"errors: {len(summary['errors'])}  failed: {len(summary['failures'])}",
+        f"Peak: {summary['peak_temp']:.1f}K {summary['peak_power']:.1f}%  "
+        f"final: {summary['final_temp']:.1f}K {summary['final_power']:.1f}%  "
+        f"integrity {summary['integrity']:.2f}%  {'running' if summary['running'] else 'shut down'}",
+        f"ARCCS recommendation ticks: {summary['arccs_recommendations']}  "
+        f"auto rod moves: {summary['auto_rod_moves']}",
+    ]
+    if summary["alerts"]:
+        lines.append("Alerts (active time):")
+        for name, duty in sorted(summary["alerts"].items(), key=lambda x: -x[1]):
+            lines.append(f"  {name:<20} {duty * 100:5.1f}%")
+    for error in summary["errors"]:
+        lines.append(f"ERROR  t={error['time']:.0f}s line {error['line']}: {error['command']} -> {error['message']}")
+    for failure in summary["failures"]:
+        lines.append(f"FAILED t={failure['time']:.0f}s line {failure['line']}: expect {failure['expect']}")
+    lines.append("PASS" if summary["passed"] else "FAIL")
+    return "\n".join(lines)
@@ -0,0 +1,346 @@
+"""Local command server for external control of a running simulator.
+
+``CommandServer`` listens on a Unix domain socket (and optionally on a
+localhost TCP port) and accepts the full operator command set, one request
+per line. A request is either a plain command line::
+
+    set * 60
+
+or a JSON object, optionally carrying an ``id`` and a ``batch`` of commands
+that run back to back with no physics step in between::
+
+    {"id": 7, "cmd": "pump 1 90"}
+    {"id": 8, "batch": ["pressure 150", "set * 55"]}
+
+Every request gets one JSON acknowledgement line, in request order::
+
+    {"id": 7, "ok": true, "output": ["Adjusting pump 1 ..."], "sim_time": 412.0}
+    {"id": 8, "ok": true, "results": [{"ok": true, "output": [...]}, ...], "sim_time": 412.0}
+
+Plain lines are numbered per connection starting at 1. Clients may
+pipeline any number of requests without waiting; every complete line
+already received is executed in one go and acknowledged with a single
+write. ``ok`` is false when a command logs an error.
+
+The server runs on an asyncio loop. ``serve`` hosts the simulator on the
+same loop (headless), so commands execute inline; ``TkBridge`` runs the
+server on a background thread next to the Tk frontend and hands each
+group of requests to the Tk thread.
+"""
+import asyncio
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+from concurrent.futures import Future
+
+from .simulator import ERROR_PREFIXES
+
+READ_SIZE = 1 << 16
+
+
+def default_socket_path(name="helios-core"):
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, f"{name}.sock")
+    return os.path.join(tempfile.gettempdir(), f"{name}-{os.getuid()}.sock")
+
+
+def run_commands(sim, commands):
+    """Execute ``commands`` on ``sim``; returns one result dict per command"""
+    results = []
+    output = []
+
+    def capture(event, payload):
+        if event == "console":
+            output.append(payload)
+
+    sim.subscribe(capture)
+    try:
+        for command in commands:
+            output = []
+            try:
+                sim.execute(command)
+            except Exception as e:  # execute reports its own errors; this is a last resort
+                output.append(f"ERROR: {e}")
+            ok = not any(line.lstrip().startswith(ERROR_PREFIXES) for line in output)
+            results.append({"ok": ok, "output": output})
+    finally:
+        sim.unsubscribe(capture)
+    return results
+
+
+def parse_request(line, number):
+    """A request line -> (id, commands, batch); raises ValueError"""
+    if not line.startswith("{"):
+        return number, [line], False
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    request_id = request.get("id", number)
+    if "batch" in request:
+        commands = request["batch"]
+        if not isinstance(commands, list) or not all(isinstance(c, str) for c in commands):
+            raise ValueError("batch must be a list of command strings")
+        return request_id, commands, True
+    if not isinstance(request.get("cmd"), str):
+        raise ValueError("request needs a 'cmd' string or a 'batch' list")
+    return request_id, [request["cmd"]], False
+
+
+class SocketService:
+    """Base of the local socket services: listens on a Unix socket and/or a
+    localhost TCP port and hands each connection to ``_handle``"""
+
+    def __init__(self):
+        self.servers = []
+        self.socket_path = None
+
+    async def start(self, socket_path=None, tcp_port=None):
+        if socket_path:
+            _remove_stale_socket(socket_path)
+            server = await asyncio.start_unix_server(self._handle, path=socket_path, limit=READ_SIZE)
+            os.chmod(socket_path, 0o600)  # other local users must not drive the reactor
+            self.socket_path = socket_path
+            self.servers.append(server)
+        if tcp_port is not None:
+            self.servers.append(await asyncio.start_server(self._handle, "127.0.0.1", tcp_port, limit=READ_SIZE))
+
+    @property
+    def addresses(self):
+        names = []
+        for server in self.servers:
+            for sock in server.sockets:
+                address = sock.getsockname()
+                names.append(address if isinstance(address, str) else f"{address[0]}:{address[1]}")
+        return names
+
+    async def close(self):
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def _handle(self, reader, writer):
+        raise NotImplementedError
+
+
+def _no_delay(writer):
+    sock = writer.get_extra_info("socket")
+    if sock.family != socket.AF_UNIX:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class CommandServer(SocketService):
+    """Line-protocol command server.
+
+    ``execute(commands)`` runs a list of command strings on the host's
+    thread and returns ``(results, sim_time)``; it may be a coroutine
+    function when the simulator lives on another thread.
+    """
+
+    def __init__(self, execute):
+        super().__init__()
+        self.execute = execute
+        self.connections = 0
+
+    async def _run(self, commands):
+        result = self.execute(commands)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        _no_delay(writer)
+        number = 0
+        pending = b""
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                pending += data
+                *lines, pending = pending.split(b"\n")
+
+                # Every complete line received so far is executed in one host call
+                requests = []
+                commands = []
+                for raw in lines:
+                    line = raw.decode("utf-8", "replace").strip()
+                    if not line:
+                        continue
+                    number += 1
+                    try:
+                        request_id, request_commands, batch = parse_request(line, number)
+                    except ValueError as e:
+                        requests.append((number, None, False, f"bad request: {e}"))
+                        continue
+                    requests.append((request_id, (len(commands), len(request_commands)), batch, None))
+                    commands.extend(request_commands)
+                if not requests:
+                    continue
+
+                results, sim_time = await self._run(commands) if commands else ([], None)
+                replies = []
+                for request_id, span, batch, error in requests:
+                    if error is not None:
+                        reply = {"id": request_id, "ok": False, "error": error}
+                    elif batch:
+                        part = results[span[0]:span[0] + span[1]]
+                        reply = {"id": request_id, "ok": all(r["ok"] for r in part), "results": part}
+                    else:
+                        reply = {"id": request_id}
+                        reply.update(results[span[0]])
+                    reply["sim_time"] = sim_time
+                    replies.append(json.dumps(reply, ensure_ascii=False))
+                writer.write(("\n".join(replies) + "\n").encode("utf-8"))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+
+def _remove_stale_socket(path):
+    """Unlink a socket file left behind by a server that is gone"""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        # connect() is refused for ordinary files too; never delete those
+        raise OSError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+    else:
+        raise OSError(f"another server is listening on {path}")
+    finally:
+        probe.close()
+
+
+async def serve(sim, clock, socket_path=None, tcp_port=None, on_ready=None, feed_path=None, feed_tcp=None):
+    """Run ``sim`` paced by ``clock`` and serve commands until cancelled,
+    plus a ``TelemetryFeed`` if ``feed_path`` or ``feed_tcp`` is given.
+
+    Commands run on the event loop between physics steps, so they are
+    acknowledged as soon as they arrive.
+    """
+    from .feed import TelemetryFeed
+
+    services = [CommandServer(lambda commands: (run_commands(sim, commands), sim.sim_time))]
+    await services[0].start(socket_path, tcp_port)
+    if feed_path or feed_tcp is not None:
+        services.append(TelemetryFeed(sim))
+        await services[1].start(feed_path, feed_tcp)
+    if on_ready is not None:
+        on_ready(*services)
+    try:
+        while True:
+            clock.advance(sim)
+            await asyncio.sleep(clock.poll_interval())
+    finally:
+        for service in services:
+            await service.close()
+
+
+class TkBridge:
+    """Serve commands (and optionally the telemetry feed) for a Tk
+    frontend from a background thread.
+
+    Requests are handed to the Tk thread with ``root.after`` (Tcl marshals
+    the call into its own thread) and executed there between redraws.
+    """
+
+    def __init__(self, root, sim, socket_path=None, tcp_port=None, feed_path=None, feed_tcp=None):
+        self.root = root
+        self.sim = sim
+        self.socket_path = socket_path
+        self.tcp_port = tcp_port
+        self.feed_path = feed_path
+        self.feed_tcp = feed_tcp
+        self.loop = None
+        self.services = []
+        self.ready = threading.Event()
+        self.error = None
+        self._thread = threading.Thread(target=self._main, name="helios-command-server", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        self.ready.wait()
+        if self.error is not None:
+            raise self.error
+        return self
+
+    def _main(self):
+        from .feed import TelemetryFeed
+
+        self.loop = asyncio.new_event_loop()
+        endpoints = []
+        if self.socket_path or self.tcp_port is not None:
+            endpoints.append((CommandServer(self._execute), self.socket_path, self.tcp_port))
+        if self.feed_path or self.feed_tcp is not None:
+            endpoints.append((TelemetryFeed(self.sim), self.feed_path, self.feed_tcp))
+        try:
+            for service, path, port in endpoints:
+                self.loop.run_until_complete(service.start(path, port))
+                self.services.append(service)
+        except OSError as e:
+            self.error = e
+        self.ready.set()
+        if self.error is None:
+            self.loop.run_forever()
+        for service in self.services:
+            self.loop.run_until_complete(service.close())
+        self.loop.close()
+
+    async def _execute(self, commands):
+        done = Future()
+
+        def run():
+            try:
+                done.set_result((run_commands(self.sim, commands), self.sim.sim_time))
+            except BaseException as e:
+                done.set_exception(e)
+
+        self.root.after(0, run)
+        return await asyncio.wrap_future(done)
+
+    def stop(self):
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=2)
+
+
+def send_commands(commands, socket_path=None, tcp_port=None, batch=False, timeout=10.0):
+    """Send ``commands`` pipelined (or as one batch) and return the replies"""
+    if tcp_port is not None:
+        sock = socket.create_connection(("127.0.0.1", tcp_port), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(socket_path or default_socket_path())
+    with sock:
+        if batch:
+            requests = [json.dumps({"id": 1, "batch": list(commands)})]
+        else:
+            requests = [json.dumps({"id": i, "cmd": command}) for i, command in enumerate(commands, 1)]
+        sock.sendall(("\n".join(requests) + "\n").encode("utf-8"))
+        replies = []
+        buffer = b""
+        while len(replies) < len(requests):
+            data = sock.recv(READ_SIZE)
+            if not data:
+                raise ConnectionError("server closed the connection")
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            replies.extend(json.loads(line) for line in lines if line.strip())
+    return replies
@@ -0,0 +1,1191 @@
+from .actuators import ActuatorScheduler
+from .kernels import build_sensor_weights, make_kernel
+from .reactor_data import CONTROL_RODS
+from .rng import SimRandom
+from .state import ReactorCoreState
+
+ALERT_NAMES = [
+    ["Power Excursion", "Temp High", "Rod Drive Fault", "Overspeed Turbine"],
+    ["Flux Tilt", "Temp Low", "Rod Rate Limit", "Underspeed Turbine"],
+    ["Local Overpower", "ΔT High", "Refuel Interlock", "Load Mismatch"],
+    ["Reactivity Drift", "Flow Low", "Position Fault", "Heat Sink Limit"],
+]
+
+# Console lines that mark a command as failed
+ERROR_PREFIXES = ("ERROR", "Unknown command")
+
+# Actuator ramp rates per simulated second
+STARTUP_PUMP_RATE = 37.5      # m³/h
+STARTUP_PRESSURE_RATE = 10.0  # bar
+PUMP_RATE = 15.0              # m³/h
+PRESSURE_RATE = 2.0           # bar
+TEMP_RATE = 10.0              # K
+ROD_RATE = 13.3               # % insertion
+
+
+class ReactorSimulator:
+    """Headless reactor physics engine.
+
+    Owns every physical quantity of the station and advances them with
+    ``step(dt)``. Frontends observe the simulator through ``subscribe`` and
+    receive events of the form ``listener(event, payload)``:
+
+    - ``"tick"``: a physics step completed, payload is the simulator
+    - ``"changed"``: state changed outside a tick (commands, ramps)
+    - ``"console"`` / ``"arccs"``: log message for the console or ARCCS log
+    - ``"alarm_cleared"``: a rod alarm was switched off, payload is the rod number
+    - ``"alarm_acknowledged"``: alarms stopped flashing, payload is [(rod, mode)]
+    - ``"restored"``: a snapshot replaced the whole state, alarms included
+      (followed by ``"changed"``)
+
+    Actuator movements (pumps, pressure, coolant temperature, rod drives)
+    are ramps in ``self.actuators`` advanced once per ``step``. Sequences
+    such as the startup run as processes on simulated time: generators that
+    yield a delay in simulated seconds, or ramps to wait for, and are
+    resumed by ``step``. Pacing against the wall clock is left to
+    ``helios_core.clock.SimClock``.
+
+    ``backend`` selects the flux/fuel kernel (``"auto"``, ``"python"`` or
+    ``"numpy"``, see ``helios_core.kernels``). ``seed`` seeds the noise
+    streams in ``self.rng`` (see ``helios_core.rng``); runs with the same
+    seed and commands are identical.
+    """
+
+    def __init__(self, core=None, backend="auto", seed=None):
+        self.core = core if core is not None else ReactorCoreState()
+        self.rng = SimRandom(seed)
+
+        self.temperatures = {}  # rod number (T only) -> temperature in Kelvin
+        self.fuel_levels = self.core.fuel_levels  # rod number (F only) -> fuel percentage
+        self.pump_flow = {}     # pump number -> flow rate
+        self.pump_status = {}   # pump number -> on/off
+        self.coolant_temp_avg = 293.0  # average coolant temperature (room temp)
+        self.core_power = 0.0   # core power percentage
+        self.power_output_mw = 0.0  # actual power in MW
+        self.pressure = 100.0   # pressure bar (atmospheric)
+        self.integrity = 100.0  # structural integrity percentage
+        self.turbine_rpm = 0.0  # turbine speed
+        self.turbine_power_mw = 0.0  # electrical power output
+        self.radiation_level = 0.15  # control room radiation in mSv/h (baseline background)
+        self.neutron_flux = self.core.neutron_flux  # rod number (F only) -> neutron flux level
+        self.running = False    # reactor running state
+        self.startup_in_progress = False  # prevent multiple startups
+        self.alerts = {name: False for row in ALERT_NAMES for name in row}
+        self.rod_temp_offsets = self.core.rod_temp_offsets  # individual temperature offsets for each rod
+        self.sim_time = 0.0  # simulated seconds elapsed
+        self.arccs_last_message_time = float("-inf")  # rate limiting for ARCCS messages
+        self.arccs_recommendation = "System nominal - no action required"  # Current ARCCS recommendation
+        self.arccs_commands = []  # Commands that ARCCS wants to execute
+
+        self._listeners = []
+        self._processes = []  # [resume_time, generator, awaited ramps], see start_process
+        self.actuators = ActuatorScheduler()
+        # Geometry never changes, so control rod influence is computed once
+        self.layout = self.core.layout
+        self.kernel = make_kernel(self.layout, backend, self.rng.flux)
+        self._pressure_offsets = self._build_pressure_offsets()
+        self._weighted_sensors = None
+        self._sensor_weights = {}
+
+        for number in self.core.rod_to_letter:
+            # Initialize individual temperature offset for this rod
+            self.rod_temp_offsets[number] = self.rng.rod_offsets.uniform(-5, 5)
+
+    # -------- ACCESSORS --------
+    @property
+    def rod_to_pos(self):
+        return self.core.rod_to_pos
+
+    @property
+    def rod_to_letter(self):
+        return self.core.rod_to_letter
+
+    @property
+    def control_rod_levels(self):
+        return self.core.control_rod_levels
+
+    @property
+    def alarm_state(self):
+        return self.core.alarm_state
+
+    # -------- EVENTS --------
+    def subscribe(self, listener):
+        """Register ``listener(event, payload)`` for simulator events"""
+        self._listeners.append(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, event, payload=None):
+        for listener in list(self._listeners):
+            listener(event, payload)
+
+    def log_console(self, message):
+        self._emit("console", message)
+
+    def log_arccs(self, message):
+        self._emit("arccs", message)
+
+    def _clear_alarm(self, rod_num):
+        self.core.turn_off(rod_num)
+        self._emit("alarm_cleared", rod_num)
+
+    def acknowledge_alarms(self):
+        """Stop every alarm flashing; returns [(rod, mode)] acknowledged"""
+        acknowledged = self.core.acknowledge()
+        if acknowledged:
+            self._emit("alarm_acknowledged", acknowledged)
+        return acknowledged
+
+    # -------- PHYSICS ENGINE --------
+    @property
+    def active(self):
+        return self.running or self.startup_in_progress
+
+    def start_process(self, process):
+        """Run ``process`` on simulated time.
+
+        ``process`` is a generator yielding either a delay in simulated
+        seconds or a list of ramps to wait for. It runs immediately up to
+        its first yield and is then resumed by ``step`` once the delay has
+        passed or every ramp has finished. Delays accumulate exactly, so
+        several short waits may complete within one step.
+        """
+        entry = [self.sim_time, process, ()]
+        self._processes.append(entry)
+        self._resume(entry)
+        return process
+
+    def _resume(self, entry):
+        resume_time, process, ramps = entry
+        if ramps:
+            if not all(ramp.done for ramp in ramps):
+                return
+            resume_time = self.sim_time
+            ramps = ()
+        while resume_time <= self.sim_time:
+            try:
+                wait = next(process)
+            except StopIteration:
+                self._processes.remove(entry)
+                return
+            if isinstance(wait, (int, float)):
+                resume_time += wait
+            elif not all(ramp.done for ramp in wait):
+                ramps = wait
+                break
+        entry[0] = resume_time
+        entry[2] = ramps
+
+    def run_processes(self):
+        """Resume every process whose wait has elapsed"""
+        for entry in list(self._processes):
+            self._resume(entry)
+
+    def step(self, dt=1.0):
+        """Advance the simulation by ``dt`` simulated seconds.
+
+        The clock and any timed processes always advance; the physics only
+        runs while the reactor is active. Returns True if a physics step ran.
+        """
+        if not self.advance_time(dt):
+            return False
+
+        # Calculate neutron flux for each fuel rod based on control rod positions
+        self.calculate_neutron_flux()
+
+        self.update_plant(dt)
+        self.drift_rod_offsets()
+
+        # Check for rod problems and trigger flashing
+        self.check_rod_problems()
+
+        self._emit("tick", self)
+        return True
+
+    def advance_time(self, dt=1.0):
+        """Advance the clock, actuators and timed processes; returns True
+        if the reactor is active and the physics should run"""
+        self.sim_time += dt
+        if self.actuators.advance(dt):
+            self._emit("changed")
+        self.run_processes()
+        return self.active
+
+    def update_plant(self, dt=1.0):
+        """Plant physics that follow from the neutron flux: power,
+        temperature, fluctuations, fuel burn-up, alerts and ARCCS"""
+        # Calculate reactor power from neutron flux (emergent property)
+        self.calculate_reactor_power()
+
+        # Calculate temperature from power generation vs cooling
+        self.calculate_core_temperature(dt)
+
+        # Pressure fluctuations (±0.1-0.5 bar)
+        self.pressure += self.rng.pressure.uniform(-0.5, 0.5)
+
+        # Pump flow fluctuations
+        for pump_num in list(self.pump_flow.keys()):
+            if self.pump_status.get(pump_num, False):
+                self.pump_flow[pump_num] += self.rng.pump.uniform(-2, 2)
+
+        # Differential fuel consumption based on neutron flux
+        if self.core_power > 1:
+            self.deplete_fuel(dt)
+
+        # Update power output in MW (RBMK-1000 nominal is 3200 MW thermal)
+        self.power_output_mw = (self.core_power / 100.0) * 3200
+
+        # Turbine speed correlates with power
+        target_rpm = 3000 * (self.core_power / 100.0)  # Nominal 3000 RPM
+        self.turbine_rpm += (target_rpm - self.turbine_rpm) * min(1.0, 0.05 * dt)
+        self.turbine_rpm += self.rng.turbine.uniform(-20, 20)
+
+        # Electrical power output (about 1/3 of thermal for RBMK)
+        self.turbine_power_mw = self.power_output_mw * 0.31
+
+        # Radiation level increases with power and fuel consumption
+        avg_fuel = sum(self.fuel_levels.values()) / max(len(self.fuel_levels), 1) if self.fuel_levels else 100
+        base_radiation = 0.1  # Background
+        power_radiation = (self.core_power / 100.0) * 0.5
+        fuel_radiation = (100 - avg_fuel) * 0.01  # More radiation from depleted fuel
+        self.radiation_level = base_radiation + power_radiation + fuel_radiation + self.rng.radiation.uniform(-0.05, 0.05)
+
+        # Slight integrity degradation when running hot
+        if self.coolant_temp_avg > 550:
+            self.integrity -= 0.0001 * dt
+
+        # Update alerts based on conditions
+        self.update_alerts()
+
+        # ARCCS automated control logic (only when running)
+        if self.running:
+            self.arccs_control()
+
+    def drift_rod_offsets(self):
+        """Individual rod temperature offset fluctuations"""
+        offsets = self.core.temp_offsets
+        uniform = self.rng.rod_offsets.uniform
+        for i in range(len(offsets)):
+            # Small drift in individual rod temperatures, kept in -10K to +10K
+            offsets[i] = max(-10, min(10, offsets[i] + uniform(-0.5, 0.5)))
+
+    def calculate_neutron_flux(self):
+        """Calculate neutron flux at each fuel rod based on control rod positions"""
+        self.kernel.neutron_flux(self.fuel_levels, self.control_rod_levels, self.neutron_flux)
+
+    def calculate_reactor_power(self):
+        """Calculate reactor power from total neutron flux (emergent property)"""
+        if not self.neutron_flux:
+            self.core_power = 0.0
+            return
+
+        # Total power is sum of all fuel rod neutron flux
+        total_flux = self.kernel.total_flux(self.neutron_flux)
+        num_fuel_rods = len(self.fuel_levels)
+
+        # Average flux across all fuel rods
+        avg_flux = total_flux / max(num_fuel_rods, 1)
+
+        # Power percentage is based on average flux
+        # At criticality (avg_flux ~1.0), reactor is at ~100% power
+        # Below criticality (avg_flux <1.0), power drops
+        # Above criticality (avg_flux >1.0), power rises (dangerous!)
+        self.core_power = avg_flux * 100.0
+
+        # Clamp to safe operating range
+        self.core_power = max(0.0, min(150.0, self.core_power))
+
+    def deplete_fuel(self, dt=1.0):
+        """Burn fuel in each rod proportionally to its local neutron flux"""
+        self.kernel.deplete_fuel(self.fuel_levels, self.neutron_flux, dt)
+
+    def calculate_core_temperature(self, dt=1.0):
+        """Calculate core temperature from power generation vs cooling"""
+        # Heat generation from fission (proportional to power)
+        # At 100% power, generates significant heat
+        heat_generation = self.core_power * 2.5  # Base heat generation
+
+        # Cooling from pumps (proportional to flow rate)
+        # Normal operation: ~240 m³/h should maintain ~500K at 100% power
+        total_flow = sum(self.pump_flow.values())
+
+        # Cooling effectiveness depends on both flow and temperature
+        # Higher temp = easier to cool (larger gradient), but needs more cooling
+        temp_above_ambient = max(0, self.coolant_temp_avg - 293.0)
+
+        # Base cooling from flow (reduced significantly)
+        flow_cooling = total_flow * 0.3
+
+        # Temperature-dependent natural cooling (increases with temp)
+        natural_cooling = temp_above_ambient * 0.15
+
+        total_cooling = flow_cooling + natural_cooling
+
+        # Net temperature change per second
+        net_change = (heat_generation - total_cooling) * 0.15 * dt
+
+        # Apply temperature change
+        self.coolant_temp_avg += net_change
+
+        # Small fluctuations
+        self.coolant_temp_avg += self.rng.coolant.uniform(-0.5, 0.5)
+
+        # Physical limits
+        self.coolant_temp_avg = max(293.0, min(800.0, self.coolant_temp_avg))
+
+    def update_alerts(self):
+        """Update alert statuses based on reactor conditions"""
+        # Temperature alerts
+        self.alerts["Temp High"] = self.coolant_temp_avg > 550
+        self.alerts["Temp Low"] = self.coolant_temp_avg < 350 and self.running
+
+        # Power alerts
+        self.alerts["Power Excursion"] = self.core_power > 105
+        self.alerts["Local Overpower"] = self.core_power > 100
+
+        # Flow alerts
+        avg_flow = sum(self.pump_flow.values()) / max(len(self.pump_flow), 1) if self.pump_flow else 0
+        self.alerts["Flow Low"] = avg_flow < 80 and self.running
+
+        # Pressure alert
+        self.alerts["ΔT High"] = abs(self.pressure - 155) > 20 and self.running
+
+        # Integrity alert
+        self.alerts["Heat Sink Limit"] = self.integrity < 95
+
+        # Turbine alerts
+        self.alerts["Overspeed Turbine"] = self.turbine_rpm > 3200
+        self.alerts["Underspeed Turbine"] = self.turbine_rpm < 2800 and self.running
+
+        # Reactivity drift (flux variation)
+        if self.neutron_flux:
+            flux_values = list(self.neutron_flux.values())
+            flux_std = (max(flux_values) - min(flux_values)) if flux_values else 0
+            self.alerts["Reactivity Drift"] = flux_std > 0.5
+            self.alerts["Flux Tilt"] = flux_std > 0.7
+
+    def check_rod_problems(self):
+        """Check each rod for problems and trigger yellow (problem) or red (critical) flashing"""
+        core = self.core
+        if not self.running:
+            # Turn off all flashing when not running
+            for rod_num in self.rod_to_letter.keys():
+                if core.is_flashing(rod_num):
+                    self._clear_alarm(rod_num)
+            return
+
+        for rod_num, letter in self.rod_to_letter.items():
+            # Calculate rod parameters
+            temp = self.calculate_rod_temperature(rod_num)
+            pressure = self.calculate_rod_pressure(rod_num)
+            flux = self.neutron_flux.get(rod_num, 0.0)
+            fuel_level = self.fuel_levels.get(rod_num, 100.0)
+
+            # Determine problem level
+            is_critical = False
+            is_problem = False
+
+            # Critical conditions (RED)
+            if temp > 600:  # Very high temperature
+                is_critical = True
+            elif pressure > 165:  # Very high pressure
+                is_critical = True
+            elif flux > 2.5:  # Very high neutron flux
+                is_critical = True
+            elif letter == "F" and fuel_level < 15:  # Critical fuel low
+                is_critical = True
+
+            # Problem conditions (YELLOW) - only if not already critical
+            if not is_critical:
+                if temp > 550:  # High temperature
+                    is_problem = True
+                elif pressure > 160:  # High pressure
+                    is_problem = True
+                elif flux > 2.0:  # High neutron flux
+                    is_problem = True
+                elif letter == "F" and fuel_level < 30:  # Low fuel
+                    is_problem = True
+
+            # Update flashing state
+            if is_critical:
+                if core.alarm_mode(rod_num) != "red" or not core.is_flashing(rod_num):
+                    core.trigger(rod_num, "red")
+            elif is_problem:
+                if core.alarm_mode(rod_num) != "yellow" or not core.is_flashing(rod_num):
+                    core.trigger(rod_num, "yellow")
+            else:
+                # No problem - turn off flashing
+                if core.is_flashing(rod_num):
+                    self._clear_alarm(rod_num)
+
+    def arccs_control(self):
+        """ARCCS automated control logic - adjusts auto rods and provides recommendations"""
+        if not self.running:
+            self.arccs_recommendation = "System nominal - no action required"
+            self.arccs_commands = []
+            return
+
+        current_time = self.sim_time
+        recommendation_parts = []
+        self.arccs_commands = []  # Clear previous commands
+
+        # Check power deviation and actively control auto rods
+        if self.core_power > 103:
+            # Power excursion - insert auto rods aggressively
+            auto_rods = self.layout.rods_by_type["A"]
+            adjusted = False
+            avg_insertion = 0
+            for rod_num in auto_rods:
+                current_insertion = self.control_rod_levels.get(rod_num, 100)  # Default to fully inserted
+                if current_insertion < 95:
+                    # More aggressive insertion for high power
+                    new_insertion = min(95, current_insertion + 5)
+                    self.control_rod_levels[rod_num] = new_insertion
+                    adjusted = True
+                avg_insertion += self.control_rod_levels.get(rod_num, 100)
+
+            if auto_rods:
+                avg_insertion /= len(auto_rods)
+
+            if adjusted and (current_time - self.arccs_last_message_time) > 10:
+                self.log_arccs(f"AUTO: Power {self.core_power:.1f}% - auto rods inserting (avg {avg_insertion:.1f}%)")
+                self.arccs_last_message_time = current_time
+
+            # Recommend manual control rod insertion
+            self.arccs_commands.append("set * 75")
+            recommendation_parts.append("CRITICAL: Run 'arccs accept' - Insert all control rods to 75%")
+
+        elif self.core_power < 97 and self.core_power > 50:
+            # Power deficit - withdraw auto rods
+            auto_rods = self.layout.rods_by_type["A"]
+            adjusted = False
+            avg_insertion = 0
+            for rod_num in auto_rods:
+                current_insertion = self.control_rod_levels.get(rod_num, 100)  # Default to fully inserted
+                if current_insertion > 5:
+                    new_insertion = max(5, current_insertion - 5)
+                    self.control_rod_levels[rod_num] = new_insertion
+                    adjusted = True
+                avg_insertion += self.control_rod_levels.get(rod_num, 100)
+
+            if auto_rods:
+                avg_insertion /= len(auto_rods)
+
+            if adjusted and (current_time - self.arccs_last_message_time) > 10:
+                self.log_arccs(f"AUTO: Power {self.core_power:.1f}% - auto rods withdrawing (avg {avg_insertion:.1f}%)")
+                self.arccs_last_message_time = current_time
+
+        # Check temperature and generate recommendation
+        if self.coolant_temp_avg > 530:
+            self.arccs_commands.append("set * 70")
+            self.arccs_commands.append("pump * 140")
+            recommendation_parts.append(f"URGENT: Temp {self.coolant_temp_avg:.0f}K - Run 'arccs accept'")
+            if (current_time - self.arccs_last_message_time) > 15:
+                self.log_arccs(f"WARN: Coolant temp {self.coolant_temp_avg:.0f}K critical")
+                self.arccs_last_message_time = current_time
+        elif self.coolant_temp_avg > 515:
+            recommendation_parts.append(f"CAUTION: Temp {self.coolant_temp_avg:.0f}K - Consider reducing power")
+
+        # Check neutron flux imbalance
+        if self.neutron_flux and len(self.neutron_flux) > 10:
+            max_flux = max(self.neutron_flux.values())
+            min_flux = min(self.neutron_flux.values())
+            if max_flux > min_flux * 2.0:
+                # Find high-flux rods
+                high_flux_rods = [num for num, flux in self.neutron_flux.items() if flux > 1.5]
+                if high_flux_rods:
+                    rod_list = ", ".join(str(r) for r in high_flux_rods[:5])
+                    # Create set commands for high flux rods
+                    for rod_num in high_flux_rods[:5]:
+                        self.arccs_commands.append(f"set {rod_num} 60")
+                    recommendation_parts.append(f"Flux tilt {max_flux/min_flux:.1f}x - Run 'arccs accept'")
+                    if (current_time - self.arccs_last_message_time) > 20:
+                        self.log_arccs(f"WARN: Neutron flux imbalance detected - ratio {max_flux/min_flux:.2f}")
+                        self.arccs_last_message_time = current_time
+
+        # Check fuel status (only log occasionally)
+        if self.fuel_levels:
+            avg_fuel = sum(self.fuel_levels.values()) / len(self.fuel_levels)
+            critical_fuel_rods = [num for num, level in self.fuel_levels.items() if level < 15]
+            
+            if critical_fuel_rods:
+                recommendation_parts.append(f"CRITICAL: {len(critical_fuel_rods)} rods <15% fuel - SCRAM and refuel required")
+                if (current_time - self.arccs_last_message_time) > 30:
+                    self.log_arccs(f"CRITICAL: {len(critical_fuel_rods)} fuel rods critically depleted")
+                    self.arccs_last_message_time = current_time
+            elif avg_fuel < 30 and (current_time - self.arccs_last_message_time) > 60:
+                self.log_arccs(f"INFO: Average fuel at {avg_fuel:.1f}% - schedule refueling within 24h")
+                self.arccs_last_message_time = current_time
+
+        # Check pump status
+        pump1_flow = self.pump_flow.get(1, 0)
+        pump2_flow = self.pump_flow.get(2, 0)
+        if self.core_power > 80:
+            if pump1_flow < 100 or pump2_flow < 100:
+                self.arccs_commands.append("pump * 120")
+                recommendation_parts.append(f"Coolant flow low - Run 'arccs accept'")
+                if (current_time - self.arccs_last_message_time) > 12:
+                    self.log_arccs(f"WARN: Insufficient coolant flow at {self.core_power:.0f}% power")
+                    self.arccs_last_message_time = current_time
+
+        # Update recommendation display
+        if recommendation_parts:
+            self.arccs_recommendation = " | ".join(recommendation_parts)
+        else:
+            self.arccs_recommendation = "System nominal - all parameters within limits"
+
+    # -------- TEMPERATURE CALCULATIONS --------
+    def calculate_temperature(self, rod_num):
+        """Calculate temperature for a T rod based on nearby T sensors"""
+        if rod_num not in self.rod_to_pos:
+            return 293.0
+
+        # If this rod has an explicit temperature set, use it
+        if rod_num in self.temperatures:
+            return self.temperatures[rod_num]
+
+        # Find all T sensors and calculate weighted average
+        r, c = self.rod_to_pos[rod_num]
+        temps = []
+        distances = []
+
+        for check_num in self.layout.sensors:
+            if check_num in self.temperatures:
+                check_r, check_c = self.rod_to_pos[check_num]
+                dist = ((r - check_r) ** 2 + (c - check_c) ** 2) ** 0.5
+                if dist > 0:
+                    temps.append(self.temperatures[check_num])
+                    distances.append(dist)
+
+        if temps:
+            # Weighted average by inverse distance
+            weights = [1.0 / (d + 0.1) for d in distances]
+            total_weight = sum(weights)
+            weighted_avg = sum(t * w for t, w in zip(temps, weights)) / total_weight
+            return weighted_avg
+
+        return 293.0  # Default room temperature if no nearby sensors
+
+    def sensor_weights(self):
+        """Per-rod nearest-sensor weights, rebuilt only when the set of
+        sensors holding a reading changes"""
+        if self._weighted_sensors is None or self.temperatures.keys() != self._weighted_sensors:
+            self._weighted_sensors = frozenset(self.temperatures)
+            self._sensor_weights = build_sensor_weights(self.layout, self._weighted_sensors)
+        return self._sensor_weights
+
+    def calculate_rod_temperature(self, rod_num):
+        """Calculate temperature for any rod based on nearest 3 T sensors"""
+        if rod_num not in self.rod_to_pos:
+            return 293.0
+
+        # If this is a T rod with explicit temperature, use it
+        letter = self.rod_to_letter.get(rod_num)
+        if letter == "T" and rod_num in self.temperatures:
+            return self.temperatures[rod_num]
+
+        weights = self.sensor_weights().get(rod_num)
+        if not weights:
+            return self.coolant_temp_avg  # Use average if no sensors
+
+        # Weighted average of the nearest 3 sensors by inverse distance
+        temperatures = self.temperatures
+        weighted_avg = 0.0
+        for sensor_num, weight in weights:
+            weighted_avg += temperatures[sensor_num] * weight
+
+        # Add individual rod temperature offset (persists across calls, varies per rod)
+        rod_offset = self.core.temp_offsets[self.layout.rod_index[rod_num]]
+        return weighted_avg + rod_offset
+
+    def _build_pressure_offsets(self):
+        """Static pressure variation of every rod relative to the core centre"""
+        centre_r, centre_c = self.layout.centre
+        offsets = {}
+        for rod_num, (r, c) in self.rod_to_pos.items():
+            # Pressure slightly higher at bottom (higher row number)
+            # and center of reactor
+            center_dist = ((r - centre_r) ** 2 + (c - centre_c) ** 2) ** 0.5
+            offsets[rod_num] = (r - centre_r) * 0.5 - center_dist * 0.3
+        return offsets
+
+    def calculate_rod_pressure(self, rod_num, rng=None):
+        """Calculate pressure at rod location (varies slightly by position).
+
+        Displays should pass their own ``rng`` so that redraws do not
+        consume the simulator's ``rod_pressure`` stream.
+        """
+        position_variation = self._pressure_offsets.get(rod_num)
+        if position_variation is None:
+            return self.pressure
+
+        rng = self.rng.rod_pressure if rng is None else rng
+        return self.pressure + position_variation + rng.uniform(-0.5, 0.5)
+
+    # -------- OPERATIONS --------
+    def scram(self):
+        """Emergency shutdown - returns False if the reactor was already offline"""
+        if not self.running:
+            self.log_console("Reactor is already offline")
+            return False
+
+        self.log_console("="*50)
+        self.log_console("!!! SCRAM ACTIVATED !!!")
+        self.log_console("="*50)
+
+        # Immediately insert all control rods
+        self.log_console("Inserting ALL control rods to 100%...")
+        self.actuators.cancel_all()  # no ramp may keep withdrawing rods or throttling pumps
+        for pos in self.control_rod_levels.keys():
+            self.control_rod_levels[pos] = 100.0
+
+        # Set cooling to maximum emergency flow (125 m³/h per pump = 250 total)
+        self.log_console("Setting emergency cooling to 250 m³/h...")
+        self.pump_flow[1] = 125.0
+        self.pump_flow[2] = 125.0
+        self.pump_status[1] = True
+        self.pump_status[2] = True
+
+        self.log_console("✓ All control rods: 100% INSERTED")
+        self.log_console("✓ Emergency cooling: 250 m³/h")
+        self.log_console("Fission chain reaction terminated")
+        self.log_console("Physics will naturally bring reactor to safe state...")
+        self.log_console("="*50)
+
+        self.running = False
+        self.log_arccs("SCRAM executed - all control rods inserted, emergency cooling active")
+        self.log_arccs("Reactor entering automatic decay heat removal mode")
+
+        self._emit("changed")
+        return True
+
+    def reset(self):
+        """Reset all session values to defaults"""
+        self.actuators.cancel_all()
+        self.control_rod_levels.clear()
+        self.temperatures.clear()
+        self.pump_flow.clear()
+        self.pump_status.clear()
+        self.core_power = 0.0
+        self.power_output_mw = 0.0
+        self.pressure = 100.0
+        self.coolant_temp_avg = 293.0  # Room temperature
+        self.radiation_level = 0.15  # Background radiation
+        self.turbine_rpm = 0.0
+        self.turbine_power_mw = 0.0
+        self.integrity = 100.0
+        self.running = False
+        # Reset fuel levels
+        for fuel_num in self.fuel_levels:
+            self.fuel_levels[fuel_num] = 100.0
+        # Clear all alerts
+        for alert_name in self.alerts:
+            self.alerts[alert_name] = False
+        for n in self.alarm_state.keys():
+            self._clear_alarm(n)
+        self._emit("changed")
+
+    def start(self):
+        """Begin the startup sequence as a simulated-time process"""
+        if self.running:
+            self.log_console("ERROR: Reactor is already running")
+            return False
+        self.start_process(self.startup_sequence())
+        return True
+
+    def startup_sequence(self):
+        """Realistic startup sequence - only manipulates physical controls"""
+        if self.startup_in_progress:
+            self.log_console("ERROR: Startup already in progress")
+            return
+
+        self.startup_in_progress = True
+        self.log_console("\n" + "="*50)
+        self.log_console("REACTOR STARTUP SEQUENCE INITIATED")
+        self.log_console("="*50)
+
+        # Phase 1: Pre-startup checks
+        self.log_console("Phase 1: Pre-startup safety checks")
+        yield 0.8
+        self.log_console("  Checking safety systems...")
+        yield 1.2
+        self.log_console("  ✓ Emergency cooling: READY")
+        yield 0.5
+        self.log_console("  ✓ Radiation monitoring: NOMINAL")
+        yield 0.5
+        self.log_console("  ✓ Containment integrity: VERIFIED")
+        yield 0.8
+
+        # Ensure all control rods are fully inserted
+        self.log_console("\n  Verifying control rod positions...")
+        for rod_num, letter in self.rod_to_letter.items():
+            if letter in CONTROL_RODS:
+                self.control_rod_levels[rod_num] = 100  # Full insertion
+        yield 1.0
+        self.log_console(f"  ✓ All {len(self.layout.control_rods)} control rods at full insertion")
+        yield 0.5
+        self.log_console("  ✓ Rod drive mechanisms: OPERATIONAL")
+        yield 0.8
+
+        # Phase 2: Cooling system startup
+        self.log_console("\nPhase 2: Cooling system initialization")
+        yield 0.8
+        self.log_console("  Starting primary circulation pump #1...")
+        yield from self._gradual_pump_startup(1, 120.0)
+
+        self.log_console("  Starting primary circulation pump #2...")
+        yield from self._gradual_pump_startup(2, 120.0)
+
+        self.log_console("  ✓ Primary coolant circulation: 240 m³/h total")
+        yield 0.8
+
+        # Phase 3: Pressurization
+        self.log_console("\nPhase 3: System pressurization")
+        yield 0.6
+        self.log_console("  Pressurizing primary circuit to 140 bar...")
+        yield from self._gradual_pressure_startup(100, 140)
+        self.log_console("  ✓ System pressure: 140 bar")
+        yield 0.8
+
+        # Phase 4: Approach to criticality
+        self.log_console("\nPhase 4: Nuclear startup - approaching criticality")
+        yield 1.0
+
+        # Withdraw manual control rods gradually
+        self.log_console("  Withdrawing control rods (Group 1: 100% → 70%)...")
+        yield from self._withdraw_control_rods_gradual(100, 70, rod_group=1)
+        yield 0.5
+        self.log_console(f"  Neutron flux: {sum(self.neutron_flux.values())/max(len(self.neutron_flux),1):.3f}x")
+        self.log_console(f"  Power: {self.core_power:.1f}% (subcritical)")
+        yield 1.0
+
+        self.log_console("  Withdrawing control rods (Group 1: 70% → 40%)...")
+        yield from self._withdraw_control_rods_gradual(70, 40, rod_group=1)
+        yield 0.5
+        self.log_console(f"  Neutron flux: {sum(self.neutron_flux.values())/max(len(self.neutron_flux),1):.3f}x")
+        self.log_console(f"  Power: {self.core_power:.1f}%")
+        yield 1.0
+
+        self.log_console("  ✓ CRITICALITY ACHIEVED - Self-sustaining chain reaction")
+        yield 0.8
+
+        # Phase 5: Power escalation
+        self.log_console("\nPhase 5: Power escalation to nominal operating level")
+        yield 0.8
+
+        self.log_console("  Withdrawing control rods (Group 1: 40% → 20%)...")
+        self.log_console("  Monitoring: Power ramping to 25%...")
+        yield from self._withdraw_control_rods_gradual(40, 20, rod_group=1)
+        yield 1.0
+        self.log_console(f"  ✓ Power: {self.core_power:.1f}%, Temp: {self.coolant_temp_avg:.0f}K")
+
+        self.log_console("\n  Withdrawing control rods (Group 2: 100% → 50%)...")
+        self.log_console("  Monitoring: Power ramping to 50%...")
+        yield from self._withdraw_control_rods_gradual(100, 50, rod_group=2)
+        yield 1.0
+        self.log_console(f"  ✓ Power: {self.core_power:.1f}%, Temp: {self.coolant_temp_avg:.0f}K")
+
+        self.log_console("\n  Final pressurization to operating pressure...")
+        yield from self._gradual_pressure_startup(140, 155)
+        self.log_console("  ✓ System pressure: 155 bar")
+        yield 0.8
+
+        self.log_console("\n  Withdrawing control rods (Group 2: 50% → 15%)...")
+        self.log_console("  Monitoring: Power ramping to 100%...")
+        yield from self._withdraw_control_rods_gradual(50, 15, rod_group=2)
+        yield 2.0
+
+        # Withdraw auto rods to operational position for ARCCS control
+        self.log_console("\n  Positioning AUTO control rods for ARCCS operation...")
+        auto_rods = self.layout.rods_by_type["A"]
+        for rod_num in auto_rods:
+            self.control_rod_levels[rod_num] = 50  # 50% insertion - middle position for ARCCS
+        self.log_console(f"  ✓ {len(auto_rods)} AUTO rods set to 50% insertion")
+        self.log_console("  ✓ ARCCS automatic control ready")
+        self.log_arccs(f"AUTO: {len(auto_rods)} auto rods initialized at 50% insertion for reactivity control")
+        yield 1.0
+
+        # Mark reactor as running
+        self.running = True
+
+        # Final status
+        self.log_console("\n" + "="*50)
+        self.log_console("REACTOR STARTUP COMPLETE")
+        self.log_console("  Status: ONLINE")
+        self.log_console(f"  Power: {self.core_power:.1f}% ({self.power_output_mw:.0f} MW thermal)")
+        self.log_console(f"  Temperature: {self.coolant_temp_avg:.0f}K")
+        self.log_console(f"  Pressure: {self.pressure:.1f} bar")
+        self.log_console(f"  Coolant flow: {sum(self.pump_flow.values()):.0f} m³/h")
+        self.log_console("  All systems: NOMINAL")
+        self.log_console("="*50)
+
+        self.log_arccs("Reactor startup complete - automatic control ACTIVE")
+        self.log_arccs("All systems nominal - monitoring core parameters")
+
+        self.startup_in_progress = False
+
+    # -------- ACTUATOR RAMPS --------
+    def _set_pump_flow(self, pump_num, flow):
+        self.pump_flow[pump_num] = flow
+        self.pump_status[pump_num] = flow > 0
+
+    def _set_pressure(self, value):
+        self.pressure = value
+
+    def _set_coolant_temp(self, value):
+        self.coolant_temp_avg = value
+
+    def ramp_pump(self, pump_num, target, rate=PUMP_RATE, on_done=None):
+        return self.actuators.ramp(("pump", pump_num),
+                                   lambda: self.pump_flow.get(pump_num, 0),
+                                   lambda flow: self._set_pump_flow(pump_num, flow),
+                                   target, rate, on_done)
+
+    def ramp_pressure(self, target, rate=PRESSURE_RATE, on_done=None):
+        return self.actuators.ramp("pressure", lambda: self.pressure, self._set_pressure,
+                                   target, rate, on_done)
+
+    def ramp_coolant_temp(self, target, rate=TEMP_RATE, on_done=None):
+        return self.actuators.ramp("coolant_temp", lambda: self.coolant_temp_avg, self._set_coolant_temp,
+                                   target, rate, on_done)
+
+    def ramp_rod(self, rod_num, target, rate=ROD_RATE, on_done=None):
+        levels = self.control_rod_levels
+        return self.actuators.ramp(("rod", rod_num),
+                                   lambda: levels.get(rod_num, 100),
+                                   lambda value: levels.__setitem__(rod_num, value),
+                                   target, rate, on_done)
+
+    def _gradual_pump_startup(self, pump_num, target):
+        """Helper for gradual pump changes during startup"""
+        self.pump_status[pump_num] = True
+        yield [self.ramp_pump(pump_num, target, rate=STARTUP_PUMP_RATE)]
+
+    def _gradual_pressure_startup(self, current, target):
+        """Helper for gradual pressure changes during startup"""
+        self.pressure = current
+        self._emit("changed")
+        yield [self.ramp_pressure(target, rate=STARTUP_PRESSURE_RATE)]
+
+    def _withdraw_control_rods_gradual(self, start_insertion, target_insertion, rod_group=1):
+        """Withdraw control rods gradually (realistic startup procedure)"""
+        # Get control rods for this group
+        control_rods = self.layout.rods_by_type["C"]  # Manual control rods only
+
+        # Divide into groups for sequential withdrawal
+        group_size = len(control_rods) // 2
+        if rod_group == 1:
+            selected_rods = control_rods[:group_size]
+        else:
+            selected_rods = control_rods[group_size:]
+
+        # Drive the whole group from start to target insertion together
+        ramps = []
+        for rod_num in selected_rods:
+            self.control_rod_levels[rod_num] = start_insertion
+            ramps.append(self.ramp_rod(rod_num, target_insertion))
+        self._emit("changed")
+        yield ramps
+
+    def _stabilized(self, key, target):
+        """``on_done`` callback announcing that actuator ``key`` settled"""
+        if key == "pressure":
+            message = f"✓ Pressure stabilized at {target:.1f} bar"
+        elif key == "coolant_temp":
+            message = f"✓ Temperature stabilized at {target:.0f}K"
+        elif key[0] == "pump":
+            message = f"✓ Pump {key[1]} stabilized at {target:.0f} m³/h"
+        else:
+            message = f"✓ Rod {key[1]} stabilized at {target:.0f}%"
+        return lambda: self.log_console(message)
+
+    def restore_ramp(self, key, target, rate, notify=False):
+        """Restart a ramp by actuator key (see ``helios_core.snapshot``)"""
+        on_done = self._stabilized(key, target) if notify else None
+        if key == "pressure":
+            return self.ramp_pressure(target, rate, on_done)
+        if key == "coolant_temp":
+            return self.ramp_coolant_temp(target, rate, on_done)
+        kind, number = key
+        if kind == "pump":
+            return self.ramp_pump(number, target, rate, on_done)
+        return self.ramp_rod(number, target, rate, on_done)
+
+    # -------- GRADUAL PARAMETER CHANGES --------
+    def gradual_pressure_change(self, target):
+        """Gradually change system pressure"""
+        self.log_console(f"Pressure adjustment: {self.pressure:.1f} bar → {target:.1f} bar")
+        return self.ramp_pressure(target, on_done=self._stabilized("pressure", target))
+
+    def gradual_pump_change(self, pump_num, target_flow):
+        """Gradually change pump flow rate"""
+        current_flow = self.pump_flow.get(pump_num, 0)
+        self.log_console(f"Pump {pump_num} adjustment: {current_flow:.0f} m³/h → {target_flow:.0f} m³/h")
+        return self.ramp_pump(pump_num, target_flow, on_done=self._stabilized(("pump", pump_num), target_flow))
+
+    def gradual_temp_change(self, target):
+        """Gradually change average temperature"""
+        self.log_console(f"Temperature adjustment: {self.coolant_temp_avg:.0f}K → {target:.0f}K")
+        return self.ramp_coolant_temp(target, on_done=self._stabilized("coolant_temp", target))
+
+    # -------- COMMAND PARSER --------
+    def execute(self, cmd_str):
+        """Execute an operator command against the simulator"""
+        parts = cmd_str.split()
+        if not parts:
+            return
+
+        try:
+            cmd = parts[0]
+
+            if cmd == "set":
+                if len(parts) < 3:
+                    self.log_console("ERROR: set requires rod number (or *) and insertion percentage")
+                    self.log_console("Usage: set <rod|*> <pct> [/override]")
+                    return
+
+                rod_spec = parts[1]
+                insertion = int(parts[2])
+                override = len(parts) > 3 and parts[3] == "/override"
+
+                if not 0 <= insertion <= 100:
+                    self.log_console(f"ERROR: Insertion must be 0-100%")
+                    return
+
+                # Wildcard - all control rods
+                if rod_spec == "*":
+                    # Determine which rod types to control
+                    if override:
+                        allowed_types = {"C", "A"}  # Control and Auto
+                        self.log_console(f"Setting ALL control and auto rods to {insertion}% insertion")
+                    else:
+                        allowed_types = {"C"}  # Only manual control rods
+                        self.log_console(f"Setting all control rods to {insertion}% insertion (use /override for auto rods)")
+
+                    count = 0
+                    for num, letter in self.rod_to_letter.items():
+                        if letter in allowed_types:
+                            self.actuators.cancel(("rod", num))
+                            self.control_rod_levels[num] = insertion
+                            count += 1
+
+                    self.log_console(f"✓ {count} rods set to {insertion}%")
+                    return
+
+                # Single rod
+                rod_num = int(rod_spec)
+                if rod_num not in self.rod_to_letter:
+                    self.log_console(f"ERROR: Rod {rod_num} does not exist")
+                    return
+
+                letter = self.rod_to_letter[rod_num]
+                if letter not in CONTROL_RODS:
+                    self.log_console(f"ERROR: Rod {rod_num} ({letter}) is not controllable")
+                    return
+
+                self.actuators.cancel(("rod", rod_num))
+                self.control_rod_levels[rod_num] = insertion
+                self.log_console(f"Rod {rod_num} set to {insertion}% insertion")
+
+            elif cmd == "temp":
+                if len(parts) < 3:
+                    self.log_console("ERROR: temp requires sensor rod number and temperature in K")
+                    return
+                rod_num = int(parts[1])
+                temperature = float(parts[2])
+
+                if rod_num not in self.rod_to_letter:
+                    self.log_console(f"ERROR: Rod {rod_num} does not exist")
+                    return
+
+                letter = self.rod_to_letter[rod_num]
+                if letter != "T":
+                    self.log_console(f"ERROR: Rod {rod_num} ({letter}) is not a temperature sensor")
+                    return
+
+                if temperature < 0 or temperature > 3500:
+                    self.log_console(f"ERROR: Temperature must be 0-3500K")
+                    return
+
+                self.temperatures[rod_num] = temperature
+                # Update average gradually
+                if self.temperatures:
+                    new_avg = sum(self.temperatures.values()) / len(self.temperatures)
+                    if abs(new_avg - self.coolant_temp_avg) > 5:
+                        self.gradual_temp_change(new_avg)
+                    else:
+                        self.coolant_temp_avg = new_avg
+                        self._emit("changed")
+                self.log_console(f"Temp sensor {rod_num} set to {temperature:.1f}K")
+
+            elif cmd == "pressure":
+                if len(parts) < 2:
+                    self.log_console("ERROR: pressure requires bar value")
+                    return
+                target_pressure = float(parts[1])
+                if target_pressure < 0 or target_pressure > 200:
+                    self.log_console(f"ERROR: Pressure must be 0-200 bar")
+                    return
+
+                current = self.pressure
+                self.log_console(f"Adjusting pressure from {current:.1f} to {target_pressure:.1f} bar")
+                self.gradual_pressure_change(target_pressure)
+
+            elif cmd == "pump":
+                if len(parts) < 3:
+                    self.log_console("ERROR: pump requires pump number (or *) and flow or on/off")
+                    self.log_console("Usage: pump <num|*> <flow|on|off>")
+                    return
+
+                pump_spec = parts[1]
+
+                # Determine target flow
+                try:
+                    target_flow = float(parts[2])
+                except ValueError:
+                    status = parts[2].lower() in ("on", "true", "1")
+                    target_flow = 120.0 if status else 0.0
+
+                # Wildcard - all pumps
+                if pump_spec == "*":
+                    self.log_console(f"Setting all pumps to {target_flow:.0f} m³/h")
+                    for pump_num in [1, 2]:  # RBMK has 2 main circulation pumps
+                        self.gradual_pump_change(pump_num, target_flow)
+                    self.log_console(f"✓ All pumps adjusting to {target_flow:.0f} m³/h")
+                    return
+
+                # Single pump
+                pump_num = int(pump_spec)
+                current_flow = self.pump_flow.get(pump_num, 0)
+
+                try:
+                    float(parts[2])  # Verify it's a flow value
+                    self.log_console(f"Adjusting pump {pump_num} flow from {current_flow:.0f} to {target_flow:.0f} m³/h")
+                except ValueError:
+                    status = parts[2].lower() in ("on", "true", "1")
+                    self.log_console(f"Setting pump {pump_num} to {'ON' if status else 'OFF'}")
+
+                self.gradual_pump_change(pump_num, target_flow)
+
+            elif cmd == "start":
+                self.start()
+
+            elif cmd == "reset":
+                self.reset()
+                self.log_console("System reset to defaults")
+
+            elif cmd == "scram":
+                self.scram()
+
+            elif cmd == "status":
+                self.log_status()
+
+            elif cmd in ("red", "yellow", "off", "text", "cleartext"):
+                if len(parts) < 2:
+                    self.log_console(f"ERROR: {cmd} requires a rod number")
+                    return
+                rod_num = int(parts[1])
+                if rod_num not in self.rod_to_letter:
+                    self.log_console(f"ERROR: Rod {rod_num} does not exist")
+                    return
+                if cmd in ("red", "yellow"):
+                    self.core.trigger(rod_num, cmd)
+                elif cmd == "off":
+                    self._clear_alarm(rod_num)
+                elif cmd == "text":
+                    self.core.set_text(rod_num, " ".join(parts[2:]))
+                else:
+                    self.core.clear_text(rod_num)
+                if cmd != "off":
+                    self._emit("changed")
+
+            elif cmd == "alloff":
+                for rod_num in self.rod_to_letter:
+                    self._clear_alarm(rod_num)
+
+            elif cmd == "ack":
+                self.acknowledge_alarms()
+
+            elif cmd in ("save", "load"):
+                if len(parts) < 2:
+                    self.log_console(f"ERROR: {cmd} requires a file name")
+                    return
+                from . import snapshot
+
+                path = " ".join(parts[1:])
+                try:
+                    if cmd == "save":
+                        size = snapshot.save(self, path)
+                        self.log_console(f"✓ Snapshot saved to {path} ({size} bytes, t={self.sim_time:.0f}s)")
+                    else:
+                        snapshot.load(path, self)
+                        self.log_console(f"✓ Snapshot {path} loaded (t={self.sim_time:.0f}s)")
+                except (OSError, snapshot.SnapshotError) as e:
+                    self.log_console(f"ERROR: {cmd} failed: {e}")
+
+            elif cmd == "arccs" and len(parts) > 1 and parts[1] == "accept":
+                # Execute ARCCS recommended commands
+                if not self.arccs_commands:
+                    self.log_console("ARCCS: No pending commands to execute")
+                else:
+                    self.log_console(f"ARCCS: Executing {len(self.arccs_commands)} recommended commands:")
+                    for arccs_cmd in self.arccs_commands:
+                        self.log_console(f"  > {arccs_cmd}")
+                        self.execute(arccs_cmd)
+                    self.log_console("✓ ARCCS commands executed")
+                    self.arccs_commands = []
+
+            else:
+                self.log_console(f"Unknown command: {cmd}")
+
+        except ValueError as e:
+            self.log_console("ERROR: Invalid command format")
+        except Exception as e:
+            self.log_console(f"ERROR: {str(e)}")
+
+    def log_status(self):
+        """Write a full reactor status report to the console"""
+        self.log_console("\n--- REACTOR STATUS ---")
+        self.log_console(f"Running: {'YES' if self.running else 'NO'}")
+        self.log_console(f"Seed: {self.rng.seed}  Sim time: {self.sim_time:.0f}s")
+        self.log_console(f"Power: {self.core_power:.1f}% ({self.power_output_mw:.0f} MW thermal)")
+        self.log_console(f"Electrical: {self.turbine_power_mw:.0f} MW")
+        self.log_console(f"Avg Temp: {self.coolant_temp_avg:.0f}K")
+        self.log_console(f"Pressure: {self.pressure:.1f} bar")
+        self.log_console(f"Integrity: {self.integrity:.1f}%")
+        self.log_console(f"Turbine: {self.turbine_rpm:.0f} RPM")
+        self.log_console(f"Radiation: {self.radiation_level:.2f} mSv/h")
+        self.log_console(f"Pump 1: {self.pump_flow.get(1, 0):.0f} m³/h {'ON' if self.pump_status.get(1, False) else 'OFF'}")
+        self.log_console(f"Pump 2: {self.pump_flow.get(2, 0):.0f} m³/h {'ON' if self.pump_status.get(2, False) else 'OFF'}")
+
+        # Show control rod status
+        if self.control_rod_levels:
+            manual_rods = [ins for num, ins in self.control_rod_levels.items()
+                           if self.rod_to_letter.get(num) == 'C']
+            auto_rods = [ins for num, ins in self.control_rod_levels.items()
+                         if self.rod_to_letter.get(num) == 'A']
+
+            if manual_rods:
+                avg_manual = sum(manual_rods) / len(manual_rods)
+                self.log_console(f"Manual Control Rods: {avg_manual:.1f}% avg insertion ({len(manual_rods)} rods)")
+            if auto_rods:
+                avg_auto = sum(auto_rods) / len(auto_rods)
+                self.log_console(f"Auto Control Rods: {avg_auto:.1f}% avg insertion ({len(auto_rods)} rods)")
+
+        if self.fuel_levels:
+            avg_fuel = sum(self.fuel_levels.values()) / len(self.fuel_levels)
+            self.log_console(f"Avg Fuel: {avg_fuel:.1f}%")
+
+        if self.neutron_flux:
+            avg_flux = sum(self.neutron_flux.values()) / len(self.neutron_flux)
+            self.log_console(f"Avg Neutron Flux: {avg_flux:.3f}x")
+
+        active_alerts = [name for name, active in self.alerts.items() if active]
+        if active_alerts:
+            self.log_console(f"Active Alerts: {', '.join(active_alerts)}")
+        else:
+            self.log_console("Active Alerts: None")
+        self.log_console("---\n")
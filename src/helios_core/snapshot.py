@@ -0,0 +1,184 @@
+"""Snapshots of the complete simulator state.
+
+``dumps``/``save`` serialize a ``ReactorSimulator`` to a small versioned
+binary blob and ``loads``/``load`` restore it, either into an existing
+simulator on the same layout or into a new one. A snapshot holds the core
+state columns, plant scalars, sensor temperatures, pumps, alerts, ARCCS
+state, ramps in flight, every RNG stream and the simulated clock, so a run
+resumed from a snapshot continues exactly as the original would have.
+
+Format::
+
+    HEADER (magic, version, flags, payload size, CRC-32), then a
+    zlib-compressed payload of:
+      meta JSON length (uint32), meta JSON
+      core columns in COLUMNS order, raw little-endian arrays
+      RNG streams: count (uint8), then per stream its name and MT state
+
+The startup sequence is a running process and cannot be captured; saving
+while it is in progress raises ``SnapshotError``.
+"""
+import json
+import struct
+import sys
+import zlib
+from array import array
+
+from .layout import compile_layout, default_layout
+from .simulator import ReactorSimulator
+from .state import ReactorCoreState
+
+MAGIC = b"HELIOSSN"
+VERSION = 1
+HEADER = struct.Struct("<8sHHII")  # magic, version, flags, payload size, CRC-32 of the payload
+LENGTH = struct.Struct("<I")
+MT_STATE = struct.Struct("<625IBd")  # Mersenne Twister words + position, has gauss, gauss_next
+
+COLUMNS = ("alarm_bits", "temp_offsets", "insertion", "fuel", "flux")
+SIM_FIELDS = ("sim_time", "coolant_temp_avg", "core_power", "power_output_mw", "pressure", "integrity",
+              "turbine_rpm", "turbine_power_mw", "radiation_level", "running",
+              "arccs_last_message_time", "arccs_recommendation", "arccs_commands")
+
+
+class SnapshotError(ValueError):
+    """A snapshot could not be taken or restored"""
+
+
+def _key(key):
+    return list(key) if isinstance(key, tuple) else key
+
+
+def _column_bytes(column):
+    if sys.byteorder == "big" and column.itemsize > 1:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def dumps(sim):
+    """Serialize ``sim`` to bytes"""
+    if sim._processes:
+        raise SnapshotError("cannot snapshot while the startup sequence is running")
+    layout = sim.layout
+    meta = {
+        "seed": sim.rng.seed,
+        "layout": {"name": layout.name, "grid": list(layout.grid)},
+        "sim": {name: getattr(sim, name) for name in SIM_FIELDS},
+        "temperatures": list(sim.temperatures.items()),
+        "pump_flow": list(sim.pump_flow.items()),
+        "pump_status": list(sim.pump_status.items()),
+        "alerts": [name for name, active in sim.alerts.items() if active],
+        "custom_text": list(sim.core.custom_text.items()),
+        # ramps in flight; ``notify`` ramps log a message once they settle
+        "ramps": [[_key(ramp.key), ramp.target, ramp.rate, ramp.on_done is not None]
+                  for ramp in sim.actuators.ramps.values()],
+    }
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+
+    parts = [LENGTH.pack(len(meta_bytes)), meta_bytes]
+    parts.extend(_column_bytes(getattr(sim.core, name)) for name in COLUMNS)
+    streams = sim.rng.getstate()
+    parts.append(bytes([len(streams)]))
+    for name, (_, words, gauss) in streams.items():
+        encoded = name.encode("ascii")
+        parts.append(bytes([len(encoded)]) + encoded)
+        parts.append(MT_STATE.pack(*words, gauss is not None, gauss or 0.0))
+
+    payload = zlib.compress(b"".join(parts))
+    return HEADER.pack(MAGIC, VERSION, 0, len(payload), zlib.crc32(payload)) + payload
+
+
+def _layout_for(grid, name):
+    default = default_layout()
+    if tuple(grid) == default.grid:
+        return default
+    return compile_layout(grid, name)
+
+
+def loads(data, sim=None, backend="auto"):
+    """Restore a snapshot, into ``sim`` if given (its layout must match),
+    otherwise into a new simulator using ``backend``. Returns the simulator."""
+    if len(data) < HEADER.size:
+        raise SnapshotError("not a snapshot")
+    magic, version, _, size, crc = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("not a snapshot")
+    if version != VERSION:
+        raise SnapshotError(f"snapshot version {version} is not supported (expected {VERSION})")
+    payload = data[HEADER.size:HEADER.size + size]
+    if len(payload) != size or zlib.crc32(payload) != crc:
+        raise SnapshotError("snapshot is truncated or corrupt")
+    body = memoryview(zlib.decompress(payload))
+
+    (meta_size,) = LENGTH.unpack_from(body)
+    offset = LENGTH.size
+    meta = json.loads(bytes(body[offset:offset + meta_size]))
+    offset += meta_size
+
+    grid = meta["layout"]["grid"]
+    if sim is None:
+        layout = _layout_for(grid, meta["layout"]["name"])
+        sim = ReactorSimulator(ReactorCoreState(layout), backend=backend, seed=meta["seed"])
+    elif list(sim.layout.grid) != grid:
+        raise SnapshotError(f"snapshot is of layout {meta['layout']['name']!r}, not {sim.layout.name!r}")
+
+    core = sim.core
+    columns = {}
+    for name in COLUMNS:
+        column = getattr(core, name)
+        size = column.itemsize * len(column)
+        restored = array(column.typecode, bytes(body[offset:offset + size]))
+        if sys.byteorder == "big" and column.itemsize > 1:
+            restored.byteswap()
+        columns[name] = restored
+        offset += size
+
+    streams = {}
+    count = body[offset]
+    offset += 1
+    for _ in range(count):
+        length = body[offset]
+        name = bytes(body[offset + 1:offset + 1 + length]).decode("ascii")
+        offset += 1 + length
+        *words, has_gauss, gauss = MT_STATE.unpack_from(body, offset)
+        offset += MT_STATE.size
+        streams[name] = (3, tuple(words), gauss if has_gauss else None)
+
+    # Everything is decoded; only now touch the simulator
+    sim._processes.clear()
+    sim.startup_in_progress = False
+    sim.actuators.cancel_all()
+    for name, restored in columns.items():
+        getattr(core, name)[:] = restored  # in place: views and kernels keep their buffers
+    core.custom_text.clear()
+    core.custom_text.update((int(rod), text) for rod, text in meta["custom_text"])
+    for name, value in meta["sim"].items():
+        setattr(sim, name, value)
+    sim.temperatures.clear()
+    sim.temperatures.update((int(rod), value) for rod, value in meta["temperatures"])
+    sim.pump_flow.clear()
+    sim.pump_flow.update((int(n), value) for n, value in meta["pump_flow"])
+    sim.pump_status.clear()
+    sim.pump_status.update((int(n), value) for n, value in meta["pump_status"])
+    active = set(meta["alerts"])
+    for name in sim.alerts:
+        sim.alerts[name] = name in active
+    sim.rng.seed = meta["seed"]
+    sim.rng.setstate(streams)
+    for key, target, rate, notify in meta["ramps"]:
+        sim.restore_ramp(tuple(key) if isinstance(key, list) else key, target, rate, notify)
+    sim._emit("restored")
+    sim._emit("changed")
+    return sim
+
+
+def save(sim, path):
+    data = dumps(sim)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def load(path, sim=None, backend="auto"):
+    with open(path, "rb") as f:
+        return loads(f.read(), sim, backend)
@@ -1,57 +1,239 @@
-from dataclasses import dataclass, field
+"""Per-channel core state stored as a struct of arrays.
 
-from .reactor_data import CONTROL_RODS, GRID_LETTERS
+Every channel quantity lives in an ``array`` column indexed by the dense
+rod indices of the compiled ``CoreLayout`` (shared between instances):
+control rod insertion, fuel, neutron flux, temperature offsets and an
+alarm bitfield. Dict-like ``ColumnView`` and ``AlarmView`` wrappers keep
+the ``state.control_rod_levels[rod]`` style of access working, and
+``copy()`` duplicates a whole state by copying a handful of arrays.
+"""
+from array import array
+from collections.abc import MutableMapping
+
+from .layout import compile_layout, default_layout
+from .reactor_data import CONTROL_RODS
+
+ALARM_MODES = ("off", "red", "yellow")  # alarm mode code -> name
+MODE_MASK = 0b0011
+FLASH = 0b0100
+PHASE = 0b1000
+MODE_CODES = {mode: code for code, mode in enumerate(ALARM_MODES)}
+
+
+class ColumnView(MutableMapping):
+    """Dict-like view of one state column keyed by rod number.
+
+    The key set is fixed by the layout; deleting or clearing entries
+    restores them to ``default``.
+    """
+
+    __slots__ = ("rods", "index", "data", "default")
+
+    def __init__(self, rods, index, data, default):
+        self.rods = rods      # rod numbers in column order
+        self.index = index    # rod number -> column index
+        self.data = data      # array column
+        self.default = default
+
+    def __getitem__(self, rod_number):
+        return self.data[self.index[rod_number]]
+
+    def __setitem__(self, rod_number, value):
+        self.data[self.index[rod_number]] = value
+
+    def __delitem__(self, rod_number):
+        self.data[self.index[rod_number]] = self.default
+
+    def __contains__(self, rod_number):
+        return rod_number in self.index
+
+    def __iter__(self):
+        return iter(self.rods)
+
+    def __len__(self):
+        return len(self.rods)
+
+    def get(self, rod_number, default=None):
+        i = self.index.get(rod_number)
+        return default if i is None else self.data[i]
+
+    def keys(self):
+        return self.rods
+
+    def values(self):
+        return self.data.tolist()
+
+    def items(self):
+        return zip(self.rods, self.data)
+
+    def clear(self):
+        self.data[:] = array(self.data.typecode, [self.default]) * len(self.data)
+
+    def __repr__(self):
+        return f"ColumnView({dict(self.items())!r})"
+
+
+class AlarmRecord:
+    """``{"mode", "flash", "phase"}`` view of one rod's alarm bits"""
+
+    __slots__ = ("bits", "i")
+
+    def __init__(self, bits, i):
+        self.bits = bits
+        self.i = i
+
+    def __getitem__(self, key):
+        code = self.bits[self.i]
+        if key == "mode":
+            return ALARM_MODES[code & MODE_MASK]
+        if key == "flash":
+            return bool(code & FLASH)
+        if key == "phase":
+            return bool(code & PHASE)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        code = self.bits[self.i]
+        if key == "mode":
+            code = (code & ~MODE_MASK) | MODE_CODES[value]
+        elif key in ("flash", "phase"):
+            flag = FLASH if key == "flash" else PHASE
+            code = code | flag if value else code & ~flag
+        else:
+            raise KeyError(key)
+        self.bits[self.i] = code
+
+    def to_dict(self):
+        return {"mode": self["mode"], "flash": self["flash"], "phase": self["phase"]}
+
+
+class AlarmView(MutableMapping):
+    """Dict-like view of the alarm bitfield: rod number -> AlarmRecord"""
+
+    __slots__ = ("index", "bits")
+
+    def __init__(self, index, bits):
+        self.index = index
+        self.bits = bits
+
+    def __getitem__(self, rod_number):
+        return AlarmRecord(self.bits, self.index[rod_number])
+
+    def __setitem__(self, rod_number, info):
+        record = AlarmRecord(self.bits, self.index[rod_number])
+        self.bits[record.i] = 0
+        for key in ("mode", "flash", "phase"):
+            record[key] = info.get(key, ALARM_MODES[0] if key == "mode" else False)
+
+    def __delitem__(self, rod_number):
+        self.bits[self.index[rod_number]] = 0
+
+    def __contains__(self, rod_number):
+        return rod_number in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
 
 
-@dataclass
 class ReactorCoreState:
-    rod_to_pos: dict[int, tuple[int, int]] = field(default_factory=dict)
-    rod_to_letter: dict[int, str] = field(default_factory=dict)
-    alarm_state: dict[int, dict[str, object]] = field(default_factory=dict)
-    custom_text: dict[int, str] = field(default_factory=dict)
-    control_rod_levels: dict[int, int] = field(default_factory=dict)
-
-    def __post_init__(self):
-        if self.rod_to_pos:
-            return
-
-        number = 1
-        for row_index in range(len(GRID_LETTERS)):
-            for col_index in range(len(GRID_LETTERS[row_index])):
-                letter = GRID_LETTERS[row_index][col_index]
-                if letter == "P":
-                    continue
-                self.rod_to_pos[number] = (row_index, col_index)
-                self.rod_to_letter[number] = letter
-                self.alarm_state[number] = {"mode": "off", "flash": False, "phase": False}
-                if letter in CONTROL_RODS:
-                    self.control_rod_levels[number] = 100
-                number += 1
+    def __init__(self, layout=None):
+        self.layout = layout if layout is not None else default_layout()
+        layout = self.layout
+        self.custom_text = {}  # rod number -> message override
+
+        self.alarm_bits = array("B", bytes(len(layout)))  # mode | FLASH | PHASE per rod
+        self.temp_offsets = array("d", bytes(8 * len(layout)))
+        self.insertion = array("d", [100.0]) * len(layout.control_rods)
+        self.fuel = array("d", [100.0]) * len(layout.fuel_rods)
+        self.flux = array("d", bytes(8 * len(layout.fuel_rods)))
+        self._make_views()
+
+    def _make_views(self):
+        layout = self.layout
+        self.alarm_state = AlarmView(layout.rod_index, self.alarm_bits)
+        self.rod_temp_offsets = ColumnView(list(layout.rod_to_letter), layout.rod_index, self.temp_offsets, 0.0)
+        self.control_rod_levels = ColumnView(layout.control_rods, layout.control_index, self.insertion, 100.0)
+        self.fuel_levels = ColumnView(layout.fuel_rods, layout.fuel_index, self.fuel, 100.0)
+        self.neutron_flux = ColumnView(layout.fuel_rods, layout.fuel_index, self.flux, 0.0)
+
+    @classmethod
+    def from_grid(cls, grid, name="custom"):
+        """State for a layout other than the shipped ``GRID_LETTERS``"""
+        return cls(compile_layout(grid, name))
+
+    def copy(self):
+        """Independent copy sharing the (immutable) layout"""
+        clone = object.__new__(type(self))
+        clone.layout = self.layout
+        clone.custom_text = dict(self.custom_text)
+        for column in ("alarm_bits", "temp_offsets", "insertion", "fuel", "flux"):
+            setattr(clone, column, array(getattr(self, column).typecode, getattr(self, column)))
+        clone._make_views()
+        return clone
+
+    __copy__ = copy
+
+    @property
+    def rod_to_pos(self):
+        return self.layout.rod_to_pos
+
+    @property
+    def rod_to_letter(self):
+        return self.layout.rod_to_letter
+
+    # -------- ALARMS --------
+    def alarm_mode(self, rod_number):
+        return ALARM_MODES[self.alarm_bits[self.layout.rod_index[rod_number]] & MODE_MASK]
+
+    def is_flashing(self, rod_number):
+        return bool(self.alarm_bits[self.layout.rod_index[rod_number]] & FLASH)
 
     def trigger(self, rod_number: int, colour: str):
-        if rod_number not in self.alarm_state:
+        i = self.layout.rod_index.get(rod_number)
+        if i is None:
             return False
-        self.alarm_state[rod_number]["mode"] = colour
-        self.alarm_state[rod_number]["flash"] = True
+        self.alarm_bits[i] = (self.alarm_bits[i] & PHASE) | MODE_CODES[colour] | FLASH
         return True
 
     def turn_off(self, rod_number: int):
-        if rod_number not in self.alarm_state:
+        i = self.layout.rod_index.get(rod_number)
+        if i is None:
             return False
-        self.alarm_state[rod_number] = {"mode": "off", "flash": False, "phase": False}
+        self.alarm_bits[i] = 0
         return True
 
     def all_off(self):
-        for rod_number in self.alarm_state:
-            self.turn_off(rod_number)
+        self.alarm_bits[:] = array("B", bytes(len(self.alarm_bits)))
 
     def acknowledge(self):
-        for info in self.alarm_state.values():
-            if info["mode"] in ("red", "yellow"):
-                info["flash"] = False
+        """Stop red and yellow alarms flashing; returns [(rod, mode)] acknowledged"""
+        bits = self.alarm_bits
+        acknowledged = []
+        for rod_number, i in self.layout.rod_index.items():
+            code = bits[i]
+            if code & MODE_MASK:
+                bits[i] = code & ~FLASH
+                acknowledged.append((rod_number, ALARM_MODES[code & MODE_MASK]))
+        return acknowledged
+
+    def toggle_flash_phase(self):
+        """Flip the phase of every flashing alarm; returns [(rod, mode, phase_on)]"""
+        bits = self.alarm_bits
+        flashing = []
+        for rod_number, i in self.layout.rod_index.items():
+            code = bits[i]
+            if code & FLASH:
+                code ^= PHASE
+                bits[i] = code
+                flashing.append((rod_number, ALARM_MODES[code & MODE_MASK], bool(code & PHASE)))
+        return flashing
 
+    # -------- CONTROLS --------
     def set_text(self, rod_number: int, message: str):
-        if rod_number not in self.alarm_state:
+        if rod_number not in self.layout.rod_index:
             return False
         self.custom_text[rod_number] = message
         return True
@@ -0,0 +1,265 @@
+"""Binary telemetry recording into a memory-mapped ring file.
+
+``TelemetryRecorder`` appends one fixed-width frame per physics tick to a
+preallocated file mapped with ``mmap``. A frame holds the plant scalars,
+the alert bits and the per-channel flux, fuel, rod insertion and alarm
+columns; the columns are copied straight from the ``ReactorCoreState``
+arrays into the mapping, so recording allocates nothing per tick.
+
+File layout (little endian)::
+
+    header   HEADER struct, then the fuel and control rod numbers (uint32)
+    frames   capacity x frame_size bytes, frame n at slot n % capacity
+
+Each frame starts with its sequence number and the header's ``count`` is
+updated after the frame is complete, so ``TelemetryReader`` can follow a
+file that is still being written by another process and discard frames
+overwritten while it was reading them.
+"""
+import mmap
+import os
+import struct
+from array import array
+
+from .simulator import ALERT_NAMES
+
+MAGIC = b"HELIOSTM"
+VERSION = 1
+DEFAULT_CAPACITY = 36000  # frames; ten hours at one tick per simulated second
+
+# magic, version, header size, frame size, capacity, fuel rods, control rods, channels, flags
+HEADER = struct.Struct("<8sHHIIIIII")
+COUNT = struct.Struct("<Q")  # frames written so far, follows HEADER
+COUNT_OFFSET = (HEADER.size + 7) // 8 * 8  # 8-byte aligned for atomic-width updates
+FLAG_CLOSED = 1  # the recorder has finished
+
+# seq, sim_time, core_power, power_output_mw, coolant_temp_avg, pressure,
+# turbine_rpm, turbine_power_mw, radiation_level, integrity, alerts, status
+SCALARS = struct.Struct("<Q9dII")
+SCALAR_FIELDS = ("sim_time", "core_power", "power_output_mw", "coolant_temp_avg", "pressure",
+                 "turbine_rpm", "turbine_power_mw", "radiation_level", "integrity")
+ALERT_ORDER = [name for row in ALERT_NAMES for name in row]  # bit i of ``alerts``
+STATUS_RUNNING = 1
+STATUS_STARTUP = 2
+
+
+def _align(size, to=8):
+    return (size + to - 1) // to * to
+
+
+def frame_layout(n_fuel, n_control, n_rods):
+    """Byte offsets of the frame sections and the total frame size"""
+    flux = SCALARS.size
+    fuel = flux + 8 * n_fuel
+    insertion = fuel + 8 * n_fuel
+    alarms = insertion + 8 * n_control
+    return {"flux": flux, "fuel": fuel, "insertion": insertion, "alarms": alarms,
+            "size": _align(alarms + n_rods)}
+
+
+def alert_mask(alerts):
+    mask = 0
+    for bit, name in enumerate(ALERT_ORDER):
+        if alerts.get(name):
+            mask |= 1 << bit
+    return mask
+
+
+def write_frame(buf, base, sections, sim, seq):
+    """Write a frame of ``sim`` at offset ``base`` of ``buf``; ``sections``
+    is the ``frame_layout`` of its core"""
+    core = sim.core
+    status = (STATUS_RUNNING if sim.running else 0) | (STATUS_STARTUP if sim.startup_in_progress else 0)
+    SCALARS.pack_into(buf, base, seq, sim.sim_time, sim.core_power, sim.power_output_mw,
+                      sim.coolant_temp_avg, sim.pressure, sim.turbine_rpm, sim.turbine_power_mw,
+                      sim.radiation_level, sim.integrity, alert_mask(sim.alerts), status)
+    # Columns go straight from the state arrays' buffers into the target
+    # (as bytes, which a memoryview target requires)
+    for name, column in (("flux", core.flux), ("fuel", core.fuel), ("insertion", core.insertion)):
+        offset = base + sections[name]
+        buf[offset:offset + 8 * len(column)] = memoryview(column).cast("B")
+    offset = base + sections["alarms"]
+    buf[offset:offset + len(core.alarm_bits)] = core.alarm_bits
+
+
+def read_frame(buf, base, sections, n_fuel, n_control, n_rods):
+    """The frame at offset ``base`` of ``buf`` as a dict"""
+    values = SCALARS.unpack_from(buf, base)
+    frame = dict(zip(SCALAR_FIELDS, values[1:10]))
+    frame["seq"] = values[0]
+    frame["alerts"] = values[10]
+    frame["running"] = bool(values[11] & STATUS_RUNNING)
+    frame["startup_in_progress"] = bool(values[11] & STATUS_STARTUP)
+    for name, length in (("flux", n_fuel), ("fuel", n_fuel), ("insertion", n_control)):
+        offset = base + sections[name]
+        frame[name] = array("d", buf[offset:offset + 8 * length])
+    offset = base + sections["alarms"]
+    frame["alarms"] = array("B", buf[offset:offset + n_rods])
+    return frame
+
+
+class TelemetryRecorder:
+    """Record ``sim`` ticks into the ring file at ``path``.
+
+    ``every`` records one frame per that many physics ticks. The recorder
+    subscribes itself to ``sim``; call ``close()`` when the run ends.
+    """
+
+    def __init__(self, path, sim, capacity=DEFAULT_CAPACITY, every=1):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.path = path
+        self.sim = sim
+        self.core = sim.core
+        self.capacity = capacity
+        self.every = max(1, int(every))
+        self.count = 0
+        self._ticks = 0
+
+        layout = sim.layout
+        self.sections = frame_layout(len(layout.fuel_rods), len(layout.control_rods), len(layout))
+        self.frame_size = self.sections["size"]
+        rod_numbers = array("I", layout.fuel_rods + layout.control_rods)
+        self.header_size = _align(COUNT_OFFSET + COUNT.size + rod_numbers.itemsize * len(rod_numbers))
+
+        self._file = open(path, "w+b")
+        self._file.truncate(self.header_size + capacity * self.frame_size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._header = (MAGIC, VERSION, self.header_size, self.frame_size, capacity,
+                        len(layout.fuel_rods), len(layout.control_rods), len(layout))
+        HEADER.pack_into(self._mm, 0, *self._header, 0)
+        COUNT.pack_into(self._mm, COUNT_OFFSET, 0)
+        start = COUNT_OFFSET + COUNT.size
+        self._mm[start:start + rod_numbers.itemsize * len(rod_numbers)] = rod_numbers.tobytes()
+        sim.subscribe(self.on_event)
+
+    def on_event(self, event, payload):
+        if event == "tick":
+            self._ticks += 1
+            if self._ticks % self.every == 0:
+                self.record()
+
+    def record(self):
+        """Append a frame of the current simulator state"""
+        base = self.header_size + (self.count % self.capacity) * self.frame_size
+        write_frame(self._mm, base, self.sections, self.sim, self.count)
+        self.count += 1
+        COUNT.pack_into(self._mm, COUNT_OFFSET, self.count)
+
+    def close(self):
+        if self._mm is None:
+            return
+        self.sim.unsubscribe(self.on_event)
+        HEADER.pack_into(self._mm, 0, *self._header, FLAG_CLOSED)
+        self._mm.flush()
+        self._mm.close()
+        self._file.close()
+        self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def format_frame(frame):
+    alerts = TelemetryReader.alert_names(frame["alerts"])
+    max_flux = max(frame["flux"], default=0.0)
+    state = "running" if frame["running"] else "startup" if frame["startup_in_progress"] else "offline"
+    return (f"#{frame['seq']:<7} t={frame['sim_time']:9.1f}s  {state:<7}  power {frame['core_power']:5.1f}%  "
+            f"temp {frame['coolant_temp_avg']:6.1f}K  {frame['pressure']:5.1f} bar  "
+            f"max flux {max_flux:4.2f}  alerts: {', '.join(alerts) or 'none'}")
+
+
+class TelemetryError(ValueError):
+    """A telemetry file could not be read"""
+
+
+class TelemetryReader:
+    """Read frames from a telemetry file, possibly while it is being written"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size + COUNT.size:
+            self._file.close()
+            raise TelemetryError(f"{path} is not a telemetry file")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.header_size, self.frame_size, self.capacity,
+         self.n_fuel, self.n_control, self.n_rods, _) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise TelemetryError(f"{path} is not a telemetry file")
+        if version != VERSION:
+            self.close()
+            raise TelemetryError(f"{path} has telemetry version {version}, expected {VERSION}")
+        self.sections = frame_layout(self.n_fuel, self.n_control, self.n_rods)
+        start = COUNT_OFFSET + COUNT.size
+        numbers = array("I", self._mm[start:start + 4 * (self.n_fuel + self.n_control)])
+        self.fuel_rods = list(numbers[:self.n_fuel])
+        self.control_rods = list(numbers[self.n_fuel:])
+
+    @property
+    def count(self):
+        """Frames written so far (including ones since overwritten)"""
+        return COUNT.unpack_from(self._mm, COUNT_OFFSET)[0]
+
+    @property
+    def closed(self):
+        """True once the recorder has finished"""
+        return bool(HEADER.unpack_from(self._mm, 0)[-1] & FLAG_CLOSED)
+
+    def _oldest(self, count):
+        # While recording, the slot written next holds frame count - capacity
+        return max(0, count - self.capacity + (0 if self.closed else 1))
+
+    @property
+    def first(self):
+        """Sequence number of the oldest complete frame in the ring"""
+        return self._oldest(self.count)
+
+    def _read(self, seq):
+        base = self.header_size + (seq % self.capacity) * self.frame_size
+        return read_frame(self._mm, base, self.sections, self.n_fuel, self.n_control, self.n_rods)
+
+    def frame(self, seq):
+        """Frame ``seq``, or None if it has not been written or was overwritten"""
+        count = self.count
+        if not self._oldest(count) <= seq < count:
+            return None
+        frame = self._read(seq)
+        # Discard the frame if the writer lapped us while we were reading it
+        if frame["seq"] != seq or seq < self._oldest(self.count):
+            return None
+        return frame
+
+    def frames(self, start=None, stop=None):
+        """Yield the frames from ``start`` (default: oldest) up to ``stop``
+        (default: the latest written when called), skipping lost ones"""
+        seq = self.first if start is None else max(start, self.first)
+        stop = self.count if stop is None else min(stop, self.count)
+        while seq < stop:
+            frame = self.frame(seq)
+            if frame is not None:
+                yield frame
+            seq += 1
+
+    def latest(self):
+        count = self.count
+        return self.frame(count - 1) if count else None
+
+    @staticmethod
+    def alert_names(mask):
+        return [name for bit, name in enumerate(ALERT_ORDER) if mask & (1 << bit)]
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,423 @@
+"""Terminal control station built on Textual.
+
+``ReactorApp`` drives a ``ReactorSimulator`` like ``GridUI`` does, on
+Textual's event loop instead of Tk's, and shows the core map, status
+panels, alert grid, ARCCS log, console and a command line. It works over
+SSH and needs no display. Given a ``Fleet`` it steps every unit and
+shows one of them at a time.
+
+Redraws are decoupled from the physics: ticks only mark the display
+dirty and the widgets are refreshed ``REFRESH_HZ`` times a second. Every
+widget keeps the last values it drew (status texts, active alerts, the
+quantized colour of each core map cell), so only what changed is
+repainted; the core map rebuilds just the rows whose cells changed.
+"""
+import time
+
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.containers import ScrollableContainer, Vertical
+from textual.geometry import Region
+from textual.reactive import reactive
+from textual.strip import Strip
+from textual.widget import Widget
+from textual.widgets import Footer, Input, Log, Static
+
+from .clock import SimClock
+from .feed import TelemetryFeed
+from .fleet import format_status
+from .gauges import EMPTY, FLUX_RAMP, FUEL_RAMP, TEMP_RAMP, lookup
+from .server import CommandServer, run_commands
+from .simulator import ALERT_NAMES, ReactorSimulator
+from .state import FLASH, MODE_MASK
+
+REFRESH_HZ = 4
+FLASH_PERIOD = 0.4  # seconds per flash phase, as in the Tk frontend
+CELL_WIDTH = 3
+
+RED = "#ff3b30"
+YELLOW = "#ffd60a"
+FLASH_DARK = "#1a1a1a"
+
+# map mode -> (title, ramp, value(sim, rod) normalized to 0-1)
+MAP_MODES = {
+    "flux": ("Neutron flux 0-3x", FLUX_RAMP, lambda sim, rod: sim.neutron_flux.get(rod, 0.0) / 3.0),
+    "temp": ("Channel temperature 250-700K", TEMP_RAMP,
+             lambda sim, rod: (sim.calculate_rod_temperature(rod) - 250) / 450),
+    "fuel": ("Fuel 0-100%", FUEL_RAMP, lambda sim, rod: sim.fuel_levels.get(rod, 0.0) / 100),
+}
+
+STATUS_FIELDS = (
+    ("CORE", (("Power", "{0.core_power:.1f}", "%"), ("Output", "{0.power_output_mw:.0f}", "MW"),
+              ("Avg Temp", "{0.coolant_temp_avg:.0f}", "K"))),
+    ("SYSTEM", (("Pressure", "{0.pressure:.1f}", "bar"), ("Integrity", "{0.integrity:.1f}", "%"))),
+    ("TURBINES", (("Speed", "{0.turbine_rpm:.0f}", "RPM"), ("Power", "{0.turbine_power_mw:.0f}", "MW"))),
+    ("RADIATION", (("Control Rm", "{0.radiation_level:.2f}", "mSv/h"),)),
+)
+
+HELP = """\
+Keys: F2 acknowledge  F3 map mode  F8 SCRAM  Ctrl+Q quit
+Commands are the console commands of the Tk station:
+  start, scram, set <rod|*> <pct> [/override], temp <sensor> <K>,
+  pressure <bar>, pump <num|*> <flow>, arccs accept, reset, status,
+  red/yellow/off/text <rod>, alloff, ack, save <file>, load <file>"""
+FLEET_HELP = """Fleet: F5/F6 previous/next unit, 'unit' lists the units, 'unit <n>' shows unit n"""
+
+
+class CoreMap(Widget):
+    """Core layout, one ``CELL_WIDTH`` cell per channel, coloured by the
+    current map mode; alarms override the colour and flash until acknowledged"""
+
+    DEFAULT_CSS = """
+    CoreMap {
+        height: auto;
+        width: auto;
+    }
+    """
+
+    mode = reactive("flux")
+
+    def __init__(self, sim, **kwargs):
+        super().__init__(**kwargs)
+        self.sim = sim
+        layout = sim.layout
+        self.rows = [[None] * layout.cols for _ in range(layout.rows)]
+        for number, (r, c) in layout.rod_to_pos.items():
+            self.rows[r][c] = number
+        self._letters = layout.rod_to_letter
+        self._alarm_index = layout.rod_index
+        self._styles = {}
+        self._codes = [None] * layout.rows  # per row: the cell codes last drawn
+        self._strips = [Strip.blank(layout.cols * CELL_WIDTH)] * layout.rows
+
+    def get_content_width(self, container, viewport):
+        return len(self.rows[0]) * CELL_WIDTH if self.rows else 0
+
+    def get_content_height(self, container, viewport, width):
+        return len(self.rows)
+
+    def _style(self, background, colour):
+        style = self._styles.get((background, colour))
+        if style is None:
+            style = self._styles[(background, colour)] = Style(bgcolor=background, color=colour, bold=True)
+        return style
+
+    def _cell(self, number, ramp, value, phase):
+        """A hashable code of everything that decides how a cell is drawn"""
+        code = self.sim.core.alarm_bits[self._alarm_index[number]] & (MODE_MASK | FLASH)
+        if code & MODE_MASK:
+            colour = RED if code & MODE_MASK == 1 else YELLOW
+            if code & FLASH and not phase:
+                colour = FLASH_DARK
+            return colour, "black" if colour != FLASH_DARK else "white"
+        if self._letters[number] != "F" and self.mode == "fuel":
+            return EMPTY
+        return lookup(ramp, value(self.sim, number))
+
+    def update_cells(self):
+        """Recompute the cell colours; rebuilds and refreshes changed rows only"""
+        _, ramp, value = MAP_MODES[self.mode]
+        phase = int(time.monotonic() / FLASH_PERIOD) % 2
+        width = len(self.rows[0]) * CELL_WIDTH
+        for y, row in enumerate(self.rows):
+            codes = tuple(None if number is None else self._cell(number, ramp, value, phase) for number in row)
+            if codes == self._codes[y]:
+                continue
+            self._codes[y] = codes
+            segments = []
+            for number, code in zip(row, codes):
+                if code is None:
+                    segments.append(Segment(" " * CELL_WIDTH))
+                else:
+                    segments.append(Segment(f" {self._letters[number]} ", self._style(*code)))
+            self._strips[y] = Strip(segments, width)
+            self.refresh(Region(0, y, width, 1))
+
+    def watch_mode(self, mode):
+        self._codes = [None] * len(self.rows)
+        self.update_cells()
+
+    def render_line(self, y):
+        if y < len(self._strips):
+            return self._strips[y]
+        return Strip.blank(self.size.width)
+
+
+class StatusPanel(Static):
+    """Plant readings; ``readings`` is only repainted when a value changes"""
+
+    readings = reactive((), layout=False)
+
+    def __init__(self, sim, **kwargs):
+        super().__init__(**kwargs)
+        self.sim = sim
+
+    def update_readings(self):
+        sim = self.sim
+        pumps = tuple((n, sim.pump_flow.get(n, 0.0), sim.pump_status.get(n, False)) for n in sorted(sim.pump_flow))
+        state = "RUNNING" if sim.running else "STARTUP" if sim.startup_in_progress else "OFFLINE"
+        self.readings = (state, tuple(fmt.format(sim) for _, fields in STATUS_FIELDS for _, fmt, _ in fields),
+                         tuple((n, f"{flow:.0f}", on) for n, flow, on in pumps))
+
+    def watch_readings(self, readings):
+        if not readings:
+            return
+        state, values, pumps = readings
+        colour = {"RUNNING": "green", "STARTUP": "yellow"}.get(state, "red")
+        text = Text.assemble(("REACTOR ", "bold"), (state, f"bold {colour}"), "\n")
+        values = iter(values)
+        for title, fields in STATUS_FIELDS:
+            text.append(f"{title}\n", style="bold yellow")
+            for label, _, unit in fields:
+                text.append(f"  {label:<11}")
+                text.append(f"{next(values):>8}", style="bold green")
+                text.append(f" {unit}\n", style="dim")
+        text.append("PUMPS\n", style="bold yellow")
+        for number, flow, on in pumps:
+            text.append(f"  Pump {number:<6}")
+            text.append(f"{flow:>8}", style="bold green")
+            text.append(" m³/h ", style="dim")
+            text.append("ON" if on else "OFF", style="green" if on else "red")
+            text.append("\n")
+        self.update(text)
+
+
+class AlertGrid(Widget):
+    """The alert annunciator, as many columns as fit; ``active`` is the
+    set of lit alerts"""
+
+    DEFAULT_CSS = """
+    AlertGrid {
+        height: auto;
+    }
+    """
+
+    NAMES = [name for row in ALERT_NAMES for name in row]
+    CELL = max(len(name) for name in NAMES) + 4  # lamp, name and a gap
+
+    active = reactive(frozenset())
+
+    def _columns(self, width):
+        return max(1, min(len(ALERT_NAMES[0]), width // self.CELL))
+
+    def get_content_height(self, container, viewport, width):
+        return -(-len(self.NAMES) // self._columns(width))
+
+    def render(self):
+        columns = self._columns(self.size.width)
+        text = Text()
+        for i, name in enumerate(self.NAMES):
+            lit = name in self.active
+            text.append("● " if lit else "○ ", style="bold red" if lit else "grey35")
+            text.append(name.ljust(self.CELL - 2), style="bold white" if lit else "grey50")
+            if i % columns == columns - 1:
+                text.append("\n")
+        return text
+
+
+def _append(log, lines):
+    # Follow the tail unless the operator scrolled up; the scroll waits
+    # for the new lines to be laid out, or a large burst stops short
+    follow = log.is_vertical_scroll_end
+    log.write_lines(lines, scroll_end=False)
+    if follow:
+        log.scroll_end(animate=False)
+
+
+class ReactorApp(App):
+    """Textual control station for one simulator"""
+
+    TITLE = "RBMK-1000 Reactor Control Station"
+    CSS = """
+    Screen { layout: horizontal; }
+    #left { width: 3fr; padding: 0 1; }
+    #right { width: 2fr; min-width: 50; padding: 0 1; }
+    #map-box { height: auto; max-height: 70%; overflow: auto auto; }
+    #map-title, .title { text-style: bold; color: $accent; }
+    #recommendation { color: orange; }
+    #arccs { height: 1fr; min-height: 5; border: round $primary; }
+    #console { height: 1fr; min-height: 6; border: round green; }
+    #status { height: auto; }
+    #alerts { height: auto; margin: 1 0; }
+    """
+    BINDINGS = [
+        Binding("f2", "acknowledge", "Acknowledge"),
+        Binding("f3", "map_mode", "Map mode"),
+        Binding("f8", "scram", "SCRAM"),
+        Binding("f5", "unit(-1)", "Prev unit", show=False),
+        Binding("f6", "unit(1)", "Next unit", show=False),
+        Binding("ctrl+q", "quit", "Quit"),
+    ]
+
+    def __init__(self, sim=None, clock=None, serve=None, serve_tcp=None, feed=None, feed_tcp=None, fleet=None):
+        super().__init__()
+        self.fleet = fleet  # Fleet whose units can be selected for display
+        if sim is None:
+            sim = fleet[0] if fleet is not None else ReactorSimulator()
+        self.sim = sim
+        self.clock = clock if clock is not None else SimClock()
+        self.endpoints = {"serve": (serve, serve_tcp), "feed": (feed, feed_tcp)}
+        self.services = []
+        self._dirty = True
+        self._pending_console = []
+        self._pending_arccs = []
+        self._texts = {}  # selector -> text last shown
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="left"):
+            yield Static(id="map-title")
+            with ScrollableContainer(id="map-box"):  # large layouts scroll
+                yield CoreMap(self.sim, id="map")
+            yield Static("ARCCS (Automated Reactor Computer Control System)", classes="title")
+            yield Static(id="recommendation")
+            yield Log(id="arccs", max_lines=500)
+        with Vertical(id="right"):
+            yield StatusPanel(self.sim, id="status")
+            yield AlertGrid(id="alerts")
+            yield Log(id="console", max_lines=2000)
+            yield Input(placeholder="command (help for a list)", id="command")
+        yield Footer()
+
+    async def on_mount(self):
+        # Remote commands and the feed share Textual's loop, as with 'serve'
+        sim = self.sim
+        for name, (path, port) in self.endpoints.items():
+            if path or port is not None:
+                if name == "serve":
+                    service = CommandServer(lambda commands: (run_commands(sim, commands), sim.sim_time))
+                else:
+                    service = TelemetryFeed(sim)
+                await service.start(path, port)
+                self.services.append(service)
+                self.log_console(f"{'Commands' if name == 'serve' else 'Telemetry feed'} on "
+                                 f"{', '.join(service.addresses)}")
+        self.sim.subscribe(self.on_sim_event)
+        self.set_interval(1 / REFRESH_HZ, self.redraw)
+        self.set_interval(max(self.clock.poll_interval(), 0.001), self.advance)
+        self.query_one("#command", Input).focus()
+        self.log_console("RBMK REACTOR CONTROL STATION - terminal")
+        self.log_console("Type 'start' to begin startup sequence, 'help' for commands")
+        if self.clock.mode != "realtime":
+            self.log_console(f"Simulation clock: {self.clock.describe()}")
+        if self.fleet is not None:
+            self.log_console(f"Fleet of {len(self.fleet)} units - F5/F6 or 'unit <n>' to switch")
+        self.log_arccs("ARCCS v2.3 initialized - automatic control STANDBY")
+        self.redraw()
+
+    async def on_unmount(self):
+        self.sim.unsubscribe(self.on_sim_event)
+        for service in self.services:
+            await service.close()
+
+    def advance(self):
+        self.clock.advance(self.fleet if self.fleet is not None else self.sim)
+
+    def select_unit(self, index):
+        """Display unit ``index`` (0-based, wrapping) of the fleet"""
+        unit = self.fleet[index % len(self.fleet)]
+        if unit is self.sim:
+            return
+        self.sim.unsubscribe(self.on_sim_event)
+        self.sim = unit
+        unit.subscribe(self.on_sim_event)
+        core_map = self.query_one(CoreMap)
+        core_map.sim = unit
+        core_map._codes = [None] * len(core_map.rows)  # repaint every row
+        self.query_one(StatusPanel).sim = unit
+        self.log_console(f"Displaying unit {self.fleet.units.index(unit) + 1} of {len(self.fleet)}")
+        self._dirty = True
+
+    def on_sim_event(self, event, payload):
+        if event in ("tick", "changed", "alarm_cleared", "alarm_acknowledged"):
+            self._dirty = True
+        elif event == "console":
+            self._pending_console.append(payload)
+        elif event == "arccs":
+            self._pending_arccs.append(payload)
+
+    def log_console(self, message):
+        self._pending_console.append(message)
+
+    def log_arccs(self, message):
+        self._pending_arccs.append(message)
+
+    def redraw(self):
+        # Logs are flushed in one write per frame, however many lines arrived
+        if self._pending_console:
+            _append(self.query_one("#console", Log), self._pending_console)
+            self._pending_console = []
+        if self._pending_arccs:
+            stamp = time.strftime("%H:%M:%S")
+            _append(self.query_one("#arccs", Log), [f"[{stamp}] {m}" for m in self._pending_arccs])
+            self._pending_arccs = []
+
+        # Flashing alarms animate even while the physics is idle
+        core_map = self.query_one(CoreMap)
+        core_map.update_cells()
+        if not self._dirty:
+            return
+        self._dirty = False
+        sim = self.sim
+        self.query_one(StatusPanel).update_readings()
+        self.query_one(AlertGrid).active = frozenset(name for name, on in sim.alerts.items() if on)
+        self._set_text("#recommendation", sim.arccs_recommendation)
+        title = f"CORE MAP  {MAP_MODES[core_map.mode][0]}  t={sim.sim_time:.0f}s"
+        if self.fleet is not None:
+            title += f"  unit {self.fleet.units.index(sim) + 1}/{len(self.fleet)}"
+        self._set_text("#map-title", title)
+
+    def _set_text(self, selector, text):
+        if self._texts.get(selector) != text:
+            self._texts[selector] = text
+            self.query_one(selector, Static).update(text)
+
+    def on_input_submitted(self, event):
+        command = event.value.strip()
+        event.input.value = ""
+        if not command:
+            return
+        self.log_console(f"> {command}")
+        if command == "help":
+            for line in HELP.splitlines():
+                self.log_console(line)
+            if self.fleet is not None:
+                self.log_console(FLEET_HELP)
+        elif command.split()[0] == "unit" and self.fleet is not None:
+            self._unit_command(command.split()[1:])
+        elif command in ("quit", "exit"):
+            self.exit()
+        else:
+            self.sim.execute(command)
+        self.redraw()
+
+    def _unit_command(self, args):
+        if not args:
+            for line in format_status(self.fleet.status()).splitlines():
+                self.log_console(line)
+        elif args[0].isdigit() and 1 <= int(args[0]) <= len(self.fleet):
+            self.select_unit(int(args[0]) - 1)
+        else:
+            self.log_console(f"ERROR: Unit must be 1-{len(self.fleet)}")
+
+    def action_unit(self, step):
+        if self.fleet is not None:
+            self.select_unit(self.fleet.units.index(self.sim) + step)
+
+    def action_acknowledge(self):
+        self.sim.acknowledge_alarms()
+
+    def action_scram(self):
+        self.sim.scram()
+
+    def action_map_mode(self):
+        core_map = self.query_one(CoreMap)
+        modes = list(MAP_MODES)
+        core_map.mode = modes[(modes.index(core_map.mode) + 1) % len(modes)]
+        self._dirty = True
+
+
+def run_tui(sim=None, clock=None, fleet=None, **endpoints):
+    ReactorApp(sim, clock, fleet=fleet, **endpoints).run()
@@ -0,0 +1,27 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+PROBE = """
+import json, sys, threading
+import helios_core.cli
+print(json.dumps({
+    "modules": [name for name in ("tkinter", "numpy", "textual") if name in sys.modules],
+    "threads": [thread.name for thread in threading.enumerate() if thread is not threading.main_thread()],
+}))
+"""
+
+
+def test_cli_import_stays_lazy():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run([sys.executable, "-c", PROBE], env=env, stdin=subprocess.DEVNULL,
+                            capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout)
+    # The utility subcommands must not pay for the GUI, NumPy or Textual
+    assert report["modules"] == []
+    # Nor start the GUI's stdin command reader
+    assert report["threads"] == []
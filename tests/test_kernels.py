@@ -0,0 +1,27 @@
+import pytest
+
+from helios_core.bench import synthetic_grid
+from helios_core.simulator import ReactorSimulator
+from helios_core.state import ReactorCoreState
+
+pytest.importorskip("numpy")
+
+
+def run(backend, grid, seed=7, steps=300):
+    sim = ReactorSimulator(ReactorCoreState.from_grid(grid), backend=backend, seed=seed)
+    sim.start()
+    for _ in range(steps):
+        sim.step()
+    return sim
+
+
+def test_backends_match_on_large_layout():
+    grid = synthetic_grid(47)
+    python, numpy = run("python", grid), run("numpy", grid)
+    assert python.kernel.name == "python" and numpy.kernel.name == "numpy"
+    assert bytes(python.core.flux) == bytes(numpy.core.flux)
+    assert bytes(python.core.fuel) == bytes(numpy.core.fuel)
+    assert bytes(python.core.alarm_bits) == bytes(numpy.core.alarm_bits)
+    for name in ("core_power", "pressure", "coolant_temp_avg", "radiation_level", "turbine_rpm", "integrity"):
+        assert getattr(python, name) == getattr(numpy, name), name
+    assert python.alerts == numpy.alerts
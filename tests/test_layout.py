@@ -0,0 +1,29 @@
+import pytest
+
+from helios_core.bench import synthetic_grid
+from helios_core.layout import LayoutError, compile_layout, parse_layout
+
+
+def brute_force(layout, rod_num, sensors, count):
+    r, c = layout.rod_to_pos[rod_num]
+    distances = []
+    for num in layout.sensors:
+        if num in sensors:
+            sr, sc = layout.rod_to_pos[num]
+            distances.append((((r - sr) ** 2 + (c - sc) ** 2) ** 0.5, num))
+    distances.sort(key=lambda x: x[0])
+    return distances[:count]
+
+
+@pytest.mark.parametrize("keep", [1, 2, 5, 13])
+def test_nearest_sensors_match_brute_force(keep):
+    layout = compile_layout(synthetic_grid(47))
+    sensors = set(layout.sensors[::keep])
+    for rod_num in layout.rod_to_pos:
+        assert layout.nearest_sensors(rod_num, sensors, 3) == brute_force(layout, rod_num, sensors, 3)
+
+
+@pytest.mark.parametrize("text", ["[]", '["FFF"]', '{"grid": "FFF"}', '{"grid": [1, 2]}'])
+def test_malformed_json_layout(text):
+    with pytest.raises(LayoutError):
+        parse_layout(text)
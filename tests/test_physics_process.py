@@ -0,0 +1,12 @@
+import pytest
+
+from helios_core.physics_process import PhysicsProcess, PhysicsProcessError
+
+
+def test_failed_child_startup_raises_physics_process_error(tmp_path):
+    missing = tmp_path / "missing.snap"
+    physics = PhysicsProcess(load=str(missing))
+    with pytest.raises(PhysicsProcessError, match="missing.snap") as info:
+        physics.start()
+    assert isinstance(info.value.__cause__, OSError)
+    assert not physics.alive
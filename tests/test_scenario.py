@@ -0,0 +1,40 @@
+import pytest
+
+from helios_core.scenario import ScenarioError, parse_scenario, run_scenario
+from helios_core.simulator import ReactorSimulator
+
+
+def test_events_after_end_are_rejected():
+    with pytest.raises(ScenarioError, match="line 3"):
+        parse_scenario("t=0 start\nt=10 end\nt=+5 status")
+
+
+def test_recorder_closed_when_run_fails(tmp_path, monkeypatch):
+    closed = []
+
+    class Recorder:
+        def __init__(self, *args):
+            pass
+
+        def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr("helios_core.scenario.TelemetryRecorder", Recorder)
+    monkeypatch.setattr("helios_core.simulator.ReactorSimulator.execute", lambda self, command: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        run_scenario(parse_scenario("t=0 start\nt=10 end"), record=tmp_path / "run.tm")
+    assert closed == [True]
+
+
+def test_load_keeps_scenario_time(tmp_path):
+    snap = tmp_path / "late.snap"
+    sim = ReactorSimulator(seed=1)
+    for _ in range(500):
+        sim.step()
+    sim.execute(f"save {snap}")
+
+    scenario = parse_scenario(f"t=0 status\nt=10 load {snap}\nt=20 pump 1 50\nt=30 end")
+    result = run_scenario(scenario)
+    assert result["passed"], result
+    assert result["sim_time"] == 520.0  # loaded at t=10, then 20 s more
+    assert result["sim_time"] - result["started_at"] == 30.0
@@ -0,0 +1,41 @@
+import socket
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from helios_core.server import _remove_stale_socket
+
+
+@pytest.fixture
+def short_dir():
+    # AF_UNIX paths are limited to ~100 bytes; pytest's tmp_path can be longer
+    with tempfile.TemporaryDirectory(dir="/tmp") as path:
+        yield Path(path)
+
+
+def test_regular_file_is_not_removed(short_dir):
+    path = short_dir / "not-a-socket"
+    path.write_text("keep me")
+    with pytest.raises(OSError, match="not a socket"):
+        _remove_stale_socket(str(path))
+    assert path.read_text() == "keep me"
+
+
+def test_stale_socket_is_removed(short_dir):
+    path = short_dir / "stale.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.close()  # gone without unlinking its socket file
+    _remove_stale_socket(str(path))
+    assert not path.exists()
+
+
+def test_live_socket_is_kept(short_dir):
+    path = short_dir / "live.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(path))
+        listener.listen()
+        with pytest.raises(OSError, match="another server"):
+            _remove_stale_socket(str(path))
+    assert path.exists()